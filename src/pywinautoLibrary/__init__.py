@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 from datetime import timedelta
 from typing import Optional, List, Union
 
 from robot.api import logger
 from robot.errors import DataError
-from robot.libraries.BuiltIn import BuiltIn
+from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 from robot.utils.importer import Importer
 
 from .base import LibraryComponent
@@ -32,13 +33,26 @@ from .keywords import (
     ScreenshotKeywords,
     ApplicationCache,
 )
-from .locators import ElementFinder
+from .locators import (
+    HINTS_FILE,
+    ElementFinder,
+    LocatorHints,
+    parse_search_depth,
+    parse_search_order,
+)
+from .waits import create_event_source, create_window_event_source
 from .utils import (
     LibraryListener, 
     is_truthy, 
     _convert_timeout, 
     _convert_delay,
-    DynamicCore
+    DynamicCore,
+    LazyLibrary,
+    WAIT_STATISTICS_FILE,
+    keyword_registry,
+    public_methods,
+    WaitStatistics,
+    create_poll_scheduler,
 )
 
 
@@ -58,26 +72,109 @@ class pywinautoLibrary(DynamicCore):
         run_on_failure="Capture Screenshot",
         screenshot_root_directory: Optional[str] = None,
         plugins: Optional[str] = None,
+        element_cache: bool = True,
+        search_depth: Optional[int] = 1,
+        search_order: str = "breadth_first",
+        poll_strategy: str = "backoff",
+        poll_interval=timedelta(milliseconds=100),
+        event_waits: bool = True,
+        fuzzy_threshold: float = 0.5,
+        window_cache_ttl=timedelta(milliseconds=250),
+        probe_timeout=timedelta(0),
+        locator_hints: Union[bool, str] = True,
+        wait_statistics: Union[bool, str] = True,
     ):
         """PywinautoLibrary can be imported with several optional arguments.
+
+        - ``plugins``: Comma separated plugin classes extending the library,
+          each optionally followed by ``;`` and its ``:`` separated
+          arguments. Plugin classes are imported when the library is
+          imported, but created only when one of their keywords is first
+          run. An error in the constructor of a plugin is therefore
+          reported by that keyword, as a ``PluginError`` naming the plugin.
+
+        - ``element_cache``: Reuse elements resolved earlier in the same
+          window when they still exist. Set to ``False`` to always search
+          the control tree from scratch.
+        - ``search_depth``: How many levels below the window locators are
+          searched. ``1`` searches only direct children, ``None`` or ``0``
+          searches the whole subtree.
+        - ``search_order``: ``breadth_first`` or ``depth_first`` order of
+          the descendant search.
+        - ``poll_strategy``: How often elements and conditions are checked
+          while waiting. ``backoff`` retries after 5 ms and doubles the
+          interval up to ``poll_interval``, ``fixed`` always waits
+          ``poll_interval``. Can be changed later with `Set Poll Strategy`.
+        - ``poll_interval``: Fixed interval, or the longest backoff
+          interval, between checks.
+        - ``event_waits``: Re-check wait conditions when the application
+          reports a change in the window, instead of polling. Only
+          available with the UIA backend, other backends always poll.
+        - ``fuzzy_threshold``: Lowest similarity, from 0 to 1, of element
+          names matched by ``fuzzy:`` locators.
+        - ``window_cache_ttl``: How long the list of top-level windows
+          used by ``title:`` and ``class:`` locators is reused. With the
+          UIA backend and ``event_waits`` enabled, the list is also
+          refreshed when a window opens or closes. ``0`` disables caching.
+        - ``probe_timeout``: How long negative checks such as
+          `Is Window Open` look for an element that should not be there.
+          By default they check once, without waiting for ``timeout``.
+        - ``locator_hints``: Remember where in the window each locator was
+          found and try that place first on the next run, checking a
+          single property before falling back to a full search. Hints are
+          stored in ``pywinauto-locator-hints.json`` in the output
+          directory, or in the file given as the value. ``False``
+          disables hints.
+        - ``wait_statistics``: Record how many times and how long each
+          locator and wait condition was checked, how long was spent
+          sleeping between the checks and how many waits timed out, per
+          test, per suite and for the whole run. The statistics are
+          available with `Get Wait Statistics` and written at the end of
+          the run to ``pywinauto-wait-statistics.json`` in the output
+          directory, or to the file given as the value. ``False``
+          disables recording.
         """
         self.timeout = _convert_timeout(timeout)
+        self.probe_timeout = _convert_timeout(probe_timeout)
+        self.poll_scheduler = create_poll_scheduler(poll_strategy, _convert_timeout(poll_interval))
+        self.event_source_factory = create_event_source if is_truthy(event_waits) else None
         self.run_on_failure_keyword = run_on_failure
         self._running_on_failure_keyword = False
         self.screenshot_root_directory = screenshot_root_directory
         self._resolve_screenshot_root_directory()
-        self._element_finder = ElementFinder(self)
+        self.locator_hints = self._create_locator_hints(locator_hints)
+        self.wait_statistics = self._create_wait_statistics(wait_statistics)
+        self._element_finder = ElementFinder(
+            self,
+            element_cache=is_truthy(element_cache),
+            search_depth=parse_search_depth(search_depth),
+            search_order=parse_search_order(search_order),
+            fuzzy_threshold=float(fuzzy_threshold),
+            window_cache_ttl=_convert_timeout(window_cache_ttl),
+            window_events=create_window_event_source if is_truthy(event_waits) else None,
+            hints=self.locator_hints,
+            statistics=self.wait_statistics,
+        )
         self._plugin_keywords = []
+        # Components and plugins are created when their first keyword runs
         libraries = [
-            ApplicationManagementKeywords(self),
-            WindowManagementKeywords(self),
-            ControlElementKeywords(self),
-            MouseKeywords(self),
-            KeyboardKeywords(self),
-            WaitingKeywords(self),
-            ScreenshotKeywords(self),
+            LazyLibrary(component, self)
+            for component in (
+                ApplicationManagementKeywords,
+                WindowManagementKeywords,
+                ControlElementKeywords,
+                MouseKeywords,
+                KeyboardKeywords,
+                WaitingKeywords,
+                ScreenshotKeywords,
+            )
         ]
         self.ROBOT_LIBRARY_LISTENER = LibraryListener()
+        if self.locator_hints is not None:
+            self.ROBOT_LIBRARY_LISTENER.add_close_listener(self.locator_hints.save)
+        if self.wait_statistics is not None:
+            self.ROBOT_LIBRARY_LISTENER.add_scope_listener(self.wait_statistics)
+            self.ROBOT_LIBRARY_LISTENER.add_close_listener(self.wait_statistics.save)
         self._running_keyword = None
         self._plugins = []
         if is_truthy(plugins):
@@ -85,6 +182,7 @@ class pywinautoLibrary(DynamicCore):
             self._plugins = plugin_libs
             libraries = libraries + plugin_libs
         self._apps = ApplicationCache()
+        self._apps.add_listener(self._element_finder.invalidate)
         DynamicCore.__init__(self, libraries)
 
     @property
@@ -130,8 +228,46 @@ class pywinautoLibrary(DynamicCore):
             return
         # No special handling needed for now
 
+    def _create_locator_hints(self, locator_hints) -> Optional[LocatorHints]:
+        """Create the locator hint store from the ``locator_hints`` argument.
+        """
+        if not is_truthy(locator_hints):
+            return None
+        if isinstance(locator_hints, str) and locator_hints.upper() != "TRUE":
+            return LocatorHints(locator_hints)
+        return LocatorHints(self._default_locator_hints_path)
+
+    def _default_locator_hints_path(self) -> str:
+        """Path of the locator hint store in the output directory.
+        """
+        return os.path.join(self._output_dir(), HINTS_FILE)
+
+    def _create_wait_statistics(self, wait_statistics) -> Optional[WaitStatistics]:
+        """Create the wait statistics from the ``wait_statistics`` argument.
+        """
+        if not is_truthy(wait_statistics):
+            return None
+        if isinstance(wait_statistics, str) and wait_statistics.upper() != "TRUE":
+            return WaitStatistics(wait_statistics)
+        return WaitStatistics(lambda: os.path.join(self._output_dir(), WAIT_STATISTICS_FILE))
+
+    def _output_dir(self) -> str:
+        """Robot Framework output directory, or the current directory.
+        """
+        try:
+            output_dir = BuiltIn().get_variable_value("${OUTPUT DIR}")
+        except RobotNotRunningError:
+            output_dir = None
+        return output_dir or os.getcwd()
+
     def _parse_plugins(self, plugins):
-        """Parse plugin configuration and return plugin instances.
+        """Parse plugin configuration and import the plugin classes.
+
+        Plugins are created when one of their keywords is first run, and
+        errors creating them are raised then as `PluginError`. Keywords of
+        plugins are methods marked with the `keyword` decorator.
+        Plugins without any are warned about, and their public methods are
+        used instead, except those of `LibraryComponent`.
         """
         libraries = []
         importer = Importer("test library")
@@ -142,8 +278,29 @@ class pywinautoLibrary(DynamicCore):
             plugin_args = plugin_and_args[1].split(":") if len(plugin_and_args) > 1 else []
             try:
                 plugin_class = importer.import_class_or_module(plugin_name)
-                plugin_instance = plugin_class(self, *plugin_args)
-                libraries.append(plugin_instance)
             except Exception as e:
                 raise PluginError(f"Failed to import plugin '{plugin_name}': {e}")
+            if not isinstance(plugin_class, type):
+                raise PluginError(f"Plugin '{plugin_name}' is not a class.")
+            library = LazyLibrary(
+                plugin_class, self, *plugin_args, on_error=self._plugin_error(plugin_name)
+            )
+            keywords = keyword_registry(plugin_class)
+            if keywords.keys() <= keyword_registry(LibraryComponent).keys():
+                logger.warn(
+                    f"Plugin '{plugin_name}' has no methods marked with the @keyword decorator, "
+                    f"using its public methods as keywords. Mark the keywords with @keyword, "
+                    f"as this fallback will be removed in a future release."
+                )
+                library.keywords = {**keywords, **public_methods(plugin_class, LibraryComponent)}
+            libraries.append(library)
         return libraries
+
+    @staticmethod
+    def _plugin_error(plugin_name: str):
+        """Get a callable converting errors creating a plugin to `PluginError`.
+        """
+        def error(err: Exception) -> PluginError:
+            return PluginError(f"Failed to create plugin '{plugin_name}': {err}")
+
+        return error
@@ -14,5 +14,6 @@
 
 from .context import ContextAware
 from .librarycomponent import LibraryComponent
+from ..utils import keyword
 
-__all__ = ["ContextAware", "LibraryComponent"]
+__all__ = ["ContextAware", "LibraryComponent", "keyword"]
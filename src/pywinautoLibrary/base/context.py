@@ -11,7 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Type
+
+from pywinautoLibrary.waits import Condition, Wait
 
 
 class ContextAware:
@@ -90,6 +92,35 @@ class ContextAware:
         """
         return self.element_finder.find(locator, control_type, True, required, parent, timeout)
 
+    def probe_element(
+        self,
+        locator: str,
+        control_type: Optional[str] = None,
+        parent: Any = None,
+    ) -> Any:
+        """Find element matching `locator` without waiting for it to appear.
+
+        Meant for negative checks, which would otherwise wait for the whole
+        timeout whenever the element is, as expected, missing. The element
+        is searched once, or until the `probe_timeout` given when importing
+        the library expires if that is not zero.
+
+        :param locator: Locator to use when searching the element.
+            See library documentation for the supported locator syntax.
+        :type locator: str
+        :param control_type: Limit searching only to these control types.
+        :type control_type: str
+        :param parent: Optional parent element to search child elements
+            from. By default, search starts from the root window.
+        :type parent: Any
+        :return: Found element or `None` if element not found.
+        :rtype: Any
+        """
+        timeout = self.ctx.probe_timeout
+        if not timeout:
+            return self.element_finder.probe(locator, control_type, parent)
+        return self.element_finder.find(locator, control_type, True, False, parent, timeout)
+
     def find_elements(
         self,
         locator: str,
@@ -110,3 +141,43 @@ class ContextAware:
         :rtype: list
         """
         return self.element_finder.find(locator, control_type, False, False, parent)
+
+    def wait_until(
+        self,
+        condition: Condition,
+        timeout: Optional[float] = None,
+        error: Optional[Type[Exception]] = None,
+        events: bool = True,
+    ) -> Any:
+        """Wait until `condition` holds.
+
+        The condition is checked without nested waiting, so the wait never
+        takes longer than `timeout`. When the backend provides change
+        notifications, the condition is re-checked when the window changes
+        instead of on every poll.
+
+        :param condition: Condition to wait for.
+        :type condition: pywinautoLibrary.waits.Condition
+        :param timeout: Timeout in seconds. If None, use the default timeout.
+        :type timeout: float
+        :param error: Error to raise on timeout instead of the error of the
+            condition.
+        :type error: type
+        :param events: Use change notifications if available. When false,
+            the condition is polled, e.g. because it also depends on time.
+        :type events: bool
+        :return: The true value returned by the condition, such as the
+            element it holds for.
+        :rtype: Any
+        :raises Exception: The error of the condition, or `error`, if the
+            condition does not hold within the timeout.
+        """
+        if timeout is None:
+            timeout = self.ctx.timeout
+        finder = self.element_finder
+        factory = self.ctx.event_source_factory if events else None
+        window_factory = finder.window_cache.event_source_factory if events else None
+        wait = Wait(
+            finder, self.ctx.poll_scheduler, factory, window_factory, statistics=finder.statistics
+        )
+        return wait.until(condition, timeout, error)
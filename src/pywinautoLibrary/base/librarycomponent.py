@@ -20,7 +20,7 @@ from robot.api import logger
 from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 
 from .context import ContextAware
-from ..utils import is_noney, _convert_timeout
+from ..utils import is_noney, keyword, _convert_timeout
 
 
 class LibraryComponent(ContextAware):
@@ -67,6 +67,7 @@ class LibraryComponent(ContextAware):
         """
         logger.warn(msg, html)
 
+    @keyword
     def assert_window_contains(
         self,
         locator: str,
@@ -95,6 +96,7 @@ class LibraryComponent(ContextAware):
             raise AssertionError(message)
         logger.info(f"Current window contains {control_message} '{locator}'.")
 
+    @keyword
     def assert_window_not_contains(
         self,
         locator: str,
@@ -104,6 +106,8 @@ class LibraryComponent(ContextAware):
     ):
         """Assert that current window does not contain the given element.
 
+        The element is not waited for, see `probe_element`.
+
         :param locator: Locator of the element to check.
         :type locator: str
         :param control_type: Type of the control to check.
@@ -115,7 +119,7 @@ class LibraryComponent(ContextAware):
         :raises AssertionError: If the element is found.
         """
         control_message = control_type or "element"
-        if self.find_element(locator, control_type, required=False):
+        if self.probe_element(locator, control_type):
             if message is None:
                 message = f"Window should not have contained {control_message} '{locator}'."
             raise AssertionError(message)
@@ -51,3 +51,23 @@ class NoOpenApplication(PywinautoLibraryError):
 class PluginError(PywinautoLibraryError):
     """Raised when there is an error with a plugin."""
     pass
+
+
+class InvalidLocator(PywinautoLibraryError):
+    """Raised when a locator cannot be parsed."""
+    pass
+
+
+class WaitTimeout(PywinautoLibraryError):
+    """Raised when a wait condition does not hold within the timeout."""
+    pass
+
+
+class MissingDependency(PywinautoLibraryError):
+    """Raised when an optional module a keyword needs is not installed."""
+    pass
+
+
+class KeywordConflict(PywinautoLibraryError):
+    """Raised when two libraries or plugins implement the same keyword."""
+    pass
@@ -28,6 +28,28 @@ class ApplicationCache:
         """
         self._apps = {}
         self._current = None
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """Register a callable notified when the current application changes.
+
+        The listener is called with the alias of the new current application,
+        or None when no application is open.
+
+        :param listener: Callable taking the new current alias.
+        :type listener: callable
+        """
+        self._listeners.append(listener)
+
+    def _set_current(self, alias):
+        """Set the current application and notify the listeners.
+
+        :param alias: Alias of the new current application.
+        :type alias: str or None
+        """
+        self._current = alias
+        for listener in self._listeners:
+            listener(alias)
 
     def register(self, app, alias=None):
         """Register a new application instance.
@@ -43,7 +65,7 @@ class ApplicationCache:
             alias = str(len(self._apps) + 1)
         self._apps[alias] = app
         if self._current is None:
-            self._current = alias
+            self._set_current(alias)
         return alias
 
     def switch(self, alias):
@@ -55,7 +77,7 @@ class ApplicationCache:
         """
         if alias not in self._apps:
             raise KeyError(f"Application with alias '{alias}' not found.")
-        self._current = alias
+        self._set_current(alias)
 
     def close(self, alias=None):
         """Close an application instance.
@@ -76,7 +98,7 @@ class ApplicationCache:
             pass
         del self._apps[alias]
         if self._current == alias:
-            self._current = next(iter(self._apps.keys()), None)
+            self._set_current(next(iter(self._apps.keys()), None))
 
     def close_all(self):
         """Close all registered application instances.
@@ -86,7 +108,7 @@ class ApplicationCache:
         for alias in list(self._apps.keys()):
             self.close(alias)
         self._apps.clear()
-        self._current = None
+        self._set_current(None)
 
     @property
     def current(self):
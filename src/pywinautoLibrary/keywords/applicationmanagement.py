@@ -14,9 +14,7 @@
 
 from typing import Optional
 
-from pywinauto.application import Application
-
-from pywinautoLibrary.base import LibraryComponent
+from pywinautoLibrary.base import LibraryComponent, keyword
 from pywinautoLibrary.errors import ApplicationNotFound
 
 
@@ -26,6 +24,7 @@ class ApplicationManagementKeywords(LibraryComponent):
     This class contains keywords for opening, closing, and managing Windows applications.
     """
 
+    @keyword
     def open_application(self, path: str, alias: Optional[str] = None) -> str:
         """Open a new application instance.
 
@@ -37,9 +36,11 @@ class ApplicationManagementKeywords(LibraryComponent):
         :rtype: str
         """
         self.info(f"Opening application: {path}")
+        from pywinauto.application import Application
         app = Application(backend='uia').start(path)
         return self.ctx._apps.register(app, alias)
 
+    @keyword
     def close_application(self, alias: Optional[str] = None) -> None:
         """Close an application instance.
 
@@ -50,12 +51,14 @@ class ApplicationManagementKeywords(LibraryComponent):
         self.info(f"Closing application: {alias or 'current'}")
         self.ctx._apps.close(alias)
 
+    @keyword
     def close_all_applications(self) -> None:
         """Close all open application instances.
         """
         self.info("Closing all applications")
         self.ctx._apps.close_all()
 
+    @keyword
     def switch_application(self, alias: str) -> None:
         """Switch to a different application instance.
 
@@ -69,6 +72,7 @@ class ApplicationManagementKeywords(LibraryComponent):
         except KeyError:
             raise ApplicationNotFound(f"Application with alias '{alias}' not found.")
 
+    @keyword
     def connect_to_application(
         self, process_id: Optional[int] = None,
         path: Optional[str] = None,
@@ -107,9 +111,11 @@ class ApplicationManagementKeywords(LibraryComponent):
         else:
             raise ValueError("At least one of process_id, path, title, or class_name must be provided.")
         
+        from pywinauto.application import Application
         app = Application(backend='uia').connect(**kwargs)
         return self.ctx._apps.register(app, alias)
 
+    @keyword
     def get_current_process_id(self) -> int:
         """Get the process ID of the current active application.
 
@@ -120,6 +126,7 @@ class ApplicationManagementKeywords(LibraryComponent):
         self.info("Getting current process ID")
         return self.ctx.app.process
 
+    @keyword
     def is_application_open(self, alias: str) -> bool:
         """Check if an application instance is open.
 
@@ -130,6 +137,7 @@ class ApplicationManagementKeywords(LibraryComponent):
         """
         return alias in self.ctx._apps
 
+    @keyword
     def get_current_application_alias(self) -> Optional[str]:
         """Get the alias of the current application instance.
 
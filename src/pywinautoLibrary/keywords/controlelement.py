@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, List
+from datetime import timedelta
+from typing import Dict, List, Optional, Union
 
-from pywinautoLibrary.base import LibraryComponent
+from pywinautoLibrary.base import LibraryComponent, keyword
 from pywinautoLibrary.errors import ElementNotFound, ElementNotEnabled
+from pywinautoLibrary.waits import ElementEnabled, ElementExists, ElementVisible
 
 
 class ControlElementKeywords(LibraryComponent):
@@ -25,6 +27,7 @@ class ControlElementKeywords(LibraryComponent):
     such as buttons, edit boxes, list boxes, etc.
     """
 
+    @keyword
     def click_element(self, locator: str) -> None:
         """Click on an element matching the given locator.
 
@@ -39,6 +42,7 @@ class ControlElementKeywords(LibraryComponent):
             raise ElementNotEnabled(f"Element with locator '{locator}' is not enabled.")
         element.click()
 
+    @keyword
     def double_click_element(self, locator: str) -> None:
         """Double click on an element matching the given locator.
 
@@ -53,6 +57,7 @@ class ControlElementKeywords(LibraryComponent):
             raise ElementNotEnabled(f"Element with locator '{locator}' is not enabled.")
         element.double_click()
 
+    @keyword
     def right_click_element(self, locator: str) -> None:
         """Right click on an element matching the given locator.
 
@@ -64,6 +69,7 @@ class ControlElementKeywords(LibraryComponent):
         element = self.find_element(locator)
         element.right_click()
 
+    @keyword
     def get_element_text(self, locator: str) -> str:
         """Get the text of an element matching the given locator.
 
@@ -77,6 +83,7 @@ class ControlElementKeywords(LibraryComponent):
         element = self.find_element(locator)
         return element.window_text()
 
+    @keyword
     def set_element_text(self, locator: str, text: str) -> None:
         """Set the text of an element matching the given locator.
 
@@ -93,6 +100,7 @@ class ControlElementKeywords(LibraryComponent):
             raise ElementNotEnabled(f"Element with locator '{locator}' is not enabled.")
         element.set_text(text)
 
+    @keyword
     def clear_element_text(self, locator: str) -> None:
         """Clear the text of an element matching the given locator.
 
@@ -107,6 +115,7 @@ class ControlElementKeywords(LibraryComponent):
             raise ElementNotEnabled(f"Element with locator '{locator}' is not enabled.")
         element.set_text('')
 
+    @keyword
     def type_into_element(self, locator: str, text: str) -> None:
         """Type text into an element matching the given locator.
 
@@ -125,6 +134,7 @@ class ControlElementKeywords(LibraryComponent):
             raise ElementNotEnabled(f"Element with locator '{locator}' is not enabled.")
         element.type_keys(text)
 
+    @keyword
     def is_element_enabled(self, locator: str) -> bool:
         """Check if an element matching the given locator is enabled.
 
@@ -138,6 +148,7 @@ class ControlElementKeywords(LibraryComponent):
         element = self.find_element(locator)
         return element.is_enabled()
 
+    @keyword
     def is_element_visible(self, locator: str) -> bool:
         """Check if an element matching the given locator is visible.
 
@@ -151,6 +162,7 @@ class ControlElementKeywords(LibraryComponent):
         element = self.find_element(locator)
         return element.is_visible()
 
+    @keyword
     def get_element_attribute(self, locator: str, attribute: str) -> str:
         """Get the value of an attribute from an element matching the given locator.
 
@@ -166,45 +178,152 @@ class ControlElementKeywords(LibraryComponent):
         element = self.find_element(locator)
         return element.get_attribute(attribute)
 
-    def wait_for_element(self, locator: str, timeout: Optional[float] = None) -> None:
+    @keyword
+    def wait_for_element(self, locator: str, timeout: Optional[timedelta] = None) -> None:
         """Wait for an element matching the given locator to appear.
 
         :param locator: Locator of the element to wait for.
         :type locator: str
         :param timeout: Timeout in seconds to wait for the element. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
         :raises pywinautoLibrary.errors.ElementNotFound: If the element is not found within the timeout.
         """
         self.info(f"Waiting for element: {locator}")
-        self.find_element(locator, timeout=timeout)
+        self.wait_until(ElementExists(locator), self.get_timeout(timeout))
 
-    def wait_for_element_enabled(self, locator: str, timeout: Optional[float] = None) -> None:
+    @keyword
+    def wait_for_element_enabled(self, locator: str, timeout: Optional[timedelta] = None) -> None:
         """Wait for an element matching the given locator to be enabled.
 
         :param locator: Locator of the element to wait for.
         :type locator: str
         :param timeout: Timeout in seconds to wait for the element. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
         :raises pywinautoLibrary.errors.ElementNotFound: If the element is not found within the timeout.
         :raises pywinautoLibrary.errors.ElementNotEnabled: If the element is not enabled within the timeout.
         """
         self.info(f"Waiting for element to be enabled: {locator}")
-        element = self.find_element(locator, timeout=timeout)
-        if not element.is_enabled():
-            raise ElementNotEnabled(f"Element with locator '{locator}' is not enabled within timeout.")
+        self.wait_until(ElementEnabled(locator), self.get_timeout(timeout))
 
-    def wait_for_element_visible(self, locator: str, timeout: Optional[float] = None) -> None:
+    @keyword
+    def wait_for_element_visible(self, locator: str, timeout: Optional[timedelta] = None) -> None:
         """Wait for an element matching the given locator to be visible.
 
         :param locator: Locator of the element to wait for.
         :type locator: str
         :param timeout: Timeout in seconds to wait for the element. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
         :raises pywinautoLibrary.errors.ElementNotFound: If the element is not found within the timeout.
         :raises pywinautoLibrary.errors.ElementNotVisible: If the element is not visible within the timeout.
         """
         self.info(f"Waiting for element to be visible: {locator}")
-        element = self.find_element(locator, timeout=timeout)
-        if not element.is_visible():
-            from pywinautoLibrary.errors import ElementNotVisible
-            raise ElementNotVisible(f"Element with locator '{locator}' is not visible within timeout.")
+        self.wait_until(ElementVisible(locator), self.get_timeout(timeout))
+
+    @keyword
+    def find_elements_by_locators(
+        self,
+        locators: Union[List[str], Dict[str, str]],
+        control_type: Optional[str] = None,
+        timeout: Optional[timedelta] = None,
+        required: bool = False,
+    ) -> dict:
+        """Find the elements of several locators at once.
+
+        Resolves a whole form in one traversal of the window instead of one
+        traversal per locator, which is much faster than finding the fields
+        one after another. All locators share the same `timeout`.
+
+        :param locators: List of locators, or a dictionary mapping names to
+            locators.
+        :type locators: list or dict
+        :param control_type: Limit searching only to this control type.
+        :type control_type: str
+        :param timeout: Timeout in seconds to wait for all elements. If None,
+            use the default timeout.
+        :type timeout: timedelta
+        :param required: Fail if any of the elements is not found.
+        :type required: bool
+        :return: Dictionary mapping each locator, or name, to its element.
+            Elements not found are None.
+        :rtype: dict
+        :raises pywinautoLibrary.errors.ElementNotFound: If an element is not
+            found and `required` is true.
+        """
+        found = self.element_finder.find_many(
+            locators, control_type, required, timeout=self.get_timeout(timeout)
+        )
+        missing = [name for name, element in found.items() if element is None]
+        if missing:
+            self.info(f"Elements not found: {', '.join(missing)}")
+        self.info(f"Found {len(found) - len(missing)} of {len(found)} elements.")
+        return found
+
+    @keyword
+    def get_locator_cache_statistics(self) -> dict:
+        """Get statistics of the compiled locator cache.
+
+        Locators are parsed once and cached, so repeated lookups with the
+        same locator string only pay for the search itself.
+
+        :return: Dictionary with `hits`, `misses`, `size` and `maxsize` of the cache.
+        :rtype: dict
+        """
+        statistics = self.element_finder.locator_cache.statistics
+        self.info(f"Locator cache statistics: {statistics}")
+        return statistics
+
+    @keyword
+    def get_element_cache_statistics(self) -> dict:
+        """Get statistics of the resolved element cache.
+
+        Elements resolved in the current window are reused by later keywords
+        using the same locator as long as they still exist. The cache is
+        cleared when the window changes or the application is switched or
+        closed.
+
+        :return: Dictionary with `enabled`, `hits`, `misses`, `stale`,
+            `invalidations`, `size` and `hit_rate` of the cache.
+        :rtype: dict
+        """
+        statistics = self.element_finder.element_cache.statistics
+        self.info(f"Element cache statistics: {statistics}")
+        return statistics
+
+    @keyword
+    def take_ui_snapshot(self, locator: Optional[str] = None, properties: Optional[str] = None) -> int:
+        """Capture the control tree and search it until `Release UI Snapshot`.
+
+        The whole subtree is captured at once with the given properties. With
+        the UIA backend this takes a single request to the application, after
+        which locators, waits and checks such as `Is Element Enabled` are
+        evaluated against the snapshot without further requests. Actions such
+        as `Click Element` still operate on the live elements.
+
+        The snapshot is not updated by actions. Waits and lookups that have to
+        retry take a new snapshot on every retry.
+
+        :param locator: Locator of the element whose subtree to capture. If
+            None, capture the current window.
+        :type locator: str
+        :param properties: Comma separated properties to capture, e.g.
+            `name, automation_id, control_type`. If None, capture all
+            properties used by the locator strategies.
+        :type properties: str
+        :return: Number of captured elements.
+        :rtype: int
+        :raises pywinautoLibrary.errors.ElementNotFound: If the element is not found.
+        """
+        root = self.find_element(locator) if locator else None
+        snapshot = self.element_finder.take_snapshot(root, properties)
+        self.info(f"Took UI snapshot of {len(snapshot)} elements.")
+        return len(snapshot)
+
+    @keyword
+    def release_ui_snapshot(self) -> None:
+        """Search the live application again after `Take UI Snapshot`.
+
+        Does nothing if no snapshot is active. Snapshots are also released
+        when the application is switched or closed.
+        """
+        if self.element_finder.release_snapshot() is not None:
+            self.info("Released UI snapshot.")
@@ -14,7 +14,7 @@
 
 from typing import Optional, List
 
-from pywinautoLibrary.base import LibraryComponent
+from pywinautoLibrary.base import LibraryComponent, keyword
 
 
 class KeyboardKeywords(LibraryComponent):
@@ -24,6 +24,7 @@ class KeyboardKeywords(LibraryComponent):
     such as typing text, pressing keys, etc.
     """
 
+    @keyword
     def type_text(self, text: str, delay: float = 0.0) -> None:
         """Type the given text.
 
@@ -36,6 +37,7 @@ class KeyboardKeywords(LibraryComponent):
         from pywinauto.keyboard import type_keys
         type_keys(text, with_spaces=True, pause=delay)
 
+    @keyword
     def press_keys(self, keys: str, delay: float = 0.0) -> None:
         """Press the given keys.
 
@@ -48,6 +50,7 @@ class KeyboardKeywords(LibraryComponent):
         from pywinauto.keyboard import send_keys
         send_keys(keys, pause=delay)
 
+    @keyword
     def press_key_combination(self, *keys: str) -> None:
         """Press a combination of keys.
 
@@ -59,6 +62,7 @@ class KeyboardKeywords(LibraryComponent):
         key_combination = '+'.join(keys)
         send_keys(key_combination)
 
+    @keyword
     def press_and_release_key(self, key: str, delay: float = 0.0) -> None:
         """Press and release a key.
 
@@ -71,6 +75,7 @@ class KeyboardKeywords(LibraryComponent):
         from pywinauto.keyboard import send_keys
         send_keys(f"{{{key} down}}{delay}{{{key} up}}")
 
+    @keyword
     def type_text_into_element(self, locator: str, text: str, delay: float = 0.0) -> None:
         """Type text into an element matching the given locator.
 
@@ -85,6 +90,7 @@ class KeyboardKeywords(LibraryComponent):
         element = self.find_element(locator)
         element.type_keys(text, with_spaces=True, pause=delay)
 
+    @keyword
     def press_keys_into_element(self, locator: str, keys: str, delay: float = 0.0) -> None:
         """Press keys into an element matching the given locator.
 
@@ -14,7 +14,7 @@
 
 from typing import Optional
 
-from pywinautoLibrary.base import LibraryComponent
+from pywinautoLibrary.base import LibraryComponent, keyword
 
 
 class MouseKeywords(LibraryComponent):
@@ -24,6 +24,7 @@ class MouseKeywords(LibraryComponent):
     such as moving the mouse, clicking, dragging, etc.
     """
 
+    @keyword
     def move_mouse_to_element(self, locator: str, x_offset: int = 0, y_offset: int = 0) -> None:
         """Move the mouse cursor to an element matching the given locator.
 
@@ -38,6 +39,7 @@ class MouseKeywords(LibraryComponent):
         element = self.find_element(locator)
         element.move_mouse_input(coords=(x_offset, y_offset))
 
+    @keyword
     def move_mouse_to_coordinates(self, x: int, y: int) -> None:
         """Move the mouse cursor to the given coordinates.
 
@@ -50,6 +52,7 @@ class MouseKeywords(LibraryComponent):
         from pywinauto.mouse import move
         move((x, y))
 
+    @keyword
     def click_mouse_button(self, button: str = "left", clicks: int = 1, delay: float = 0.0) -> None:
         """Click the mouse button.
 
@@ -64,6 +67,7 @@ class MouseKeywords(LibraryComponent):
         from pywinauto.mouse import click
         click(button=button, clicks=clicks, interval=delay)
 
+    @keyword
     def click_mouse_at_coordinates(self, x: int, y: int, button: str = "left", clicks: int = 1, delay: float = 0.0) -> None:
         """Click the mouse button at the given coordinates.
 
@@ -82,6 +86,7 @@ class MouseKeywords(LibraryComponent):
         from pywinauto.mouse import click
         click(button=button, coords=(x, y), clicks=clicks, interval=delay)
 
+    @keyword
     def drag_and_drop(self, source_locator: str, target_locator: str) -> None:
         """Drag an element from source to target.
 
@@ -95,6 +100,7 @@ class MouseKeywords(LibraryComponent):
         target = self.find_element(target_locator)
         source.drag_mouse_input(dst=target)
 
+    @keyword
     def drag_and_drop_by_offset(self, locator: str, x_offset: int, y_offset: int) -> None:
         """Drag an element by the given offset.
 
@@ -109,6 +115,7 @@ class MouseKeywords(LibraryComponent):
         element = self.find_element(locator)
         element.drag_mouse_input(dst=(x_offset, y_offset))
 
+    @keyword
     def scroll_mouse_wheel(self, locator: str, clicks: int = 1) -> None:
         """Scroll the mouse wheel over an element.
 
@@ -121,6 +128,7 @@ class MouseKeywords(LibraryComponent):
         element = self.find_element(locator)
         element.wheel_mouse_input(delta=clicks)
 
+    @keyword
     def scroll_mouse_wheel_at_coordinates(self, x: int, y: int, clicks: int = 1) -> None:
         """Scroll the mouse wheel at the given coordinates.
 
@@ -18,7 +18,7 @@ from typing import Optional
 from robot.api import logger
 from robot.libraries.BuiltIn import BuiltIn
 
-from pywinautoLibrary.base import LibraryComponent
+from pywinautoLibrary.base import LibraryComponent, keyword
 
 
 class ScreenshotKeywords(LibraryComponent):
@@ -27,6 +27,7 @@ class ScreenshotKeywords(LibraryComponent):
     This class contains keywords for taking screenshots of windows and elements in Windows applications.
     """
 
+    @keyword
     def capture_screenshot(self, filename: Optional[str] = None) -> str:
         """Capture a screenshot of the current window.
 
@@ -58,6 +59,7 @@ class ScreenshotKeywords(LibraryComponent):
         
         return filename
 
+    @keyword
     def capture_element_screenshot(self, locator: str, filename: Optional[str] = None) -> str:
         """Capture a screenshot of an element matching the given locator.
 
@@ -13,10 +13,27 @@
 # limitations under the License.
 
 import time
-from typing import Optional
-
-from pywinautoLibrary.base import LibraryComponent
-from pywinautoLibrary.errors import ElementNotFound
+from datetime import timedelta
+from typing import Optional, Union
+
+from pywinautoLibrary.base import LibraryComponent, keyword
+from pywinautoLibrary.errors import WindowNotFound
+from pywinautoLibrary.utils import _convert_timeout, create_poll_scheduler
+from pywinautoLibrary.waits import (
+    AllOf,
+    AnyOf,
+    ApplicationIdle,
+    Condition,
+    CpuSampler,
+    ElementCount,
+    ElementEnabled,
+    ElementExists,
+    ElementPropertyEquals,
+    ElementTextContains,
+    ElementVisible,
+    WindowStable,
+    parse_condition,
+)
 
 
 class WaitingKeywords(LibraryComponent):
@@ -24,99 +41,73 @@ class WaitingKeywords(LibraryComponent):
 
     This class contains keywords for waiting for various conditions in Windows applications,
     such as elements to appear, elements to be enabled, etc.
+
+    All waits check their condition without nested waiting against a
+    single deadline, so no wait takes longer than its timeout, and all of
+    them fail when the condition does not hold in time. When the backend
+    provides change notifications, conditions are re-checked when the
+    window changes instead of on every poll.
     """
 
-    def wait_until_element_is_visible(self, locator: str, timeout: Optional[float] = None) -> None:
+    @keyword
+    def wait_until_element_is_visible(self, locator: str, timeout: Optional[timedelta] = None) -> None:
         """Wait until an element matching the given locator is visible.
 
         :param locator: Locator of the element to wait for.
         :type locator: str
         :param timeout: Timeout in seconds to wait for the element. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
         :raises pywinautoLibrary.errors.ElementNotFound: If the element is not found within the timeout.
+        :raises pywinautoLibrary.errors.ElementNotVisible: If the element is not visible within the timeout.
         """
         self.info(f"Waiting until element is visible: {locator}")
-        self.find_element(locator, timeout=timeout)
+        self.wait_until(ElementVisible(locator), self.get_timeout(timeout))
 
-    def wait_until_element_is_not_visible(self, locator: str, timeout: Optional[float] = None) -> None:
+    @keyword
+    def wait_until_element_is_not_visible(self, locator: str, timeout: Optional[timedelta] = None) -> None:
         """Wait until an element matching the given locator is not visible.
 
+        A missing element counts as not visible.
+
         :param locator: Locator of the element to wait for.
         :type locator: str
         :param timeout: Timeout in seconds to wait for the element. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
+        :raises pywinautoLibrary.errors.WaitTimeout: If the element is still visible after the timeout.
         """
         self.info(f"Waiting until element is not visible: {locator}")
-        if timeout is None:
-            timeout = self.ctx.timeout
-        start_time = time.time()
-
-        while True:
-            if time.time() - start_time > timeout:
-                break
-            try:
-                element = self.find_element(locator, required=False)
-                if not element or not element.is_visible():
-                    return
-            except Exception:
-                return
-            time.sleep(0.1)
-
-    def wait_until_element_is_enabled(self, locator: str, timeout: Optional[float] = None) -> None:
+        self.wait_until(~ElementVisible(locator), self.get_timeout(timeout))
+
+    @keyword
+    def wait_until_element_is_enabled(self, locator: str, timeout: Optional[timedelta] = None) -> None:
         """Wait until an element matching the given locator is enabled.
 
         :param locator: Locator of the element to wait for.
         :type locator: str
         :param timeout: Timeout in seconds to wait for the element. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
         :raises pywinautoLibrary.errors.ElementNotFound: If the element is not found within the timeout.
+        :raises pywinautoLibrary.errors.ElementNotEnabled: If the element is not enabled within the timeout.
         """
         self.info(f"Waiting until element is enabled: {locator}")
-        if timeout is None:
-            timeout = self.ctx.timeout
-        start_time = time.time()
-
-        while True:
-            if time.time() - start_time > timeout:
-                break
-            try:
-                element = self.find_element(locator)
-                if element.is_enabled():
-                    return
-            except Exception:
-                pass
-            time.sleep(0.1)
-
-        raise ElementNotFound(f"Element with locator '{locator}' is not enabled within timeout.")
-
-    def wait_until_element_is_disabled(self, locator: str, timeout: Optional[float] = None) -> None:
+        self.wait_until(ElementEnabled(locator), self.get_timeout(timeout))
+
+    @keyword
+    def wait_until_element_is_disabled(self, locator: str, timeout: Optional[timedelta] = None) -> None:
         """Wait until an element matching the given locator is disabled.
 
         :param locator: Locator of the element to wait for.
         :type locator: str
         :param timeout: Timeout in seconds to wait for the element. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
         :raises pywinautoLibrary.errors.ElementNotFound: If the element is not found within the timeout.
+        :raises pywinautoLibrary.errors.WaitTimeout: If the element is still enabled after the timeout.
         """
         self.info(f"Waiting until element is disabled: {locator}")
-        if timeout is None:
-            timeout = self.ctx.timeout
-        start_time = time.time()
-
-        while True:
-            if time.time() - start_time > timeout:
-                break
-            try:
-                element = self.find_element(locator)
-                if not element.is_enabled():
-                    return
-            except Exception:
-                pass
-            time.sleep(0.1)
-
-        raise ElementNotFound(f"Element with locator '{locator}' is not disabled within timeout.")
-
-    def wait_until_element_contains_text(self, locator: str, text: str, timeout: Optional[float] = None) -> None:
+        self.wait_until(ElementEnabled(locator, enabled=False), self.get_timeout(timeout))
+
+    @keyword
+    def wait_until_element_contains_text(self, locator: str, text: str, timeout: Optional[timedelta] = None) -> None:
         """Wait until an element matching the given locator contains the given text.
 
         :param locator: Locator of the element to wait for.
@@ -124,87 +115,331 @@ class WaitingKeywords(LibraryComponent):
         :param text: Text to wait for.
         :type text: str
         :param timeout: Timeout in seconds to wait for the text. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
         :raises pywinautoLibrary.errors.ElementNotFound: If the element is not found within the timeout.
+        :raises pywinautoLibrary.errors.WaitTimeout: If the element does not contain the text within the timeout.
         """
         self.info(f"Waiting until element contains text: {locator} contains '{text}'")
-        if timeout is None:
-            timeout = self.ctx.timeout
-        start_time = time.time()
-
-        while True:
-            if time.time() - start_time > timeout:
-                break
-            try:
-                element = self.find_element(locator)
-                if text in element.window_text():
-                    return
-            except Exception:
-                pass
-            time.sleep(0.1)
-
-        raise ElementNotFound(f"Element with locator '{locator}' does not contain text '{text}' within timeout.")
-
-    def wait_until_element_does_not_contain_text(self, locator: str, text: str, timeout: Optional[float] = None) -> None:
+        self.wait_until(ElementTextContains(locator, text), self.get_timeout(timeout))
+
+    @keyword
+    def wait_until_element_does_not_contain_text(self, locator: str, text: str, timeout: Optional[timedelta] = None) -> None:
         """Wait until an element matching the given locator does not contain the given text.
 
+        A missing element counts as not containing the text.
+
         :param locator: Locator of the element to wait for.
         :type locator: str
         :param text: Text to wait for.
         :type text: str
         :param timeout: Timeout in seconds to wait for the text. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
+        :raises pywinautoLibrary.errors.WaitTimeout: If the element still contains the text after the timeout.
         """
         self.info(f"Waiting until element does not contain text: {locator} does not contain '{text}'")
-        if timeout is None:
-            timeout = self.ctx.timeout
-        start_time = time.time()
-
-        while True:
-            if time.time() - start_time > timeout:
-                break
-            try:
-                element = self.find_element(locator)
-                if text not in element.window_text():
-                    return
-            except Exception:
-                return
-            time.sleep(0.1)
-
-    def wait_until_window_is_opened(self, locator: str, timeout: Optional[float] = None) -> None:
+        self.wait_until(~ElementTextContains(locator, text), self.get_timeout(timeout))
+
+    @keyword
+    def wait_until_element_count_is(
+        self, locator: str, count: int, timeout: Optional[timedelta] = None
+    ) -> None:
+        """Wait until exactly `count` elements match the given locator.
+
+        :param locator: Locator of the elements to count.
+        :type locator: str
+        :param count: Expected number of elements.
+        :type count: int
+        :param timeout: Timeout in seconds. If None, use the default timeout.
+        :type timeout: timedelta
+        :raises pywinautoLibrary.errors.WaitTimeout: If the number of elements differs after the timeout.
+        """
+        self.info(f"Waiting until {count} elements match: {locator}")
+        self.wait_until(ElementCount(locator, count), self.get_timeout(timeout))
+
+    @keyword
+    def wait_until_element_property_is(
+        self, locator: str, name: str, value: str, timeout: Optional[timedelta] = None
+    ) -> None:
+        """Wait until a property of an element has the given value.
+
+        Properties are those of the pywinauto element info, such as `name`,
+        `automation_id`, `control_type` or `rich_text`. Values are compared
+        as strings.
+
+        :param locator: Locator of the element to wait for.
+        :type locator: str
+        :param name: Name of the property.
+        :type name: str
+        :param value: Expected value.
+        :type value: str
+        :param timeout: Timeout in seconds. If None, use the default timeout.
+        :type timeout: timedelta
+        :raises pywinautoLibrary.errors.ElementNotFound: If the element is not found within the timeout.
+        :raises pywinautoLibrary.errors.WaitTimeout: If the property has another value after the timeout.
+        """
+        self.info(f"Waiting until element {locator} has {name} '{value}'")
+        self.wait_until(ElementPropertyEquals(locator, name, value), self.get_timeout(timeout))
+
+    @keyword
+    def wait_until_any_condition(
+        self, *conditions: Union[str, Condition], timeout: Optional[timedelta] = None
+    ) -> str:
+        """Wait until at least one of the given conditions holds.
+
+        All conditions are checked in the same iteration against one
+        capture of the window, so waiting for either a success or an error
+        dialog takes as long as the first of them to appear instead of a
+        full timeout per condition.
+
+        Conditions have the form `state: locator`, where state is one of
+        `exists`, `visible`, `hidden`, `enabled`, `disabled`,
+        `contains <text>`, `count <number>` or `property <name>=<value>`,
+        optionally preceded by `not`. A plain locator must exist.
+
+        Example:
+        | ${fired} = | Wait Until Any Condition | title:Saved | title:Error | visible: auto_id:Retry | timeout=10s |
+
+        :param conditions: Conditions to wait for.
+        :type conditions: str
+        :param timeout: Timeout in seconds. If None, use the default timeout.
+        :type timeout: timedelta
+        :return: The first condition, in the given order, that holds.
+        :rtype: str
+        :raises pywinautoLibrary.errors.WaitTimeout: If none of the conditions holds within the timeout.
+        """
+        condition = AnyOf(*(parse_condition(condition) for condition in conditions))
+        self.info(f"Waiting until any condition holds: {condition}")
+        index, _ = self.wait_until(condition, self.get_timeout(timeout))
+        fired = conditions[index]
+        self.info(f"Condition held: {fired}")
+        return str(fired)
+
+    @keyword
+    def wait_until_all_conditions(
+        self, *conditions: Union[str, Condition], timeout: Optional[timedelta] = None
+    ) -> None:
+        """Wait until all the given conditions hold at the same time.
+
+        Conditions are checked in the same iteration against one capture of
+        the window and have the same form as with `Wait Until Any Condition`.
+
+        Example:
+        | Wait Until All Conditions | enabled: auto_id:Save | not exists: auto_id:Spinner | contains Ready: auto_id:Status |
+
+        :param conditions: Conditions to wait for.
+        :type conditions: str
+        :param timeout: Timeout in seconds. If None, use the default timeout.
+        :type timeout: timedelta
+        :raises pywinautoLibrary.errors.WaitTimeout: If the conditions do not all hold within the timeout.
+        """
+        condition = AllOf(*(parse_condition(condition) for condition in conditions))
+        self.info(f"Waiting until all conditions hold: {condition}")
+        self.wait_until(condition, self.get_timeout(timeout))
+
+    @keyword
+    def wait_until_window_is_stable(
+        self,
+        quiet_period: timedelta = timedelta(milliseconds=500),
+        locator: Optional[str] = None,
+        timeout: Optional[timedelta] = None,
+    ) -> None:
+        """Wait until the window stops changing.
+
+        The names and control types of the whole window, or of the element
+        matching `locator`, are captured on every poll. The keyword returns
+        as soon as they have stayed the same for `quiet_period`, which
+        replaces fixed `Sleep` calls on screens that keep updating for a
+        while.
+
+        Example:
+        | Click Element | auto_id:Refresh |
+        | Wait Until Window Is Stable | quiet_period=300ms |
+
+        :param quiet_period: How long the window has to stay unchanged, in
+            seconds or Robot Framework time format.
+        :type quiet_period: timedelta
+        :param locator: Locator of the element to watch instead of the
+            whole window.
+        :type locator: str
+        :param timeout: Timeout in seconds. If None, use the default timeout.
+        :type timeout: timedelta
+        :raises pywinautoLibrary.errors.WaitTimeout: If the window keeps changing until the timeout.
+        """
+        condition = WindowStable(_convert_timeout(quiet_period), locator)
+        self.info(f"Waiting until {condition.describe()}")
+        # Polled, since the condition also holds when nothing is notified
+        self.wait_until(condition, self.get_timeout(timeout), events=False)
+        self.info(f"Window was stable after {condition.changes} changes.")
+
+    @keyword
+    def wait_until_application_is_idle(
+        self,
+        threshold: float = 5.0,
+        interval: timedelta = timedelta(milliseconds=100),
+        samples: int = 5,
+        include_children: bool = False,
+        process_id: Optional[int] = None,
+        timeout: Optional[timedelta] = None,
+    ) -> None:
+        """Wait until the application process stops using the CPU.
+
+        The CPU usage of the process is sampled every `interval` in a
+        background thread, and the keyword returns as soon as `samples`
+        consecutive samples are below `threshold` percent of one CPU. Use it
+        after starting the application or an operation that keeps it busy
+        without visible changes in the window. A process that exits counts
+        as idle.
+
+        Requires the `psutil` module.
+
+        Example:
+        | Open Application | C:/Tools/Import.exe |
+        | Wait Until Application Is Idle | threshold=2 | samples=10 | include_children=True |
+
+        :param threshold: Highest accepted usage in percents of one CPU.
+        :type threshold: float
+        :param interval: Time between samples, in seconds or Robot Framework
+            time format.
+        :type interval: timedelta
+        :param samples: Number of consecutive samples that must be below
+            `threshold`.
+        :type samples: int
+        :param include_children: Include the usage of all child processes.
+        :type include_children: bool
+        :param process_id: Process to sample. Defaults to the process of the
+            current application.
+        :type process_id: int
+        :param timeout: Timeout in seconds. If None, use the default timeout.
+        :type timeout: timedelta
+        :raises pywinautoLibrary.errors.WaitTimeout: If the usage does not stay below the threshold within the timeout.
+        :raises pywinautoLibrary.errors.MissingDependency: If psutil is not installed.
+        """
+        pid = int(process_id) if process_id is not None else self.ctx.app.process
+        samples = int(samples)
+        sampler = CpuSampler(pid, _convert_timeout(interval), include_children, history=max(samples, 100))
+        condition = ApplicationIdle(sampler, float(threshold), samples)
+        self.info(f"Waiting until {condition.describe()}")
+        with sampler:
+            # Polled, since the samples come from the background thread
+            self.wait_until(condition, self.get_timeout(timeout), events=False)
+        if sampler.exited:
+            self.warn(f"Process {pid} exited while waiting for it to be idle.")
+        else:
+            self.info(f"Process was idle after {sampler.count} samples.")
+
+    @keyword
+    def wait_until_window_is_opened(self, locator: str, timeout: Optional[timedelta] = None) -> None:
         """Wait until a window matching the given locator is opened.
 
         :param locator: Locator of the window to wait for.
         :type locator: str
         :param timeout: Timeout in seconds to wait for the window. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
         :raises pywinautoLibrary.errors.WindowNotFound: If the window is not found within the timeout.
         """
         self.info(f"Waiting until window is opened: {locator}")
-        self.find_element(locator, timeout=timeout)
+        self.wait_until(ElementExists(locator), self.get_timeout(timeout), WindowNotFound)
 
-    def wait_until_window_is_closed(self, locator: str, timeout: Optional[float] = None) -> None:
+    @keyword
+    def wait_until_window_is_closed(self, locator: str, timeout: Optional[timedelta] = None) -> None:
         """Wait until a window matching the given locator is closed.
 
         :param locator: Locator of the window to wait for.
         :type locator: str
         :param timeout: Timeout in seconds to wait for the window. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
+        :raises pywinautoLibrary.errors.WaitTimeout: If the window is still open after the timeout.
         """
         self.info(f"Waiting until window is closed: {locator}")
-        if timeout is None:
-            timeout = self.ctx.timeout
-        start_time = time.time()
-
-        while True:
-            if time.time() - start_time > timeout:
-                break
-            try:
-                self.find_element(locator, required=False)
-            except Exception:
-                return
-            time.sleep(0.1)
-
+        self.wait_until(~ElementExists(locator), self.get_timeout(timeout))
+
+    @keyword
+    def get_wait_statistics(self, scope: str = "total", limit: Optional[int] = None) -> list:
+        """Get how much time was spent finding elements and waiting.
+
+        Returns one dictionary per locator or wait condition, the one that
+        took the most time first, with the following keys:
+
+        - ``operation``: ``find`` for elements searched until they appear,
+          ``find_many`` for locators searched together, ``wait`` for wait
+          conditions.
+        - ``target``: The locator or the condition.
+        - ``calls``, ``matches`` and ``timeouts``: How many times it was
+          searched or waited for, and how many of them succeeded or timed out.
+        - ``iterations``: How many times it was checked in total.
+        - ``total_time``, ``query_time`` and ``sleep_time``: Seconds spent
+          in total, checking, and sleeping or waiting for changes between
+          the checks.
+        - ``average_time_to_match`` and ``max_time_to_match``: Seconds until
+          it matched, or None if it never did.
+
+        The same statistics are written to ``pywinauto-wait-statistics.json``
+        at the end of the run. Recording can be disabled with the
+        ``wait_statistics`` library import argument.
+
+        Example:
+        | ${slowest} = | Get Wait Statistics | scope=suite | limit=5 |
+
+        :param scope: ``total`` for the whole run, ``suite`` for the current
+            suite or ``test`` for the current test.
+        :type scope: str
+        :param limit: Return at most this many entries.
+        :type limit: int
+        :return: Statistics, the slowest first.
+        :rtype: list
+        """
+        statistics = self.element_finder.statistics
+        if statistics is None:
+            self.info("Wait statistics are disabled.")
+            return []
+        entries = statistics.get(scope, int(limit) if limit is not None else None)
+        for entry in entries:
+            self.info(
+                f"{entry['operation']} {entry['target']}: {entry['calls']} calls, "
+                f"{entry['iterations']} checks, {entry['timeouts']} timeouts, "
+                f"{entry['total_time']:.3f} s ({entry['query_time']:.3f} s checking)"
+            )
+        return entries
+
+    @keyword
+    def set_poll_strategy(
+        self,
+        strategy: str = "backoff",
+        interval: Optional[timedelta] = None,
+        initial_interval: Optional[timedelta] = None,
+        factor: Optional[float] = None,
+    ) -> str:
+        """Set how often elements and conditions are checked while waiting.
+
+        With the ``backoff`` strategy the first retry happens after
+        ``initial_interval`` (5 ms by default) and the interval is multiplied
+        by ``factor`` (2 by default) after each retry until it reaches
+        ``interval`` (100 ms by default). The ``fixed`` strategy always waits
+        ``interval`` between checks.
+
+        :param strategy: `backoff` or `fixed`.
+        :type strategy: str
+        :param interval: Fixed interval, or the longest backoff interval,
+            in seconds or Robot Framework time format.
+        :type interval: timedelta
+        :param initial_interval: First backoff interval.
+        :type initial_interval: timedelta
+        :param factor: Backoff multiplier.
+        :type factor: float
+        :return: Description of the previous poll strategy.
+        :rtype: str
+        """
+        previous = str(self.ctx.poll_scheduler)
+        self.ctx.poll_scheduler = create_poll_scheduler(
+            strategy,
+            _convert_timeout(interval) if interval is not None else None,
+            _convert_timeout(initial_interval) if initial_interval is not None else None,
+            float(factor) if factor is not None else None,
+        )
+        self.info(f"Poll strategy set to {self.ctx.poll_scheduler}, was {previous}.")
+        return previous
+
+    @keyword
     def sleep(self, seconds: float) -> None:
         """Sleep for the given number of seconds.
 
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from datetime import timedelta
 from typing import Optional, List
 
-from pywinautoLibrary.base import LibraryComponent
+from pywinautoLibrary.base import LibraryComponent, keyword
 from pywinautoLibrary.errors import WindowNotFound
+from pywinautoLibrary.waits import ElementExists
 
 
 class WindowManagementKeywords(LibraryComponent):
@@ -24,6 +26,7 @@ class WindowManagementKeywords(LibraryComponent):
     This class contains keywords for switching, closing, and manipulating application windows.
     """
 
+    @keyword
     def switch_window(self, locator: str) -> None:
         """Switch to a window matching the given locator.
 
@@ -38,6 +41,7 @@ class WindowManagementKeywords(LibraryComponent):
         except Exception:
             raise WindowNotFound(f"Window with locator '{locator}' not found.")
 
+    @keyword
     def close_window(self, locator: Optional[str] = None) -> None:
         """Close a window matching the given locator.
 
@@ -57,6 +61,7 @@ class WindowManagementKeywords(LibraryComponent):
         except Exception:
             raise WindowNotFound(f"Window with locator '{locator}' not found.")
 
+    @keyword
     def minimize_window(self, locator: Optional[str] = None) -> None:
         """Minimize a window matching the given locator.
 
@@ -76,6 +81,7 @@ class WindowManagementKeywords(LibraryComponent):
         except Exception:
             raise WindowNotFound(f"Window with locator '{locator}' not found.")
 
+    @keyword
     def maximize_window(self, locator: Optional[str] = None) -> None:
         """Maximize a window matching the given locator.
 
@@ -95,6 +101,7 @@ class WindowManagementKeywords(LibraryComponent):
         except Exception:
             raise WindowNotFound(f"Window with locator '{locator}' not found.")
 
+    @keyword
     def restore_window(self, locator: Optional[str] = None) -> None:
         """Restore a window matching the given locator from minimized or maximized state.
 
@@ -114,6 +121,7 @@ class WindowManagementKeywords(LibraryComponent):
         except Exception:
             raise WindowNotFound(f"Window with locator '{locator}' not found.")
 
+    @keyword
     def get_window_title(self, locator: Optional[str] = None) -> str:
         """Get the title of a window matching the given locator.
 
@@ -135,18 +143,20 @@ class WindowManagementKeywords(LibraryComponent):
         except Exception:
             raise WindowNotFound(f"Window with locator '{locator}' not found.")
 
-    def wait_for_window(self, locator: str, timeout: Optional[float] = None) -> None:
+    @keyword
+    def wait_for_window(self, locator: str, timeout: Optional[timedelta] = None) -> None:
         """Wait for a window matching the given locator to appear.
 
         :param locator: Locator of the window to wait for.
         :type locator: str
         :param timeout: Timeout in seconds to wait for the window. If None, use the default timeout.
-        :type timeout: float
+        :type timeout: timedelta
         :raises pywinautoLibrary.errors.WindowNotFound: If the window is not found within the timeout.
         """
         self.info(f"Waiting for window: {locator}")
-        self.find_element(locator, timeout=timeout)
+        self.wait_until(ElementExists(locator), self.get_timeout(timeout), WindowNotFound)
 
+    @keyword
     def get_window_count(self) -> int:
         """Get the number of open windows in the current application.
 
@@ -158,21 +168,22 @@ class WindowManagementKeywords(LibraryComponent):
         self.info(f"Found {count} windows")
         return count
 
+    @keyword
     def is_window_open(self, locator: str) -> bool:
         """Check if a window matching the given locator is open.
 
+        The window is not waited for, so the answer is immediate when the
+        window is not open.
+
         :param locator: Locator of the window to check.
         :type locator: str
         :return: True if the window is open, False otherwise.
         :rtype: bool
         """
         self.info(f"Checking if window is open: {locator}")
-        try:
-            self.find_element(locator, required=False)
-            return True
-        except Exception:
-            return False
+        return self.probe_element(locator) is not None
 
+    @keyword
     def activate_window(self, locator: str) -> None:
         """Activate a window matching the given locator (bring it to the foreground).
 
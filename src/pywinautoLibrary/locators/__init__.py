@@ -12,6 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .elementcache import ElementCache
 from .elementfinder import ElementFinder
+from .hints import HINTS_FILE, LocatorHint, LocatorHints
+from .locator import CONTROL_TYPES, Locator, LocatorCache
+from .snapshot import SNAPSHOT_PROPERTIES, SnapshotNode, UISnapshot, take_snapshot
+from .traversal import (
+    follow_path,
+    iter_descendant_paths,
+    iter_descendants,
+    parse_search_depth,
+    parse_search_order,
+)
+from .windowcache import WindowCache
 
-__all__ = ["ElementFinder"]
+__all__ = [
+    "CONTROL_TYPES",
+    "ElementCache",
+    "ElementFinder",
+    "HINTS_FILE",
+    "Locator",
+    "LocatorCache",
+    "LocatorHint",
+    "LocatorHints",
+    "SNAPSHOT_PROPERTIES",
+    "SnapshotNode",
+    "UISnapshot",
+    "WindowCache",
+    "follow_path",
+    "iter_descendant_paths",
+    "iter_descendants",
+    "parse_search_depth",
+    "parse_search_order",
+    "take_snapshot",
+]
@@ -0,0 +1,197 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Callable, Optional
+
+from .locator import Locator
+from .properties import element_property
+
+
+def element_key(element: Any) -> Any:
+    """Get a cheap identity of `element`.
+
+    UIA elements are identified by their runtime id. Win32 elements are
+    identified by their window handle together with their process and
+    class name, as handles of destroyed windows are reused. Reading the
+    identity of an element that no longer exists returns an empty value.
+
+    :param element: pywinauto wrapper.
+    :type element: Any
+    :return: Runtime id, handle with process and class name, or `None` if
+        neither is available.
+    :rtype: Any
+    """
+    runtime_id = element_property(element, "runtime_id")
+    if runtime_id:
+        return tuple(runtime_id) if isinstance(runtime_id, (list, tuple)) else runtime_id
+    handle = element_property(element, "handle")
+    if not handle:
+        return None
+    return handle, element_property(element, "process_id"), element_property(element, "class_name")
+
+
+def element_exists(element: Any) -> bool:
+    """Check whether `element` still exists.
+
+    Wrappers with an `exists` method, such as window specifications, are
+    asked directly. Win32 elements are checked with `IsWindow`, and UIA
+    elements by reading their runtime id, which fails for removed elements.
+
+    :param element: pywinauto wrapper.
+    :type element: Any
+    :return: False if the element no longer exists, True otherwise.
+    :rtype: bool
+    """
+    exists = getattr(element, "exists", None)
+    if callable(exists):
+        try:
+            return bool(exists())
+        except Exception:
+            return False
+    if exists is not None:
+        return bool(exists)
+    handle = element_property(element, "handle")
+    if handle:
+        return _is_window(handle)
+    return bool(element_property(element, "runtime_id"))
+
+
+def _is_window(handle: int) -> bool:
+    try:
+        import ctypes
+        is_window = ctypes.windll.user32.IsWindow
+    except (AttributeError, ImportError, OSError):
+        # Not on Windows, the handle cannot be checked
+        return True
+    return bool(is_window(handle))
+
+
+class ElementCache:
+    """Cache of resolved elements of the current window.
+
+    Maps compiled locators to the element they last resolved to, together
+    with the identity of that element. Cached elements are validated by
+    re-reading their identity before reuse, and the whole cache is dropped
+    when the window the elements belong to changes.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """Initialize the element cache.
+
+        :param enabled: When False, the cache never stores anything.
+        :type enabled: bool
+        """
+        self.enabled = enabled
+        self._window = None
+        self._elements = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.invalidations = 0
+
+    def set_window(self, window: Any):
+        """Set the window cached elements belong to.
+
+        Cached elements are dropped if the window identity differs from the
+        previously set window.
+
+        :param window: Root window of the search.
+        :type window: Any
+        """
+        if not self.enabled:
+            return
+        key = element_key(window)
+        if key is None or key != self._window:
+            if self._elements:
+                self.invalidate()
+            self._window = key
+
+    def get(
+        self, locator: Locator, validate: Optional[Callable[[Any, Locator], bool]] = None
+    ) -> Optional[Any]:
+        """Get the cached element for `locator` if it is still valid.
+
+        :param locator: Compiled locator.
+        :type locator: Locator
+        :param validate: Optional predicate called with the cached element
+            and `locator`. The element is dropped if it returns False.
+        :type validate: callable
+        :return: Cached element or `None`.
+        :rtype: Any
+        """
+        if not self.enabled:
+            return None
+        try:
+            element, key = self._elements[locator]
+        except KeyError:
+            self.misses += 1
+            return None
+        if (
+            element_key(element) == key
+            and element_exists(element)
+            and (validate is None or validate(element, locator))
+        ):
+            self.hits += 1
+            return element
+        del self._elements[locator]
+        self.stale += 1
+        self.misses += 1
+        return None
+
+    def put(self, locator: Locator, element: Any):
+        """Store the element `locator` resolved to.
+
+        :param locator: Compiled locator.
+        :type locator: Locator
+        :param element: Resolved element.
+        :type element: Any
+        """
+        if not self.enabled or self._window is None:
+            return
+        key = element_key(element)
+        if key is not None:
+            self._elements[locator] = (element, key)
+
+    def discard(self, locator: Locator):
+        """Remove the cached element of `locator`.
+
+        :param locator: Compiled locator.
+        :type locator: Locator
+        """
+        self._elements.pop(locator, None)
+
+    def invalidate(self):
+        """Drop all cached elements."""
+        self._elements.clear()
+        self._window = None
+        self.invalidations += 1
+
+    @property
+    def statistics(self) -> dict:
+        """Cache statistics.
+
+        :return: Dictionary with `enabled`, `hits`, `misses`, `stale`,
+            `invalidations`, `size` and `hit_rate`.
+        :rtype: dict
+        """
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "invalidations": self.invalidations,
+            "size": len(self._elements),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -12,10 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, List, Any
 import time
+from typing import Optional, List, Any, Callable, Dict, Iterable, Iterator, Union
+
+from robot.api import logger
 
 from pywinautoLibrary.errors import ElementNotFound
+from pywinautoLibrary.utils import WaitStatistics
+from .elementcache import ElementCache
+from .fuzzy import TrigramIndex, similarity, trigrams
+from .hints import LocatorHint, LocatorHints, window_key
+from .locator import Locator, LocatorCache
+from .properties import element_property, is_control_type
+from .snapshot import UISnapshot, take_snapshot
+from .snapshotindex import SnapshotIndex, literal_prefix
+from .traversal import BREADTH_FIRST, follow_path, iter_descendant_paths, iter_descendants
+from .windowcache import WindowCache
 
 
 class ElementFinder:
@@ -25,17 +37,163 @@ class ElementFinder:
     using various locator strategies.
     """
 
-    def __init__(self, ctx):
+    #: Strategies matching top-level windows when searching from the top window
+    WINDOW_STRATEGIES = ("title", "class")
+
+    def __init__(
+        self,
+        ctx,
+        cache_size: int = 1024,
+        element_cache: bool = True,
+        search_depth: Optional[int] = 1,
+        search_order: str = BREADTH_FIRST,
+        fuzzy_threshold: float = 0.5,
+        window_cache_ttl: float = 0.25,
+        window_events: Optional[Callable[[Any], Any]] = None,
+        hints: Optional[LocatorHints] = None,
+        statistics: Optional[WaitStatistics] = None,
+    ):
         """Initialize the element finder.
 
         :param ctx: The library context.
         :type ctx: pywinautoLibrary.pywinautoLibrary
+        :param cache_size: Maximum number of compiled locators to cache.
+        :type cache_size: int
+        :param element_cache: Reuse previously resolved elements of the
+            current window when they still exist.
+        :type element_cache: bool
+        :param search_depth: How deep below the root element locators are
+            searched. 1 means only direct children, None means no limit.
+        :type search_depth: int or None
+        :param search_order: `breadth_first` or `depth_first`.
+        :type search_order: str
+        :param fuzzy_threshold: Lowest similarity, from 0.0 to 1.0, of
+            element names accepted by `fuzzy` locators.
+        :type fuzzy_threshold: float
+        :param window_cache_ttl: Seconds to reuse the list of top-level
+            windows matched by `title` and `class` locators.
+        :type window_cache_ttl: float
+        :param window_events: Callable creating an event source notified
+            when windows of an application open or close.
+        :type window_events: callable
+        :param hints: Store of the paths where locators were found earlier,
+            tried before searching. None disables hints.
+        :type hints: LocatorHints
+        :param statistics: Where to record the searches that wait for
+            elements, or None.
+        :type statistics: pywinautoLibrary.utils.WaitStatistics
         """
+        if not 0 <= fuzzy_threshold <= 1:
+            raise ValueError(f"Fuzzy threshold must be between 0 and 1, got {fuzzy_threshold}.")
         self.ctx = ctx
+        self.fuzzy_threshold = fuzzy_threshold
+        self.search_depth = search_depth
+        self.search_order = search_order
+        self.locator_cache = LocatorCache(cache_size)
+        self.element_cache = ElementCache(element_cache)
+        self.window_cache = WindowCache(window_cache_ttl, window_events)
+        self.hints = hints
+        self.statistics = statistics
+        self.snapshot = None
+        # Whether the active snapshot is of the top window
+        self._snapshot_of_top = False
+        # Top window resolved in the current search attempt
+        self._top_window = None
+        # Paths of the elements visited by the current search, when recorded
+        self._paths = None
+        self._strategies = {
+            "title": self._find_by_title,
+            "class": self._find_by_class,
+            "control_id": self._find_by_control_id,
+            "auto_id": self._find_by_auto_id,
+            "text": self._find_by_text,
+            "xpath": self._find_by_xpath,
+            "fuzzy": self._find_by_fuzzy,
+            "default": self._find_by_default,
+        }
+
+    def compile(
+        self, locator: Union[str, Locator], control_type: Optional[str] = None
+    ) -> Locator:
+        """Get the compiled form of the given locator.
+
+        :param locator: Locator string or already compiled locator.
+        :type locator: str or Locator
+        :param control_type: Limit matching only to this control type.
+        :type control_type: str
+        :return: Compiled locator.
+        :rtype: Locator
+        """
+        if not isinstance(locator, Locator):
+            locator = self.locator_cache.get(locator)
+        return locator.restrict(control_type)
+
+    def is_window_locator(self, locator: Union[str, Locator], control_type: Optional[str] = None) -> bool:
+        """Check whether `locator` matches top-level windows of the application.
+
+        :param locator: Locator string or compiled locator.
+        :type locator: str or Locator
+        :param control_type: Limit matching only to this control type.
+        :type control_type: str
+        :return: True if the locator is matched against the top-level windows
+            instead of the descendants of the current window.
+        :rtype: bool
+        """
+        return self.compile(locator, control_type).strategy in self.WINDOW_STRATEGIES
+
+    def invalidate(self, *args):
+        """Drop all cached elements and windows and the active snapshot.
+
+        Called when the current application is switched or closed. Accepts
+        and ignores any arguments so it can be used as a callback.
+        """
+        self.element_cache.invalidate()
+        self.window_cache.invalidate()
+        self.snapshot = None
+        self._top_window = None
+
+    def take_snapshot(self, root: Any = None, properties: Any = None) -> UISnapshot:
+        """Capture a subtree and search it instead of the live application.
+
+        :param root: Element whose subtree to capture. Defaults to the
+            current window.
+        :type root: Any
+        :param properties: Properties to capture. Defaults to all
+            properties the locator strategies use.
+        :type properties: str, list or None
+        :return: The snapshot, which stays active until released.
+        :rtype: UISnapshot
+        """
+        of_top = root is None
+        if of_top:
+            self.snapshot = None
+            root = self.get_root_element()
+        self.snapshot = take_snapshot(root, properties)
+        self._snapshot_of_top = of_top
+        return self.snapshot
+
+    def refresh_snapshot(self) -> Optional[UISnapshot]:
+        """Replace the active snapshot with a new capture of the same element.
+
+        :return: The new snapshot, or None if no snapshot is active.
+        :rtype: UISnapshot
+        """
+        if self.snapshot is not None:
+            self.snapshot = self.snapshot.refresh()
+        return self.snapshot
+
+    def release_snapshot(self) -> Optional[UISnapshot]:
+        """Stop searching the active snapshot.
+
+        :return: The released snapshot, or None if no snapshot was active.
+        :rtype: UISnapshot
+        """
+        snapshot, self.snapshot = self.snapshot, None
+        return snapshot
 
     def find(
         self,
-        locator: str,
+        locator: Union[str, Locator],
         control_type: Optional[str] = None,
         first_only: bool = True,
         required: bool = True,
@@ -45,7 +203,7 @@ class ElementFinder:
         """Find element(s) matching the given locator.
 
         :param locator: Locator to use when searching the element.
-        :type locator: str
+        :type locator: str or Locator
         :param control_type: Limit searching only to these control types.
         :type control_type: str
         :param first_only: If True, return only the first matching element.
@@ -62,37 +220,275 @@ class ElementFinder:
         """
         if timeout is None:
             timeout = self.ctx.timeout
-        start_time = time.time()
-
-        while True:
+        compiled = self.compile(locator, control_type)
+        started = time.perf_counter()
+        query_time = 0.0
+        elements = None
+
+        for attempt in self.ctx.poll_scheduler.poll(timeout):
+            # Elements cannot appear in a snapshot, so retries capture a new one
+            if attempt > 1:
+                self.refresh_snapshot()
+            self._top_window = None
+            query_started = time.perf_counter()
             try:
-                elements = self._find_elements(locator, control_type, first_only, parent)
-                if elements:
-                    return elements[0] if first_only else elements
+                elements = self._find_elements(compiled, first_only, parent)
             except Exception:
-                pass
-
-            if time.time() - start_time > timeout:
+                elements = None
+            query_time += time.perf_counter() - query_started
+            if elements:
                 break
-            time.sleep(0.1)
 
+        if self.statistics is not None:
+            self.statistics.record(
+                "find", str(compiled), attempt, query_time, time.perf_counter() - started, bool(elements)
+            )
+        if elements:
+            return elements[0] if first_only else elements
         if required:
-            raise ElementNotFound(f"Element with locator '{locator}' not found.")
+            raise ElementNotFound(f"Element with locator '{compiled}' not found.")
         return None if first_only else []
 
-    def _find_elements(
+    def probe(
         self,
-        locator: str,
+        locator: Union[str, Locator],
         control_type: Optional[str] = None,
-        first_only: bool = True,
         parent: Any = None,
-    ) -> List[Any]:
-        """Internal method to find elements.
+    ) -> Any:
+        """Check once whether an element matching the given locator exists.
+
+        Unlike `find`, this never waits or retries, so negative checks get
+        their answer in a single search.
 
         :param locator: Locator to use when searching the element.
-        :type locator: str
+        :type locator: str or Locator
         :param control_type: Limit searching only to these control types.
         :type control_type: str
+        :param parent: Optional parent element to search child elements from.
+        :type parent: Any
+        :return: Found element or None.
+        :rtype: Any
+        """
+        compiled = self.compile(locator, control_type)
+        self._top_window = None
+        try:
+            elements = self._find_elements(compiled, True, parent)
+        except Exception:
+            return None
+        return elements[0] if elements else None
+
+    def find_many(
+        self,
+        locators: Union[Iterable[Union[str, Locator]], Dict[str, Union[str, Locator]]],
+        control_type: Optional[str] = None,
+        required: bool = False,
+        parent: Any = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Find the first element matching each of the given locators.
+
+        Locators using the `auto_id`, `control_id`, `text` and default
+        strategies, and `class` below the top window, are resolved together
+        in a single traversal of the control tree, which stops as soon as
+        all of them are found. Other locators are searched one by one. All
+        locators share the same timeout, and retries only search for the
+        elements that are still missing.
+
+        :param locators: Locators to search, or a dictionary mapping names
+            to locators.
+        :type locators: list or dict
+        :param control_type: Limit searching only to these control types.
+        :type control_type: str
+        :param required: Raise ElementNotFound if any element is not found
+            when True.
+        :type required: bool
+        :param parent: Optional parent element to search child elements from.
+        :type parent: Any
+        :param timeout: Timeout in seconds to wait for the elements to appear.
+        :type timeout: float
+        :return: Dictionary mapping each locator, or name, to the found
+            element or None.
+        :rtype: dict
+        :raises pywinautoLibrary.errors.ElementNotFound: If an element is not
+            found and required is True.
+        """
+        if timeout is None:
+            timeout = self.ctx.timeout
+        if not isinstance(locators, dict):
+            locators = {str(locator): locator for locator in locators}
+        compiled = {name: self.compile(locator, control_type) for name, locator in locators.items()}
+        found = dict.fromkeys(compiled)
+        started = time.perf_counter()
+        query_time = 0.0
+
+        for attempt in self.ctx.poll_scheduler.poll(timeout):
+            if attempt > 1:
+                self.refresh_snapshot()
+            self._top_window = None
+            missing = {name: locator for name, locator in compiled.items() if found[name] is None}
+            query_started = time.perf_counter()
+            try:
+                self._find_batch(missing, found, parent)
+            except Exception:
+                pass
+            query_time += time.perf_counter() - query_started
+            if all(element is not None for element in found.values()):
+                break
+
+        missing = [name for name, element in found.items() if element is None]
+        if self.statistics is not None:
+            self.statistics.record(
+                "find_many", ", ".join(str(locator) for locator in compiled.values()), attempt,
+                query_time, time.perf_counter() - started, not missing,
+            )
+        if missing and required:
+            raise ElementNotFound(f"Elements with locators {', '.join(missing)} not found.")
+        return found
+
+    def _find_batch(self, locators: Dict[str, Locator], found: Dict[str, Any], parent: Any = None):
+        """Find the first element of each locator, storing them in `found`.
+
+        :param locators: Compiled locators by name.
+        :type locators: dict
+        :param found: Dictionary to store the found elements in by name.
+        :type found: dict
+        :param parent: Optional parent element to search child elements from.
+        :type parent: Any
+        """
+        root = parent or self._root()
+        use_cache = parent is None and self.snapshot is None
+        window = None
+        batch = {}
+        for name, locator in locators.items():
+            if not self._batchable(root, locator):
+                elements = self._find_elements(locator, True, parent)
+                found[name] = elements[0] if elements else None
+                continue
+            if use_cache:
+                self.element_cache.set_window(root)
+                element = self.element_cache.get(locator, self._matches)
+                if element is None and self.hints is not None:
+                    window = window or window_key(root)
+                    element = self._resolve_hint(root, locator, window)
+                if element is not None:
+                    found[name] = element
+                    continue
+            batch[name] = locator
+        if not batch:
+            return
+
+        # Elements of other types are skipped by the traversal when all the
+        # locators have the same type, and by each locator otherwise
+        control_types = {locator.control_type for locator in batch.values()}
+        control_type = control_types.pop() if len(control_types) == 1 else None
+        record = use_cache and self.hints is not None
+        if record:
+            self._paths = {}
+        try:
+            matches = self._match_batch(root, batch, control_type)
+            for name, element in matches.items():
+                found[name] = element
+                # Hint paths depend on the type the traversal was limited to
+                if record and batch[name].control_type == control_type:
+                    self._record_hint(element, batch[name], window)
+        finally:
+            self._paths = None
+        if use_cache:
+            for name, element in matches.items():
+                self._cache_element(batch[name], element)
+
+    def _batchable(self, root: Any, locator: Locator) -> bool:
+        """Check whether `locator` can be resolved by `_match_batch`."""
+        if self.snapshot is not None:
+            # Snapshot lookups use the index instead of traversing
+            return False
+        if locator.strategy == "class":
+            return not self._is_top(root)
+        return locator.strategy in _BATCH_RANKS
+
+    def _match_batch(
+        self, root: Any, locators: Dict[str, Locator], control_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Match all `locators` in one traversal of the elements under `root`.
+
+        Gives the same element for each locator as searching it on its own.
+        The properties of an element are read at most once, and only when
+        some locator still needs them.
+
+        :param root: Root element to search from.
+        :type root: Any
+        :param locators: Compiled locators by name.
+        :type locators: dict
+        :param control_type: Control type of all the locators, if they
+            have the same type.
+        :type control_type: str
+        :return: First matching element by name, for the locators that matched.
+        :rtype: dict
+        """
+        pending = dict(locators)
+        control_ids = {name: _control_id(locator.value) for name, locator in locators.items()}
+        found = {}
+        # Best lower priority match of default locators as (rank, element)
+        fallback = {}
+        for element in self._descendants(root, control_type):
+            properties = {}
+            for name, locator in list(pending.items()):
+                if locator.control_type != control_type:
+                    if "control_type" not in properties:
+                        properties["control_type"] = element_property(element, "control_type")
+                    if properties["control_type"] != locator.control_type:
+                        continue
+                limit = fallback[name][0] if name in fallback else len(_BATCH_RANKS["default"])
+                rank = self._batch_rank(element, locator, control_ids[name], properties, limit)
+                if rank is None:
+                    continue
+                if rank == 0:
+                    found[name] = element
+                    del pending[name]
+                    fallback.pop(name, None)
+                else:
+                    fallback[name] = (rank, element)
+            if not pending:
+                break
+        for name, (_, element) in fallback.items():
+            found[name] = element
+        return found
+
+    @staticmethod
+    def _batch_rank(
+        element: Any, locator: Locator, control_id: Any, properties: dict, limit: int
+    ) -> Optional[int]:
+        """Get the priority of `element` as a match of `locator`.
+
+        :return: 0 for a match that ends the search for the locator, a
+            higher rank below `limit` for a lower priority match of the
+            default strategy, or None if the element does not match.
+        :rtype: int or None
+        """
+        for rank, name in enumerate(_BATCH_RANKS[locator.strategy][:limit]):
+            if name not in properties:
+                properties[name] = element_property(element, name, "" if name == "name" else None)
+            value = properties[name]
+            if name == "automation_id" or name == "class_name":
+                matched = value == locator.value
+            elif name == "control_id":
+                matched = value == control_id
+            else:
+                matched = locator.regex.match(value) is not None
+            if matched:
+                return rank
+        return None
+
+    def _find_elements(
+        self,
+        locator: Locator,
+        first_only: bool = True,
+        parent: Any = None,
+    ) -> List[Any]:
+        """Internal method to find elements.
+
+        :param locator: Compiled locator to use when searching the element.
+        :type locator: Locator
         :param first_only: If True, return only the first matching element.
         :type first_only: bool
         :param parent: Optional parent element to search child elements from.
@@ -100,250 +496,494 @@ class ElementFinder:
         :return: List of found elements.
         :rtype: list
         """
-        # Parse locator to get strategy and value
-        strategy, value = self._parse_locator(locator)
-        
         # Determine the root element to search from
-        root = parent or self._get_root_element()
-        
+        root = parent or self._root()
+
+        # Reuse the element this locator resolved to earlier in the same window.
+        # Snapshots are searched without backend calls, so they need no cache.
+        # XPath results depend on where the element is in the tree, which
+        # cannot be checked on the element alone, so they are not cached.
+        use_cache = (
+            first_only and parent is None and self.snapshot is None and locator.strategy != "xpath"
+        )
+        window = None
+        if use_cache:
+            self.element_cache.set_window(root)
+            element = self.element_cache.get(locator, self._matches)
+            if element is None and self.hints is not None:
+                window = window_key(root)
+                element = self._resolve_hint(root, locator, window)
+            if element is not None:
+                return [element]
+
         # Find elements based on strategy
-        elements = self._find_by_strategy(root, strategy, value, control_type)
-        
-        return elements[:1] if first_only else elements
+        record = use_cache and self.hints is not None
+        if record:
+            self._paths = {}
+        try:
+            matches = self._iter_matches(root, locator)
+            if not first_only:
+                return list(matches)
+            element = next(matches, None)
+            if element is None:
+                return []
+            if record:
+                self._record_hint(element, locator, window)
+        finally:
+            self._paths = None
+        if use_cache:
+            self._cache_element(locator, element)
+        return [element]
+
+    def _cache_element(self, locator: Locator, element: Any):
+        """Store `element` found with `locator` in the element cache.
+
+        Default locators match by control ID or text only when no element
+        matches by automation ID, which cannot be checked on the cached
+        element alone, so only their matches by automation ID are cached.
+        """
+        if locator.strategy != "default" or _default_property(element, locator) == "automation_id":
+            self.element_cache.put(locator, element)
 
-    def _parse_locator(self, locator: str) -> tuple:
-        """Parse locator string to get strategy and value.
+    def _resolve_hint(self, root: Any, locator: Locator, window: str) -> Any:
+        """Find an element using the paths where `locator` was found earlier.
 
-        :param locator: Locator string to parse.
-        :type locator: str
-        :return: Tuple containing strategy and value.
-        :rtype: tuple
-        """
-        # Check for explicit strategy
-        strategy_separators = [":", "="]
-        for sep in strategy_separators:
-            if sep in locator:
-                strategy, value = locator.split(sep, 1)
-                return strategy.strip().lower(), value.strip()
-        
-        # Default strategy: auto_id, control_id, text
-        return "default", locator.strip()
-
-    def _get_root_element(self) -> Any:
-        """Get the root element to start searching from.
+        Each path hinted for the window is followed from `root` and the
+        element at its end is accepted after checking a single property.
+        Paths not leading to a matching element are skipped, and dropped
+        by the hint store after failing several times in a row.
 
-        :return: Root element.
+        :param root: Root element to search from.
+        :type root: Any
+        :param locator: Compiled locator.
+        :type locator: Locator
+        :param window: Key of the window, see `window_key`.
+        :type window: str
+        :return: Found element or None.
         :rtype: Any
         """
-        # For now, use the current active window
-        return self.ctx.app.top_window()
-
-    def _find_by_strategy(
+        key = _hint_key(locator)
+        for hint in self.hints.get(window, key):
+            if hint.strategy != locator.strategy:
+                continue
+            if self.search_depth is not None and len(hint.path) > self.search_depth:
+                continue
+            element = follow_path(root, hint.path, locator.control_type)
+            if element is not None and element_property(element, hint.property) == hint.value:
+                self.hints.hit(window, key, hint)
+                if locator.strategy != "default" or hint.property == "automation_id":
+                    self.element_cache.put(locator, element)
+                return element
+            self.hints.miss(window, key, hint)
+        return None
+
+    def _record_hint(self, element: Any, locator: Locator, window: str):
+        """Remember the path of `element` found by searching with `locator` in `window`."""
+        path = self._paths.get(id(element))
+        if path is None or path[0] is not element:
+            # Found without a descendant search, e.g. a top-level window
+            return
+        if locator.strategy == "default":
+            name = _default_property(element, locator)
+        else:
+            name = _HINT_PROPERTIES.get(locator.strategy)
+        if name is None:
+            return
+        value = element_property(element, name)
+        if value is None:
+            return
+        self.hints.put(window, _hint_key(locator), LocatorHint(locator.strategy, path[1], name, value))
+
+    def iter_elements(
         self,
-        root: Any,
-        strategy: str,
-        value: str,
+        locator: Union[str, Locator],
         control_type: Optional[str] = None,
-    ) -> List[Any]:
-        """Find elements based on the given strategy.
+        parent: Any = None,
+    ) -> Iterator[Any]:
+        """Iterate over elements currently matching the given locator.
 
-        :param root: Root element to search from.
-        :type root: Any
-        :param strategy: Locator strategy to use.
-        :type strategy: str
-        :param value: Locator value.
-        :type value: str
+        Elements are produced while the control tree is searched, so the
+        caller can stop as soon as it has seen enough. Unlike `find`, this
+        does not wait for elements to appear.
+
+        :param locator: Locator to use when searching the elements.
+        :type locator: str or Locator
         :param control_type: Limit searching only to these control types.
         :type control_type: str
-        :return: List of found elements.
-        :rtype: list
+        :param parent: Optional parent element to search child elements from.
+        :type parent: Any
+        :return: Iterator of matching elements.
+        :rtype: iterator
         """
-        strategies = {
-            "title": self._find_by_title,
-            "class": self._find_by_class,
-            "control_id": self._find_by_control_id,
-            "auto_id": self._find_by_auto_id,
-            "text": self._find_by_text,
-            "xpath": self._find_by_xpath,
-            "default": self._find_by_default,
-        }
+        compiled = self.compile(locator, control_type)
+        return self._iter_matches(parent or self.get_root_element(), compiled)
 
-        finder = strategies.get(strategy, self._find_by_default)
-        return finder(root, value, control_type)
+    def _iter_matches(self, root: Any, locator: Locator) -> Iterator[Any]:
+        """Iterate over elements under `root` matching `locator`.
 
-    def _find_by_title(
-        self, root: Any, value: str, control_type: Optional[str] = None
+        :param root: Root element to search from.
+        :type root: Any
+        :param locator: Compiled locator.
+        :type locator: Locator
+        :return: Iterator of matching elements.
+        :rtype: iterator
+        """
+        if self.snapshot is not None and root is self.snapshot.root:
+            matches = self._find_in_index(self.snapshot.index, locator)
+            if matches is not None:
+                return iter(matches)
+        finder = self._strategies.get(locator.strategy, self._find_by_default)
+        return finder(root, locator)
+
+    def _find_in_index(self, index: SnapshotIndex, locator: Locator) -> Optional[List[Any]]:
+        """Find elements of the active snapshot using its lookup tables.
+
+        Gives the same results as searching the snapshot element by element,
+        including the search depth and order.
+
+        :param index: Index of the active snapshot.
+        :type index: SnapshotIndex
+        :param locator: Compiled locator.
+        :type locator: Locator
+        :return: Matching elements, or None if the strategy cannot use the index.
+        :rtype: list or None
+        """
+        strategy, value = locator.strategy, locator.value
+        if strategy == "fuzzy":
+            ranked = [node for node, _ in index.trigrams.search(value, self.fuzzy_threshold)]
+            return self._in_scope(index, locator, ranked, keep_order=True)
+        if strategy == "auto_id":
+            return self._in_scope(index, locator, index.lookup("automation_id", value))
+        if strategy == "control_id":
+            return self._in_scope(index, locator, index.lookup("control_id", _control_id(value)))
+        if strategy == "class" and not self._is_top(self.snapshot.root):
+            # From the top window, class locators match top-level windows instead
+            return self._in_scope(index, locator, index.lookup("class_name", value))
+        if strategy == "text":
+            return self._in_scope(index, locator, self._find_in_title_index(index, locator))
+        if strategy == "default":
+            return (self._in_scope(index, locator, index.lookup("automation_id", value))
+                    or self._in_scope(index, locator, index.lookup("control_id", _control_id(value)))
+                    or self._in_scope(index, locator, self._find_in_title_index(index, locator)))
+        return None
+
+    def _in_scope(
+        self, index: SnapshotIndex, locator: Locator, nodes: List[Any], keep_order: bool = False
     ) -> List[Any]:
-        """Find elements by title.
+        """Limit indexed matches to the search depth and order them like a search would."""
+        if self.search_depth is not None:
+            nodes = [node for node in nodes if node.depth <= self.search_depth]
+        if self.search_order == BREADTH_FIRST and not keep_order:
+            nodes = sorted(nodes, key=lambda node: (node.depth, node.order))
+        if locator.control_type:
+            nodes = index.restrict(nodes, "control_type", locator.control_type)
+        return nodes
+
+    def _find_in_title_index(self, index: SnapshotIndex, locator: Locator) -> List[Any]:
+        candidates = index.prefix(literal_prefix(locator.value))
+        return [node for node in candidates if locator.regex.match(element_property(node, "name", ""))]
+
+    def get_root_element(self) -> Any:
+        """Get the root element to start searching from.
+
+        When a snapshot is active, this is the root of the snapshot.
+        Otherwise the current top window is resolved again.
+
+        :return: Root element.
+        :rtype: Any
+        """
+        self._top_window = None
+        return self._root()
+
+    def _root(self) -> Any:
+        """Get the root element, resolving the top window once per attempt."""
+        if self.snapshot is not None:
+            return self.snapshot.root
+        if self._top_window is None:
+            # For now, use the current active window
+            window = self.ctx.app.top_window()
+            # Resolve window specifications once instead of on every attribute access
+            wrapper_object = getattr(window, "wrapper_object", None)
+            self._top_window = wrapper_object() if callable(wrapper_object) else window
+        return self._top_window
+
+    def _is_top(self, root: Any) -> bool:
+        """Check whether `root` is the top window, live or in the active snapshot."""
+        if self.snapshot is not None:
+            return self._snapshot_of_top and root is self.snapshot.root
+        return root is self._top_window
+
+    def _matches(self, element: Any, locator: Locator) -> bool:
+        """Check that a previously resolved element still matches `locator`.
+
+        :param element: Element to check.
+        :type element: Any
+        :param locator: Compiled locator.
+        :type locator: Locator
+        :return: True if the element matches the locator.
+        :rtype: bool
+        """
+        if not is_control_type(element, locator.control_type):
+            return False
+        strategy = locator.strategy
+        # Only matches of default locators by automation ID are cached
+        if strategy in ("auto_id", "default"):
+            return element_property(element, "automation_id") == locator.value
+        if strategy == "control_id":
+            control_id = element_property(element, "control_id")
+            return control_id is not None and str(control_id) == locator.value
+        if strategy in ("text", "title"):
+            name = element_property(element, "name", "")
+            return bool(locator.regex.match(name)) or (strategy == "title" and locator.value in name)
+        if strategy == "class":
+            return element_property(element, "class_name") == locator.value
+        if strategy == "fuzzy":
+            name = trigrams(element_property(element, "name", ""))
+            return similarity(name, trigrams(locator.value)) >= self.fuzzy_threshold
+        return False
+
+    def _descendants(self, root: Any, control_type: Optional[str] = None) -> Iterator[Any]:
+        """Iterate over the elements under `root` within the search depth.
 
         :param root: Root element to search from.
         :type root: Any
-        :param value: Title value to match.
-        :type value: str
-        :param control_type: Limit searching only to these control types.
+        :param control_type: Iterate only over elements of this control type.
         :type control_type: str
-        :return: List of found elements.
-        :rtype: list
+        :return: Iterator of elements in the configured search order.
+        :rtype: iterator
         """
-        try:
-            # For window elements, use window title
-            if hasattr(self.ctx.app, 'windows'):
-                # Search for windows with the given title
-                windows = self.ctx.app.windows(title_re=value)
-                if windows:
-                    return windows
-                # If no exact match, try finding all windows and check manually
-                all_windows = self.ctx.app.windows()
-                for window in all_windows:
-                    try:
-                        if value in window.window_text():
-                            return [window]
-                    except Exception:
-                        continue
-            return []
-        except Exception as e:
-            print(f"Error in _find_by_title: {e}")
-            return []
+        if self._paths is not None:
+            return self._recorded_descendants(root, control_type)
+        return iter_descendants(root, self.search_depth, self.search_order, control_type)
+
+    def _recorded_descendants(self, root: Any, control_type: Optional[str] = None) -> Iterator[Any]:
+        """Iterate like `_descendants` and record the path of each element."""
+        paths = self._paths
+        for path, element in iter_descendant_paths(
+            root, self.search_depth, self.search_order, control_type
+        ):
+            paths[id(element)] = (element, path)
+            yield element
+
+    def _find_by_title(self, root: Any, locator: Locator) -> Iterator[Any]:
+        """Find top-level windows by title.
+
+        The title is used as a regular expression matched against the
+        beginning of the window titles. If no window matches, the first
+        window whose title contains the value is used.
 
-    def _find_by_class(
-        self, root: Any, value: str, control_type: Optional[str] = None
-    ) -> List[Any]:
+        :param root: Root element to search from.
+        :type root: Any
+        :param locator: Compiled locator with the title to match.
+        :type locator: Locator
+        :return: Iterator of found elements.
+        :rtype: iterator
+        """
+        try:
+            windows = self.window_cache.windows(self.ctx.app)
+        except Exception as error:
+            logger.debug(f"Listing windows for locator '{locator}' failed: {error}")
+            return
+        windows = [entry for entry in windows if is_control_type(entry.window, locator.control_type)]
+        matches = [entry.window for entry in windows if locator.regex.match(entry.title)]
+        if matches:
+            yield from matches
+            return
+        # If no exact match, check the titles manually
+        for entry in windows:
+            if locator.value in entry.title:
+                yield entry.window
+                return
+
+    def _find_by_class(self, root: Any, locator: Locator) -> Iterator[Any]:
         """Find elements by class name.
 
+        When searching from the top window, top-level windows of the
+        application are matched instead of its descendants.
+
         :param root: Root element to search from.
         :type root: Any
-        :param value: Class name to match.
-        :type value: str
-        :param control_type: Limit searching only to these control types.
-        :type control_type: str
-        :return: List of found elements.
-        :rtype: list
+        :param locator: Compiled locator with the class name to match.
+        :type locator: Locator
+        :return: Iterator of found elements.
+        :rtype: iterator
         """
         try:
-            if root == self.ctx.app.top_window():
+            if self._is_top(root):
                 # Search for windows with the given class name
-                windows = self.ctx.app.windows(class_name=value)
-                return windows
+                windows = self.window_cache.windows(self.ctx.app)
+                for entry in windows:
+                    if entry.class_name == locator.value and is_control_type(entry.window, locator.control_type):
+                        yield entry.window
             else:
                 # Search for child elements with the given class name
-                elements = root.children(class_name=value)
-                return elements
+                for element in self._descendants(root, locator.control_type):
+                    if element_property(element, "class_name") == locator.value:
+                        yield element
         except Exception:
-            return []
+            return
 
-    def _find_by_control_id(
-        self, root: Any, value: str, control_type: Optional[str] = None
-    ) -> List[Any]:
+    def _find_by_control_id(self, root: Any, locator: Locator) -> Iterator[Any]:
         """Find elements by control ID.
 
         :param root: Root element to search from.
         :type root: Any
-        :param value: Control ID to match.
-        :type value: str
-        :param control_type: Limit searching only to these control types.
-        :type control_type: str
-        :return: List of found elements.
-        :rtype: list
+        :param locator: Compiled locator with the control ID to match.
+        :type locator: Locator
+        :return: Iterator of found elements.
+        :rtype: iterator
         """
-        try:
-            # Convert control ID to integer if possible
-            try:
-                control_id = int(value)
-            except ValueError:
-                control_id = value
-            
-            elements = root.children(control_id=control_id)
-            return elements
-        except Exception:
-            return []
+        control_id = _control_id(locator.value)
+        for element in self._descendants(root, locator.control_type):
+            if element_property(element, "control_id") == control_id:
+                yield element
 
-    def _find_by_auto_id(
-        self, root: Any, value: str, control_type: Optional[str] = None
-    ) -> List[Any]:
+    def _find_by_auto_id(self, root: Any, locator: Locator) -> Iterator[Any]:
         """Find elements by automation ID.
 
         :param root: Root element to search from.
         :type root: Any
-        :param value: Automation ID to match.
-        :type value: str
-        :param control_type: Limit searching only to these control types.
-        :type control_type: str
-        :return: List of found elements.
-        :rtype: list
+        :param locator: Compiled locator with the automation ID to match.
+        :type locator: Locator
+        :return: Iterator of found elements.
+        :rtype: iterator
         """
-        try:
-            elements = root.children(auto_id=value)
-            return elements
-        except Exception:
-            return []
+        for element in self._descendants(root, locator.control_type):
+            if element_property(element, "automation_id") == locator.value:
+                yield element
 
-    def _find_by_text(
-        self, root: Any, value: str, control_type: Optional[str] = None
-    ) -> List[Any]:
+    def _find_by_text(self, root: Any, locator: Locator) -> Iterator[Any]:
         """Find elements by text.
 
+        The locator value is used as a regular expression matched against
+        the beginning of the element name.
+
         :param root: Root element to search from.
         :type root: Any
-        :param value: Text to match.
-        :type value: str
-        :param control_type: Limit searching only to these control types.
-        :type control_type: str
-        :return: List of found elements.
-        :rtype: list
+        :param locator: Compiled locator with the text pattern to match.
+        :type locator: Locator
+        :return: Iterator of found elements.
+        :rtype: iterator
         """
-        try:
-            elements = root.children(title_re=value)
-            return elements
-        except Exception:
-            return []
+        for element in self._descendants(root, locator.control_type):
+            if locator.regex.match(element_property(element, "name", "")):
+                yield element
 
-    def _find_by_xpath(
-        self, root: Any, value: str, control_type: Optional[str] = None
-    ) -> List[Any]:
+    def _find_by_xpath(self, root: Any, locator: Locator) -> Iterator[Any]:
         """Find elements by XPath.
 
         :param root: Root element to search from.
         :type root: Any
-        :param value: XPath expression.
-        :type value: str
-        :param control_type: Limit searching only to these control types.
-        :type control_type: str
-        :return: List of found elements.
-        :rtype: list
+        :param locator: Compiled locator with the XPath expression.
+        :type locator: Locator
+        :return: Iterator of found elements.
+        :rtype: iterator
         """
-        try:
-            # pywinauto doesn't support XPath directly, but we can use its own backend
-            # For now, we'll just return an empty list
-            return []
-        except Exception:
-            return []
+        elements = locator.xpath.iter(root)
+        if not locator.control_type:
+            return elements
+        return (element for element in elements if is_control_type(element, locator.control_type))
 
-    def _find_by_default(
-        self, root: Any, value: str, control_type: Optional[str] = None
-    ) -> List[Any]:
+    def _find_by_fuzzy(self, root: Any, locator: Locator) -> Iterator[Any]:
+        """Find elements whose name is similar to the locator value.
+
+        Names are compared by their character trigrams, so small typos and
+        differences in case or spacing still match. Elements are produced
+        from the most similar to the least similar, and equally similar
+        elements in search order.
+
+        :param root: Root element to search from.
+        :type root: Any
+        :param locator: Compiled locator with the approximate name.
+        :type locator: Locator
+        :return: Iterator of found elements.
+        :rtype: iterator
+        """
+        index = TrigramIndex(
+            (element, element_property(element, "name", ""))
+            for element in self._descendants(root, locator.control_type)
+        )
+        for element, _ in index.search(locator.value, self.fuzzy_threshold):
+            yield element
+
+    def _find_by_default(self, root: Any, locator: Locator) -> Iterator[Any]:
         """Find elements using the default strategy.
 
         Default strategy tries to find elements by auto_id, control_id, or text in that order.
+        All three are checked in a single pass over the elements, and the
+        properties of an element are read only while they can still change
+        the result. Matches by auto_id are produced as soon as they are
+        found, lower priority matches only once the search is complete.
 
         :param root: Root element to search from.
         :type root: Any
-        :param value: Value to match.
-        :type value: str
-        :param control_type: Limit searching only to these control types.
-        :type control_type: str
-        :return: List of found elements.
-        :rtype: list
+        :param locator: Compiled locator with the value to match.
+        :type locator: Locator
+        :return: Iterator of found elements.
+        :rtype: iterator
         """
-        # Try auto_id first
-        elements = self._find_by_auto_id(root, value, control_type)
-        if elements:
-            return elements
-        
-        # Try control_id next
-        elements = self._find_by_control_id(root, value, control_type)
-        if elements:
-            return elements
-        
-        # Try text last
-        elements = self._find_by_text(root, value, control_type)
-        return elements
+        control_id = _control_id(locator.value)
+        found_by_auto_id = False
+        by_control_id, by_text = [], []
+        for element in self._descendants(root, locator.control_type):
+            if element_property(element, "automation_id") == locator.value:
+                found_by_auto_id = True
+                yield element
+                continue
+            if found_by_auto_id:
+                continue
+            if element_property(element, "control_id") == control_id:
+                by_control_id.append(element)
+                continue
+            if by_control_id:
+                continue
+            if locator.regex.match(element_property(element, "name", "")):
+                by_text.append(element)
+        if not found_by_auto_id:
+            yield from by_control_id or by_text
+
+
+# Property checked when following a hint, by locator strategy. Hints of
+# the default strategy check the property the element was found by.
+_HINT_PROPERTIES = {
+    "auto_id": "automation_id",
+    "control_id": "control_id",
+    "text": "name",
+    "class": "class_name",
+    "fuzzy": "name",
+}
+
+
+# Properties compared by the locators resolved in a single traversal, in
+# priority order. Only the default strategy has lower priority matches.
+_BATCH_RANKS = {
+    "auto_id": ("automation_id",),
+    "control_id": ("control_id",),
+    "text": ("name",),
+    "class": ("class_name",),
+    "default": ("automation_id", "control_id", "name"),
+}
+
+
+def _hint_key(locator: Locator) -> str:
+    """Key of the hints of `locator`."""
+    if locator.control_type:
+        return f"{locator.raw}|{locator.control_type}"
+    return locator.raw
+
+
+def _default_property(element: Any, locator: Locator) -> str:
+    """Property `element` was found by with the default strategy `locator`."""
+    if element_property(element, "automation_id") == locator.value:
+        return "automation_id"
+    if element_property(element, "control_id") == _control_id(locator.value):
+        return "control_id"
+    return "name"
+
+
+def _control_id(value: str) -> Any:
+    """Convert a control ID locator value to an integer if possible."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
@@ -0,0 +1,110 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Get the character trigrams of `text`.
+
+    Text is compared case-insensitively, with punctuation such as the dots
+    of `Save As...` and runs of whitespace treated as a single space. It is
+    padded so that words also produce trigrams for their first letters.
+
+    :param text: Text to split.
+    :type text: str
+    :return: Set of trigrams.
+    :rtype: frozenset
+    """
+    normalized = _SEPARATORS.sub(" ", text.lower()).strip()
+    if not normalized:
+        return frozenset()
+    padded = f"  {normalized} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def similarity(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    """Dice coefficient of two trigram sets, from 0.0 to 1.0."""
+    if not first or not second:
+        return 0.0
+    return 2.0 * len(first & second) / (len(first) + len(second))
+
+
+class TrigramIndex:
+    """Inverted index from character trigrams to texts of elements.
+
+    Only elements sharing at least one trigram with the query are scored,
+    so searching does not compare the query against every element.
+
+    :param entries: Pairs of element and its text, in document order.
+    :type entries: iterable
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Any, str]]):
+        self._elements: List[Any] = []
+        self._trigrams: List[FrozenSet[str]] = []
+        self._postings: Dict[str, List[int]] = {}
+        for element, text in entries:
+            grams = trigrams(text or "")
+            position = len(self._elements)
+            self._elements.append(element)
+            self._trigrams.append(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def search(self, query: str, threshold: float = 0.5) -> List[Tuple[Any, float]]:
+        """Get the elements whose text is similar to `query`.
+
+        :param query: Text to look for.
+        :type query: str
+        :param threshold: Lowest accepted similarity from 0.0 to 1.0.
+        :type threshold: float
+        :return: Pairs of element and similarity, most similar first. Equally
+            similar elements are in document order.
+        :rtype: list
+        """
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+        # A text sharing `shared` trigrams with the query has a similarity of
+        # at most 2 * shared / (len(query) + shared), so it has to share at
+        # least `needed` trigrams. Texts sharing none of the rarest
+        # len(query) - needed + 1 trigrams cannot be similar enough, and the
+        # common trigrams are only counted for the remaining candidates.
+        grams = sorted(query_grams, key=lambda gram: (len(self._postings.get(gram, ())), gram))
+        needed = max(1, math.ceil(threshold * len(grams) / (2 - threshold) - 1e-9))
+        selective = len(grams) - needed + 1
+        shared: Dict[int, int] = {}
+        for gram in grams[:selective]:
+            for position in self._postings.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+        common = frozenset(grams[selective:])
+        if common:
+            for position in shared:
+                shared[position] += len(self._trigrams[position] & common)
+        results = []
+        for position, count in shared.items():
+            score = 2.0 * count / (len(query_grams) + len(self._trigrams[position]))
+            if score >= threshold:
+                results.append((-score, position))
+        results.sort()
+        return [(self._elements[position], -score) for score, position in results]
+
+    def __len__(self) -> int:
+        return len(self._elements)
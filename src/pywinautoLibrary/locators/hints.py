@@ -0,0 +1,217 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .properties import element_property
+
+
+HINTS_FILE = "pywinauto-locator-hints.json"
+
+
+def window_key(window: Any) -> str:
+    """Get an identity of `window` that is the same across runs.
+
+    :param window: Window the hints are followed from.
+    :type window: Any
+    :return: Class name and title of the window.
+    :rtype: str
+    """
+    return f"{element_property(window, 'class_name', '')}|{element_property(window, 'name', '')}"
+
+
+class LocatorHint(NamedTuple):
+    """Where a locator resolved to in an earlier search.
+
+    `path` has the indexes of the children to follow from the window, and
+    the element at the end of the path is accepted when its property
+    `property` still has the value `value`.
+    """
+
+    strategy: str
+    path: Tuple[int, ...]
+    property: str
+    value: Any
+
+
+class LocatorHints:
+    """Locator resolution hints persisted across runs.
+
+    Hints are loaded from the store file when first needed and written
+    back by `save`. Hints are kept per window and locator, so a locator
+    used in more than one window has separate hints for each of them, and
+    each window and locator keeps a few hints, most recently used first.
+
+    A hint that does not lead to a matching element is kept, as the
+    element may not have appeared yet, and is dropped only after failing
+    `max_misses` times in a row.
+
+    :param path: Path to the store file, or a callable returning it when
+        the store is first used. None keeps the hints only in memory.
+    :type path: str or callable
+    :param maxsize: Maximum number of windows and locators to keep hints for.
+    :type maxsize: int
+    :param per_locator: Maximum number of hints per window and locator.
+    :type per_locator: int
+    :param max_misses: Number of failures in a row after which a hint is
+        dropped.
+    :type max_misses: int
+    """
+
+    VERSION = 2
+
+    def __init__(
+        self,
+        path: Union[str, Callable[[], str], None] = None,
+        maxsize: int = 4096,
+        per_locator: int = 3,
+        max_misses: int = 3,
+    ):
+        self._path = path
+        self.maxsize = maxsize
+        self.per_locator = per_locator
+        self.max_misses = max_misses
+        self._hints: Optional[OrderedDict] = None
+        # Failures in a row of hints, not persisted
+        self._misses: Dict[Tuple[Tuple[str, str], LocatorHint], int] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.mismatches = 0
+
+    @property
+    def path(self) -> Optional[str]:
+        """Path to the store file or None."""
+        if callable(self._path):
+            self._path = self._path()
+        return self._path
+
+    def get(self, window: str, key: str) -> List[LocatorHint]:
+        """Get the hints for `key` in `window`, most recently used first.
+
+        :param window: Window key, see `window_key`.
+        :type window: str
+        :param key: Locator key.
+        :type key: str
+        :return: Hints, empty if there are none.
+        :rtype: list
+        """
+        hints = self._load().get((window, key))
+        if not hints:
+            self.misses += 1
+            return []
+        return list(hints)
+
+    def hit(self, window: str, key: str, hint: LocatorHint):
+        """Record that `hint` resolved `key` in `window`."""
+        self.hits += 1
+        self._misses.pop(((window, key), hint), None)
+        hints = self._load()[(window, key)]
+        if hints[0] != hint:
+            hints.remove(hint)
+            hints.insert(0, hint)
+            self._dirty = True
+
+    def miss(self, window: str, key: str, hint: LocatorHint):
+        """Record that `hint` did not resolve `key` in `window`.
+
+        The hint is dropped after `max_misses` failures in a row.
+        """
+        self.mismatches += 1
+        store_key = (window, key)
+        misses = self._misses.get((store_key, hint), 0) + 1
+        if misses < self.max_misses:
+            self._misses[(store_key, hint)] = misses
+            return
+        self._misses.pop((store_key, hint), None)
+        hints = self._load().get(store_key, [])
+        if hint in hints:
+            hints.remove(hint)
+            self._dirty = True
+
+    def put(self, window: str, key: str, hint: LocatorHint):
+        """Store `hint` as the most recent hint for `key` in `window`."""
+        store = self._load()
+        store_key = (window, key)
+        self._misses.pop((store_key, hint), None)
+        hints = store.get(store_key, [])
+        if hint in hints:
+            hints.remove(hint)
+        store[store_key] = [hint] + hints[:self.per_locator - 1]
+        store.move_to_end(store_key)
+        if len(store) > self.maxsize:
+            store.popitem(last=False)
+        self._dirty = True
+
+    def save(self):
+        """Write the hints to the store file if they changed."""
+        if not self._dirty or not self.path:
+            return
+        data = {
+            "version": self.VERSION,
+            "hints": [
+                [window, key, [[hint.strategy, list(hint.path), hint.property, hint.value] for hint in hints]]
+                for (window, key), hints in self._hints.items() if hints
+            ],
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temporary, self.path)
+        self._dirty = False
+
+    def _load(self) -> OrderedDict:
+        if self._hints is not None:
+            return self._hints
+        self._hints = OrderedDict()
+        path = self.path
+        if not path or not os.path.exists(path):
+            return self._hints
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") == self.VERSION:
+                for window, key, hints in data["hints"]:
+                    self._hints[(window, key)] = [
+                        LocatorHint(strategy, tuple(path), name, value)
+                        for strategy, path, name, value in hints
+                    ]
+        except (OSError, ValueError, TypeError, KeyError):
+            # A damaged store only means searching without hints
+            self._hints.clear()
+        return self._hints
+
+    @property
+    def statistics(self) -> dict:
+        """Hint statistics.
+
+        :return: Dictionary with `hits`, `misses`, `mismatches`, `size`
+            and `path`.
+        :rtype: dict
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "mismatches": self.mismatches,
+            "size": len(self._load()),
+            "path": self.path,
+        }
+
+    def __len__(self) -> int:
+        return len(self._load())
@@ -0,0 +1,178 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Pattern
+
+from .xpath import XPath
+
+
+STRATEGIES = ("title", "class", "control_id", "auto_id", "text", "xpath", "fuzzy", "default")
+
+_STRATEGY_PREFIX = re.compile(r"^\s*([A-Za-z_]+)\s*[:=](.*)$", re.DOTALL)
+
+CONTROL_TYPES = (
+    "AppBar", "Button", "Calendar", "CheckBox", "ComboBox", "Custom", "DataGrid",
+    "DataItem", "Document", "Edit", "Group", "Header", "HeaderItem", "Hyperlink",
+    "Image", "List", "ListItem", "Menu", "MenuBar", "MenuItem", "Pane", "ProgressBar",
+    "RadioButton", "ScrollBar", "SemanticZoom", "Separator", "Slider", "Spinner",
+    "SplitButton", "StatusBar", "Tab", "TabItem", "Table", "Text", "Thumb", "TitleBar",
+    "ToolBar", "ToolTip", "Tree", "TreeItem", "Window",
+)
+
+_CONTROL_TYPE_PREFIX = re.compile(r"^\s*([A-Za-z]+)#(.*)$", re.DOTALL)
+_CONTROL_TYPE_NAMES = {control_type.lower(): control_type for control_type in CONTROL_TYPES}
+
+
+def _compile_regex(value: str) -> Pattern:
+    """Compile `value` as a regular expression.
+
+    Values which are not valid regular expressions are matched literally.
+
+    :param value: Pattern to compile.
+    :type value: str
+    :return: Compiled pattern.
+    :rtype: re.Pattern
+    """
+    try:
+        return re.compile(value)
+    except re.error:
+        return re.compile(re.escape(value))
+
+
+class Locator(NamedTuple):
+    """Compiled, immutable representation of a locator string.
+
+    Locators are parsed once by `Locator.parse` and can then be evaluated
+    any number of times without re-parsing the original string.
+    """
+
+    raw: str
+    strategy: str
+    value: str
+    regex: Optional[Pattern]
+    control_type: Optional[str] = None
+    xpath: Optional[XPath] = None
+
+    @classmethod
+    def parse(cls, locator: str, control_type: Optional[str] = None) -> "Locator":
+        """Parse locator string into a compiled locator.
+
+        Locators have the form `strategy:value` or `strategy=value` where
+        strategy is one of the supported strategies. Anything else uses the
+        default strategy with the whole locator as the value.
+
+        A control type followed by `#` limits the locator to elements of
+        that type, e.g. `Button#auto_id:OkButton` or `Edit#Name`. Only UIA
+        control type names are recognized, so other values containing `#`
+        are not affected. A `control_type` argument overrides the type in
+        the locator.
+
+        :param locator: Locator string to parse.
+        :type locator: str
+        :param control_type: Limit matching only to this control type.
+        :type control_type: str
+        :return: Compiled locator.
+        :rtype: Locator
+        :raises pywinautoLibrary.errors.InvalidLocator: If the locator uses
+            invalid XPath syntax.
+        """
+        body = locator
+        match = _CONTROL_TYPE_PREFIX.match(locator)
+        if match and match.group(1).lower() in _CONTROL_TYPE_NAMES:
+            control_type = control_type or _CONTROL_TYPE_NAMES[match.group(1).lower()]
+            body = match.group(2)
+        strategy, value = "default", body.strip()
+        match = _STRATEGY_PREFIX.match(body)
+        if match and match.group(1).lower() in STRATEGIES:
+            strategy, value = match.group(1).lower(), match.group(2).strip()
+        if strategy == "xpath":
+            return cls(locator, strategy, value, None, control_type or None, XPath(value))
+        return cls(locator, strategy, value, _compile_regex(value), control_type or None)
+
+    def restrict(self, control_type: Optional[str]) -> "Locator":
+        """Return a copy of this locator limited to `control_type`.
+
+        :param control_type: Control type to limit matching to. If empty,
+            the locator is returned as is.
+        :type control_type: str
+        :return: Restricted locator.
+        :rtype: Locator
+        """
+        if not control_type or control_type == self.control_type:
+            return self
+        return self._replace(control_type=control_type)
+
+    def __str__(self) -> str:
+        return self.raw
+
+
+class LocatorCache:
+    """Bounded LRU cache of compiled locators keyed by the locator string."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the locator cache.
+
+        :param maxsize: Maximum number of compiled locators to keep.
+        :type maxsize: int
+        """
+        self.maxsize = maxsize
+        self._locators = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, locator: str) -> Locator:
+        """Get the compiled locator for `locator`, compiling it when needed.
+
+        :param locator: Locator string.
+        :type locator: str
+        :return: Compiled locator.
+        :rtype: Locator
+        """
+        try:
+            compiled = self._locators[locator]
+        except KeyError:
+            self.misses += 1
+            compiled = Locator.parse(locator)
+            self._locators[locator] = compiled
+            if len(self._locators) > self.maxsize:
+                self._locators.popitem(last=False)
+            return compiled
+        self.hits += 1
+        self._locators.move_to_end(locator)
+        return compiled
+
+    def clear(self):
+        """Remove all compiled locators and reset the counters."""
+        self._locators.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def statistics(self) -> dict:
+        """Cache statistics.
+
+        :return: Dictionary with `hits`, `misses`, `size` and `maxsize`.
+        :rtype: dict
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._locators),
+            "maxsize": self.maxsize,
+        }
+
+    def __len__(self) -> int:
+        return len(self._locators)
@@ -0,0 +1,48 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Optional
+
+
+def element_property(element: Any, name: str, default: Any = None) -> Any:
+    """Read property `name` from the element info of `element`.
+
+    :param element: pywinauto wrapper or element info.
+    :type element: Any
+    :param name: Element info property such as `name` or `automation_id`.
+    :type name: str
+    :param default: Value to return when the property is missing or empty.
+    :type default: Any
+    :return: Property value.
+    :rtype: Any
+    """
+    info = getattr(element, "element_info", element)
+    try:
+        value = getattr(info, name)
+    except Exception:
+        return default
+    return default if value is None else value
+
+
+def is_control_type(element: Any, control_type: Optional[str]) -> bool:
+    """Check that `element` is of `control_type`.
+
+    :param element: pywinauto wrapper or element info.
+    :type element: Any
+    :param control_type: Control type such as `Button`. None accepts any type.
+    :type control_type: str
+    :return: True if the element is of the type or no type is given.
+    :rtype: bool
+    """
+    return not control_type or element_property(element, "control_type") == control_type
@@ -0,0 +1,346 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Immutable snapshots of the control tree.
+
+A snapshot captures a whole subtree together with a declared set of element
+properties. With the UIA backend the subtree is fetched using a single
+cache request, so evaluating locators against the snapshot does not make
+any cross-process calls. Other backends read each property once while the
+snapshot is taken.
+
+Snapshot nodes expose the same interface as pywinauto wrappers. Properties
+come from the snapshot, anything else, such as clicking or typing, is
+forwarded to the live element.
+"""
+
+import time
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+
+from .properties import element_property
+from .snapshotindex import SnapshotIndex
+
+
+SNAPSHOT_PROPERTIES = (
+    "name",
+    "automation_id",
+    "control_id",
+    "class_name",
+    "control_type",
+    "handle",
+    "runtime_id",
+    "enabled",
+    "visible",
+    "rectangle",
+)
+
+_UIA_PROPERTY_IDS = {
+    "name": "UIA_NamePropertyId",
+    "automation_id": "UIA_AutomationIdPropertyId",
+    "class_name": "UIA_ClassNamePropertyId",
+    "control_type": "UIA_ControlTypePropertyId",
+    "handle": "UIA_NativeWindowHandlePropertyId",
+    "runtime_id": "UIA_RuntimeIdPropertyId",
+    "enabled": "UIA_IsEnabledPropertyId",
+    "visible": "UIA_IsOffscreenPropertyId",
+    "rectangle": "UIA_BoundingRectanglePropertyId",
+}
+
+
+def parse_snapshot_properties(properties: Union[str, Iterable[str], None]) -> tuple:
+    """Normalize the property set of a snapshot.
+
+    :param properties: Property names as an iterable or a comma separated
+        string. None means all of `SNAPSHOT_PROPERTIES`.
+    :type properties: str, list or None
+    :return: Property names.
+    :rtype: tuple
+    :raises ValueError: If a property is not supported.
+    """
+    if properties is None:
+        return SNAPSHOT_PROPERTIES
+    if isinstance(properties, str):
+        properties = properties.split(",")
+    names = tuple(name.strip() for name in properties if name.strip())
+    for name in names:
+        if name not in SNAPSHOT_PROPERTIES:
+            raise ValueError(
+                f"Snapshot property must be one of {', '.join(SNAPSHOT_PROPERTIES)}, got '{name}'."
+            )
+    # Control IDs are derived from window handles
+    if "control_id" in names and "handle" not in names:
+        names += ("handle",)
+    return names or SNAPSHOT_PROPERTIES
+
+
+class SnapshotElementInfo:
+    """Element info whose properties were captured in a snapshot.
+
+    Properties outside the captured set are read from the live element.
+    """
+
+    def __init__(self, values: dict, live: Any = None, live_factory: Optional[Callable] = None):
+        self._values = values
+        self._live = live
+        self._live_factory = live_factory
+
+    @property
+    def live(self) -> Any:
+        """Element info of the live element, created on first use."""
+        if self._live is None and self._live_factory is not None:
+            self._live = self._live_factory()
+        return self._live
+
+    def __getattr__(self, name: str) -> Any:
+        values = self.__dict__.get("_values")
+        if values is None or name.startswith("__"):
+            raise AttributeError(name)
+        if name in values:
+            return values[name]
+        return getattr(self.live, name)
+
+
+class SnapshotNode:
+    """Node of a snapshot exposing the pywinauto wrapper interface."""
+
+    def __init__(self, element_info: SnapshotElementInfo, wrapper: Any = None,
+                 wrapper_factory: Optional[Callable] = None):
+        self.element_info = element_info
+        self.parent = None
+        self.depth = 0
+        self.order = 0
+        self._children = []
+        self._wrapper = wrapper
+        self._wrapper_factory = wrapper_factory
+
+    @property
+    def wrapper(self) -> Any:
+        """Live pywinauto wrapper of the element, created on first use."""
+        if self._wrapper is None and self._wrapper_factory is not None:
+            self._wrapper = self._wrapper_factory()
+        return self._wrapper
+
+    def children(self, **criteria) -> List["SnapshotNode"]:
+        children = self._children
+        for name in ("control_type", "class_name"):
+            value = criteria.get(name)
+            if value:
+                children = [child for child in children if element_property(child, name) == value]
+        return list(children)
+
+    def window_text(self) -> str:
+        return element_property(self, "name", "")
+
+    def class_name(self) -> str:
+        return element_property(self, "class_name", "")
+
+    def control_id(self) -> Any:
+        return element_property(self, "control_id")
+
+    def is_enabled(self) -> bool:
+        return bool(self.element_info.enabled)
+
+    def is_visible(self) -> bool:
+        return bool(self.element_info.visible)
+
+    def rectangle(self) -> Any:
+        return self.element_info.rectangle
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.wrapper, name)
+
+    def __repr__(self) -> str:
+        control_type = element_property(self, "control_type", "")
+        label = element_property(self, "automation_id") or element_property(self, "name", "")
+        return f"<SnapshotNode {control_type} {label!r}>"
+
+
+class UISnapshot:
+    """Immutable capture of a subtree of the control tree.
+
+    :param root: Root node of the captured subtree.
+    :type root: SnapshotNode
+    :param properties: Captured property names.
+    :type properties: tuple
+    :param source: Live element the snapshot was taken from.
+    :type source: Any
+    :param requests: Number of backend requests used to take the snapshot,
+        or None if not known.
+    :type requests: int
+    """
+
+    def __init__(self, root: SnapshotNode, properties: tuple, source: Any = None,
+                 requests: Optional[int] = None):
+        self.root = root
+        self.properties = properties
+        self.source = source
+        self.requests = requests
+        self.taken_at = time.monotonic()
+        self._index = None
+        self._size = 0
+        stack = [(root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            node.depth, node.order = depth, self._size
+            self._size += 1
+            stack.extend((child, depth + 1) for child in reversed(node._children))
+
+    def __iter__(self) -> Iterator[SnapshotNode]:
+        """Iterate over all nodes in document order, root first."""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node._children))
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def index(self) -> SnapshotIndex:
+        """Lookup tables over the captured elements, built on first use."""
+        if self._index is None:
+            self._index = SnapshotIndex(self)
+        return self._index
+
+    def fingerprint(self) -> int:
+        """Hash of the structure and the captured properties of the subtree.
+
+        Two snapshots with the same properties have the same fingerprint
+        when their trees have the same shape and the same property values,
+        so comparing fingerprints tells cheaply whether the subtree changed.
+
+        :return: Fingerprint of the snapshot.
+        :rtype: int
+        """
+        properties = self.properties
+        return hash(tuple(
+            (node.depth,) + tuple(str(node.element_info._values.get(name)) for name in properties)
+            for node in self
+        ))
+
+    def refresh(self) -> "UISnapshot":
+        """Take a new snapshot of the same element with the same properties.
+
+        :return: New snapshot.
+        :rtype: UISnapshot
+        """
+        return take_snapshot(self.source, self.properties)
+
+    def __repr__(self) -> str:
+        return f"<UISnapshot of {len(self)} elements>"
+
+
+def take_snapshot(root: Any, properties: Union[str, Iterable[str], None] = None) -> UISnapshot:
+    """Capture the subtree of `root`.
+
+    :param root: Live element whose subtree to capture. Snapshot nodes are
+        resolved to their live element first.
+    :type root: Any
+    :param properties: Properties to capture. See `parse_snapshot_properties`.
+    :type properties: str, list or None
+    :return: Snapshot of the subtree.
+    :rtype: UISnapshot
+    """
+    if isinstance(root, SnapshotNode):
+        root = root.wrapper
+    properties = parse_snapshot_properties(properties)
+    element_info = getattr(root, "element_info", None)
+    if type(element_info).__name__ == "UIAElementInfo":
+        try:
+            return _take_uia_snapshot(root, properties)
+        except Exception:
+            pass
+    return _take_generic_snapshot(root, properties)
+
+
+def _take_generic_snapshot(root: Any, properties: tuple) -> UISnapshot:
+    """Capture the subtree by walking it and reading each property once."""
+
+    def capture(wrapper):
+        values = {name: element_property(wrapper, name) for name in properties}
+        node = SnapshotNode(SnapshotElementInfo(values, wrapper.element_info), wrapper)
+        try:
+            children = wrapper.children()
+        except Exception:
+            children = []
+        for child in children:
+            child_node = capture(child)
+            child_node.parent = node
+            node._children.append(child_node)
+        return node
+
+    return UISnapshot(capture(root), properties, root)
+
+
+def _take_uia_snapshot(root: Any, properties: tuple) -> UISnapshot:
+    """Capture the subtree with one UIA cache request."""
+    from pywinauto.controls.uiawrapper import UIAWrapper
+    from pywinauto.handleprops import controlid
+    from pywinauto.uia_defines import IUIA
+    from pywinauto.uia_element_info import UIAElementInfo
+    from pywinauto.win32structures import RECT
+
+    uia = IUIA()
+    request = uia.iuia.CreateCacheRequest()
+    for name in properties:
+        if name in _UIA_PROPERTY_IDS:
+            request.AddProperty(getattr(uia.UIA_dll, _UIA_PROPERTY_IDS[name]))
+    request.TreeScope = uia.tree_scope["subtree"]
+    # Match the raw view used by children() instead of the default control view
+    request.TreeFilter = uia.true_condition
+    cached = root.element_info.element.BuildUpdatedCache(request)
+
+    def read(element, name):
+        if name == "name":
+            return element.CachedName or ""
+        if name == "automation_id":
+            return element.CachedAutomationId or ""
+        if name == "class_name":
+            return element.CachedClassName or ""
+        if name == "control_type":
+            return uia.known_control_type_ids.get(element.CachedControlType)
+        if name == "handle":
+            return element.CachedNativeWindowHandle or None
+        if name == "runtime_id":
+            return tuple(element.GetCachedPropertyValue(uia.UIA_dll.UIA_RuntimeIdPropertyId) or ())
+        if name == "enabled":
+            return bool(element.CachedIsEnabled)
+        if name == "visible":
+            return not element.CachedIsOffscreen
+        if name == "rectangle":
+            bounds = element.CachedBoundingRectangle
+            return RECT(bounds.left, bounds.top, bounds.right, bounds.bottom)
+        return None
+
+    def capture(element, wrapper=None):
+        values = {name: read(element, name) for name in properties if name != "control_id"}
+        if "control_id" in properties:
+            values["control_id"] = controlid(values["handle"]) if values.get("handle") else None
+        if wrapper is not None:
+            info = SnapshotElementInfo(values, wrapper.element_info)
+            node = SnapshotNode(info, wrapper)
+        else:
+            info = SnapshotElementInfo(values, live_factory=lambda: UIAElementInfo(element))
+            node = SnapshotNode(info, wrapper_factory=lambda: UIAWrapper(info.live))
+        children = element.GetCachedChildren()
+        for index in range(children.Length if children else 0):
+            child_node = capture(children.GetElement(index))
+            child_node.parent = node
+            node._children.append(child_node)
+        return node
+
+    return UISnapshot(capture(cached, root), properties, root, requests=1)
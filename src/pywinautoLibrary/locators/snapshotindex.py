@@ -0,0 +1,159 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+from .fuzzy import TrigramIndex
+from .properties import element_property
+
+
+INDEXED_PROPERTIES = ("automation_id", "control_id", "class_name", "control_type")
+
+_REGEX_SPECIAL = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def literal_prefix(pattern: str) -> str:
+    """Get the literal text every match of `pattern` has to start with.
+
+    :param pattern: Regular expression matched from the start of a string.
+    :type pattern: str
+    :return: Literal prefix, empty if the pattern does not have one.
+    :rtype: str
+    """
+    if "|" in pattern:
+        return ""
+    match = _REGEX_SPECIAL.search(pattern)
+    if not match:
+        return pattern
+    end = match.start()
+    # Quantifiers make the preceding character optional
+    if pattern[end] in "*?{":
+        end -= 1
+    return pattern[:max(end, 0)]
+
+
+def _captured(node: Any, name: str, default: Any = None) -> Any:
+    """Read a property of a snapshot node, bypassing attribute lookup when captured."""
+    values = node.element_info._values
+    if name in values:
+        value = values[name]
+        return default if value is None else value
+    return element_property(node, name, default)
+
+
+class SnapshotIndex:
+    """Lookup tables over the elements of a snapshot.
+
+    Each table is built the first time it is used. Property tables map a
+    property value to the elements having it, and the title table keeps
+    element names sorted for prefix lookups. Elements are always returned
+    in document order.
+
+    :param snapshot: Snapshot to index.
+    :type snapshot: pywinautoLibrary.locators.UISnapshot
+    """
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        # The root is not a descendant of itself, like in live searches
+        self._nodes = list(snapshot)[1:]
+        self._tables: Dict[str, Dict[Any, List[Any]]] = {}
+        self._names: Optional[List[str]] = None
+        self._named: List[Any] = []
+        self._members: Dict[tuple, set] = {}
+        self._trigrams: Optional[TrigramIndex] = None
+
+    def lookup(self, name: str, value: Any) -> List[Any]:
+        """Get the elements whose property `name` equals `value`.
+
+        :param name: One of `INDEXED_PROPERTIES`.
+        :type name: str
+        :param value: Property value to look up.
+        :type value: Any
+        :return: Matching elements in document order.
+        :rtype: list
+        """
+        table = self._tables.get(name)
+        if table is None:
+            table = self._tables[name] = self._build(name)
+        return table.get(value, [])
+
+    def prefix(self, prefix: str) -> List[Any]:
+        """Get the elements whose name starts with `prefix`.
+
+        :param prefix: Name prefix.
+        :type prefix: str
+        :return: Matching elements in document order.
+        :rtype: list
+        """
+        if not prefix:
+            return list(self._nodes)
+        if self._names is None:
+            entries = sorted(
+                ((_captured(node, "name", ""), node.order, node) for node in self._nodes),
+                key=lambda entry: entry[:2],
+            )
+            self._names = [entry[0] for entry in entries]
+            self._named = [entry[2] for entry in entries]
+        start = index = bisect_left(self._names, prefix)
+        while index < len(self._names) and self._names[index].startswith(prefix):
+            index += 1
+        return sorted(self._named[start:index], key=lambda node: node.order)
+
+    def restrict(self, nodes: List[Any], name: str, value: Any) -> List[Any]:
+        """Keep only the elements of `nodes` whose property `name` equals `value`.
+
+        :param nodes: Elements of this snapshot.
+        :type nodes: list
+        :param name: One of `INDEXED_PROPERTIES`.
+        :type name: str
+        :param value: Required property value.
+        :type value: Any
+        :return: Matching elements in their original order.
+        :rtype: list
+        """
+        members = self._members.get((name, value))
+        if members is None:
+            members = self._members[(name, value)] = {node.order for node in self.lookup(name, value)}
+        return [node for node in nodes if node.order in members]
+
+    @property
+    def trigrams(self) -> TrigramIndex:
+        """Trigram index over element names for approximate lookups."""
+        if self._trigrams is None:
+            self._trigrams = TrigramIndex((node, _captured(node, "name", "")) for node in self._nodes)
+        return self._trigrams
+
+    @property
+    def built(self) -> List[str]:
+        """Names of the tables built so far."""
+        built = list(self._tables)
+        if self._names is not None:
+            built.append("name")
+        if self._trigrams is not None:
+            built.append("trigrams")
+        return built
+
+    def _build(self, name: str) -> Dict[Any, List[Any]]:
+        table: Dict[Any, List[Any]] = {}
+        for node in self._nodes:
+            value = _captured(node, name)
+            if value is not None:
+                table.setdefault(value, []).append(node)
+        return table
+
+    def __len__(self) -> int:
+        return len(self._nodes)
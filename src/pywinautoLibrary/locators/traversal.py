@@ -0,0 +1,214 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+from typing import Any, Iterator, Optional, Tuple
+
+from .properties import is_control_type
+
+
+BREADTH_FIRST = "breadth_first"
+DEPTH_FIRST = "depth_first"
+SEARCH_ORDERS = (BREADTH_FIRST, DEPTH_FIRST)
+
+
+def _children(element: Any, control_type: Optional[str] = None) -> list:
+    try:
+        if control_type:
+            return element.children(control_type=control_type)
+        return element.children()
+    except Exception:
+        return []
+
+
+def _is_leaf(depth: int, max_depth: Optional[int]) -> bool:
+    return max_depth is not None and depth >= max_depth
+
+
+def iter_descendants(
+    root: Any,
+    max_depth: Optional[int] = 1,
+    order: str = BREADTH_FIRST,
+    control_type: Optional[str] = None,
+) -> Iterator[Any]:
+    """Iterate over the descendants of `root`.
+
+    Children of each element are fetched only when the iteration reaches
+    that element, so stopping the iteration early also stops the traversal.
+
+    With `control_type`, only elements of that type are produced. Children
+    at the maximum depth are not descended into, so the backend is asked
+    for only the children of that type. Elements above it are descended
+    into whatever their type, since they may contain matching elements.
+
+    :param root: Element whose descendants to iterate.
+    :type root: Any
+    :param max_depth: Maximum depth to descend to. 1 means only the direct
+        children of `root`. None means no limit.
+    :type max_depth: int or None
+    :param order: `breadth_first` or `depth_first`.
+    :type order: str
+    :param control_type: Produce only elements of this control type.
+    :type control_type: str
+    :return: Iterator of descendant elements. The root itself is not included.
+    :rtype: iterator
+    """
+    if order == DEPTH_FIRST:
+        yield from _depth_first(root, 1, max_depth, control_type)
+        return
+    queue = deque([(root, 1)])
+    while queue:
+        element, depth = queue.popleft()
+        if _is_leaf(depth, max_depth):
+            yield from _children(element, control_type)
+            continue
+        for child in _children(element):
+            if is_control_type(child, control_type):
+                yield child
+            queue.append((child, depth + 1))
+
+
+def _depth_first(
+    element: Any, depth: int, max_depth: Optional[int], control_type: Optional[str]
+) -> Iterator[Any]:
+    if _is_leaf(depth, max_depth):
+        yield from _children(element, control_type)
+        return
+    for child in _children(element):
+        if is_control_type(child, control_type):
+            yield child
+        yield from _depth_first(child, depth + 1, max_depth, control_type)
+
+
+def iter_descendant_paths(
+    root: Any,
+    max_depth: Optional[int] = 1,
+    order: str = BREADTH_FIRST,
+    control_type: Optional[str] = None,
+) -> Iterator[Tuple[Tuple[int, ...], Any]]:
+    """Iterate over the descendants of `root` together with their paths.
+
+    Works like `iter_descendants`, but also produces the path of each
+    element as the indexes of the children to follow from `root`. With
+    `control_type`, the last index counts only the children of that type,
+    so the path can be followed with `follow_path`.
+
+    :param root: Element whose descendants to iterate.
+    :type root: Any
+    :param max_depth: Maximum depth to descend to. None means no limit.
+    :type max_depth: int or None
+    :param order: `breadth_first` or `depth_first`.
+    :type order: str
+    :param control_type: Produce only elements of this control type.
+    :type control_type: str
+    :return: Iterator of `(path, element)` pairs.
+    :rtype: iterator
+    """
+    if order == DEPTH_FIRST:
+        yield from _depth_first_paths(root, (), max_depth, control_type)
+        return
+    queue = deque([(root, ())])
+    while queue:
+        element, path = queue.popleft()
+        if _is_leaf(len(path) + 1, max_depth):
+            for index, child in enumerate(_children(element, control_type)):
+                yield path + (index,), child
+            continue
+        position = 0
+        for index, child in enumerate(_children(element)):
+            if is_control_type(child, control_type):
+                yield path + (position,), child
+                position += 1
+            queue.append((child, path + (index,)))
+
+
+def _depth_first_paths(
+    element: Any, path: Tuple[int, ...], max_depth: Optional[int], control_type: Optional[str]
+) -> Iterator[Tuple[Tuple[int, ...], Any]]:
+    if _is_leaf(len(path) + 1, max_depth):
+        for index, child in enumerate(_children(element, control_type)):
+            yield path + (index,), child
+        return
+    position = 0
+    for index, child in enumerate(_children(element)):
+        if is_control_type(child, control_type):
+            yield path + (position,), child
+            position += 1
+        yield from _depth_first_paths(child, path + (index,), max_depth, control_type)
+
+
+def follow_path(root: Any, path: Tuple[int, ...], control_type: Optional[str] = None) -> Any:
+    """Get the element at the end of a path from `iter_descendant_paths`.
+
+    :param root: Element the path starts from.
+    :type root: Any
+    :param path: Indexes of the children to follow.
+    :type path: tuple
+    :param control_type: Control type the path was produced with.
+    :type control_type: str
+    :return: Element at the end of the path, or None if the path no
+        longer exists.
+    :rtype: Any
+    """
+    element = root
+    try:
+        for depth, index in enumerate(path, 1):
+            children = element.children(control_type=control_type) if (
+                control_type and depth == len(path)) else element.children()
+            if index >= len(children):
+                return None
+            element = children[index]
+    except Exception:
+        return None
+    return element
+
+
+def parse_search_depth(depth: Any) -> Optional[int]:
+    """Convert a search depth given as an import argument.
+
+    :param depth: Depth as an integer or string. `None`, `0` and strings
+        such as `none` or `unlimited` mean no limit.
+    :type depth: int, str or None
+    :return: Maximum depth or None for no limit.
+    :rtype: int or None
+    :raises ValueError: If the depth is negative or not a number.
+    """
+    if depth is None:
+        return None
+    if isinstance(depth, str):
+        if depth.strip().lower() in ("", "none", "unlimited"):
+            return None
+        depth = int(depth)
+    if depth < 0:
+        raise ValueError(f"Search depth must be zero or positive, got {depth}.")
+    return depth or None
+
+
+def parse_search_order(order: str) -> str:
+    """Normalize a search order given as an import argument.
+
+    :param order: `breadth_first` or `depth_first`. Spaces, hyphens and
+        case are ignored, and `bfs` and `dfs` are accepted as aliases.
+    :type order: str
+    :return: Normalized search order.
+    :rtype: str
+    :raises ValueError: If the order is not recognized.
+    """
+    normalized = order.strip().lower().replace(" ", "_").replace("-", "_")
+    normalized = {"bfs": BREADTH_FIRST, "dfs": DEPTH_FIRST}.get(normalized, normalized)
+    if normalized not in SEARCH_ORDERS:
+        raise ValueError(
+            f"Search order must be one of {', '.join(SEARCH_ORDERS)}, got '{order}'."
+        )
+    return normalized
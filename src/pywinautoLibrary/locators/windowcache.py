@@ -0,0 +1,136 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from .properties import element_property
+
+
+class WindowEntry(NamedTuple):
+    """Top-level window with the properties window locators match."""
+
+    window: Any
+    title: str
+    class_name: str
+
+
+class WindowCache:
+    """Short-lived cache of the top-level windows of the current application.
+
+    Enumerating windows walks the whole desktop, so the list of windows and
+    their titles and class names is reused for `ttl` seconds. When the
+    backend notifies about windows opening and closing, the list is also
+    refreshed as soon as a notification arrives.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0.25,
+        event_source_factory: Optional[Callable[[Any], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the window cache.
+
+        :param ttl: Seconds to reuse the list of windows. 0 disables caching.
+        :type ttl: float
+        :param event_source_factory: Callable returning an event source
+            notified when windows of the given application open or close,
+            or None if the backend has no such notifications.
+        :type event_source_factory: callable
+        :param clock: Monotonic clock function.
+        :type clock: callable
+        """
+        if ttl < 0:
+            raise ValueError(f"Window cache TTL must be zero or positive, got {ttl}.")
+        self.ttl = ttl
+        self.event_source_factory = event_source_factory
+        self.clock = clock
+        self._app = None
+        self._windows: Optional[List[WindowEntry]] = None
+        self._expires = 0.0
+        self._events = None
+        self.hits = 0
+        self.misses = 0
+        self.notifications = 0
+
+    def windows(self, app: Any) -> List[WindowEntry]:
+        """Get the top-level windows of `app`.
+
+        :param app: pywinauto application.
+        :type app: pywinauto.application.Application
+        :return: Windows in the order the application reports them.
+        :rtype: list
+        """
+        if app is not self._app:
+            self.invalidate()
+            self._app = app
+            self._subscribe(app)
+        if self._events is not None and self._events.wait(0):
+            self._events.clear()
+            self.notifications += 1
+            self._windows = None
+        if self._windows is not None and self.clock() < self._expires:
+            self.hits += 1
+            return self._windows
+        self.misses += 1
+        windows = [
+            WindowEntry(window, element_property(window, "name", ""), element_property(window, "class_name", ""))
+            for window in app.windows()
+        ]
+        if self.ttl:
+            self._windows = windows
+            self._expires = self.clock() + self.ttl
+        return windows
+
+    def expire(self):
+        """Forget the cached windows but keep listening to notifications."""
+        self._windows = None
+
+    def invalidate(self, *args):
+        """Forget the cached windows and stop listening to notifications.
+
+        Accepts and ignores any arguments so it can be used as a callback.
+        """
+        self._windows = None
+        self._app = None
+        if self._events is not None:
+            self._events.stop()
+            self._events = None
+
+    def _subscribe(self, app: Any):
+        if self.event_source_factory is None or not self.ttl:
+            return
+        try:
+            events = self.event_source_factory(app)
+            if events is not None and events.start(None):
+                self._events = events
+        except Exception:
+            self._events = None
+
+    @property
+    def statistics(self) -> dict:
+        """Cache statistics.
+
+        :return: Dictionary with `ttl`, `hits`, `misses`, `notifications`
+            and whether window `events` are used.
+        :rtype: dict
+        """
+        return {
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "notifications": self.notifications,
+            "events": self._events is not None,
+        }
@@ -0,0 +1,352 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""XPath subset evaluated over the control tree.
+
+Supported syntax:
+
+- Location paths with ``/`` (child) and ``//`` (descendant) axes. Absolute
+  paths start above the search root, so ``/Window`` matches the root window
+  itself. Relative paths start from the search root.
+- Name tests matching the control type, e.g. ``Button``, or ``*``.
+- Predicates on ``@ControlType``, ``@AutomationId``, ``@Name`` and
+  ``@ClassName`` using ``=`` and ``!=``, ``contains()``, ``starts-with()``,
+  ``not()``, ``and``, ``or`` and parentheses.
+- Positional predicates such as ``[2]``.
+
+Expressions are compiled once and evaluated lazily in a single traversal
+of the tree, so the first match can be returned without visiting the rest
+of the tree. The engine only relies on ``children()`` and ``element_info``
+of the wrappers, so any object exposing that interface can be searched.
+"""
+
+import re
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional
+
+from pywinautoLibrary.errors import InvalidLocator
+from .properties import element_property
+
+
+ATTRIBUTES = {
+    "ControlType": "control_type",
+    "AutomationId": "automation_id",
+    "Name": "name",
+    "ClassName": "class_name",
+}
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<string>'[^']*'|"[^"]*")
+      | (?P<number>\d+)
+      | (?P<op>//|/|\[|\]|\(|\)|,|@|!=|=|\*)
+      | (?P<name>[A-Za-z_][\w.-]*)
+    )""",
+    re.VERBOSE,
+)
+
+Predicate = Callable[[Any], bool]
+
+
+class _Step(NamedTuple):
+    descendant: bool
+    control_type: Optional[str]
+    # Each predicate is either a 1-based position or a callable filter
+    predicates: tuple
+
+
+def _tokenize(expression: str) -> List[tuple]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if not match or match.end() == position:
+            raise InvalidLocator(
+                f"Invalid XPath '{expression}': unexpected character at position {position}."
+            )
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "string":
+            value = value[1:-1]
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.index = 0
+
+    def error(self, message: str) -> InvalidLocator:
+        return InvalidLocator(f"Invalid XPath '{self.expression}': {message}")
+
+    def peek(self, value: Optional[str] = None) -> bool:
+        if self.index >= len(self.tokens):
+            return False
+        kind, token_value = self.tokens[self.index]
+        return value is None or (kind in ("op", "name") and token_value == value)
+
+    def take(self, kind: Optional[str] = None, value: Optional[str] = None) -> str:
+        if self.index >= len(self.tokens):
+            raise self.error("unexpected end of expression.")
+        token_kind, token_value = self.tokens[self.index]
+        if (kind and token_kind != kind) or (value and token_value != value):
+            raise self.error(f"expected '{value or kind}' but got '{token_value}'.")
+        self.index += 1
+        return token_value
+
+    def parse(self):
+        absolute = self.peek("/") or self.peek("//")
+        steps = []
+        descendant = False
+        if absolute:
+            descendant = self.take("op") == "//"
+        steps.append(self.step(descendant))
+        while self.peek("/") or self.peek("//"):
+            descendant = self.take("op") == "//"
+            steps.append(self.step(descendant))
+        if self.index != len(self.tokens):
+            raise self.error(f"unexpected '{self.tokens[self.index][1]}'.")
+        return absolute, tuple(steps)
+
+    def step(self, descendant: bool) -> _Step:
+        if self.peek("*"):
+            self.take("op", "*")
+            control_type = None
+        else:
+            control_type = self.take("name")
+        predicates = []
+        while self.peek("["):
+            self.take("op", "[")
+            kind, value = self.tokens[self.index] if self.peek() else (None, None)
+            if kind == "number" and self.index + 1 < len(self.tokens) \
+                    and self.tokens[self.index + 1][1] == "]":
+                self.index += 1
+                position = int(value)
+                if position < 1:
+                    raise self.error("positions start from 1.")
+                predicates.append(position)
+            else:
+                predicates.append(self.or_expression())
+            self.take("op", "]")
+        return _Step(descendant, control_type, tuple(predicates))
+
+    def or_expression(self) -> Predicate:
+        operands = [self.and_expression()]
+        while self.peek("or"):
+            self.take("name", "or")
+            operands.append(self.and_expression())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda element: any(operand(element) for operand in operands)
+
+    def and_expression(self) -> Predicate:
+        operands = [self.unary()]
+        while self.peek("and"):
+            self.take("name", "and")
+            operands.append(self.unary())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda element: all(operand(element) for operand in operands)
+
+    def unary(self) -> Predicate:
+        if self.peek("("):
+            self.take("op", "(")
+            predicate = self.or_expression()
+            self.take("op", ")")
+            return predicate
+        if self.peek("@"):
+            return self.comparison()
+        function = self.take("name")
+        self.take("op", "(")
+        if function == "not":
+            operand = self.or_expression()
+            self.take("op", ")")
+            return lambda element: not operand(element)
+        if function not in ("contains", "starts-with"):
+            raise self.error(f"unsupported function '{function}()'.")
+        attribute = self.attribute()
+        self.take("op", ",")
+        text = self.take("string")
+        self.take("op", ")")
+        if function == "contains":
+            return lambda element: text in _read(element, attribute)
+        return lambda element: _read(element, attribute).startswith(text)
+
+    def comparison(self) -> Predicate:
+        attribute = self.attribute()
+        if self.peek("=") or self.peek("!="):
+            operator = self.take("op")
+            text = self.take("string")
+            if operator == "=":
+                return lambda element: _read(element, attribute) == text
+            return lambda element: _read(element, attribute) != text
+        return lambda element: bool(_read(element, attribute))
+
+    def attribute(self) -> str:
+        self.take("op", "@")
+        name = self.take("name")
+        if name not in ATTRIBUTES:
+            raise self.error(
+                f"unsupported attribute '@{name}', expected one of "
+                f"{', '.join('@' + attribute for attribute in ATTRIBUTES)}."
+            )
+        return ATTRIBUTES[name]
+
+
+def _read(element: Any, attribute: str) -> str:
+    value = element_property(element, attribute, "")
+    return value if isinstance(value, str) else str(value)
+
+
+def _children(element: Any) -> List[Any]:
+    try:
+        return element.children()
+    except Exception:
+        return []
+
+
+class XPath:
+    """Compiled XPath expression.
+
+    :param expression: XPath expression to compile.
+    :type expression: str
+    :raises pywinautoLibrary.errors.InvalidLocator: If the expression is
+        not valid or uses unsupported syntax.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.absolute, self.steps = _Parser(expression).parse()
+
+    def iter(self, root: Any) -> Iterator[Any]:
+        """Iterate over elements matching the expression under `root`.
+
+        Elements are produced lazily in document order, so stopping the
+        iteration early stops the traversal as well.
+
+        :param root: Element to evaluate the expression against.
+        :type root: Any
+        :return: Iterator of matching elements.
+        :rtype: iterator
+        """
+        seen = set()
+        for element in self._evaluate(root):
+            try:
+                hash(element)
+                key = element
+            except Exception:
+                key = id(element)
+            if key not in seen:
+                seen.add(key)
+                yield element
+
+    def find(self, root: Any) -> Optional[Any]:
+        """Get the first element matching the expression.
+
+        :param root: Element to evaluate the expression against.
+        :type root: Any
+        :return: First matching element or None.
+        :rtype: Any
+        """
+        return next(self.iter(root), None)
+
+    def find_all(self, root: Any) -> List[Any]:
+        """Get all elements matching the expression.
+
+        :param root: Element to evaluate the expression against.
+        :type root: Any
+        :return: List of matching elements.
+        :rtype: list
+        """
+        return list(self.iter(root))
+
+    def _evaluate(self, root: Any) -> Iterator[Any]:
+        """Evaluate the whole expression against `root`."""
+        if not self.absolute:
+            yield from self._select(root, 0)
+            return
+        # Absolute paths start from a virtual document whose only child is root
+        yield from self._step([root], 0, None)
+        if self.steps[0].descendant:
+            yield from self._walk(root, 0)
+
+    def _select(self, context: Any, index: int) -> Iterator[Any]:
+        """Evaluate step `index` and the following steps from `context`."""
+        if self.steps[index].descendant:
+            yield from self._walk(context, index)
+        else:
+            yield from self._step(_children(context), index, context)
+
+    def _walk(self, node: Any, index: int) -> Iterator[Any]:
+        """Evaluate step `index` on every descendant of `node` in document order.
+
+        Children of each node are fetched once and used both for matching
+        the step and for continuing the traversal.
+        """
+        yield from self._step(_children(node), index, node, descend=True)
+
+    def _step(
+        self, children: List[Any], index: int, context: Any, descend: bool = False
+    ) -> Iterator[Any]:
+        """Match step `index` against `children` of one context node.
+
+        Positional predicates count the children of this context node
+        only. With `descend`, each child is followed by the matches in its
+        own subtree, so matches are produced in document order.
+        """
+        step = self.steps[index]
+        last = index == len(self.steps) - 1
+        counters = [0] * len(step.predicates)
+        exhausted = False
+        for child in children:
+            if not exhausted and self._matches(step, child, counters):
+                if last:
+                    yield child
+                else:
+                    yield from self._select(child, index + 1)
+            if not exhausted:
+                exhausted = self._exhausted(step, counters)
+            if descend:
+                yield from self._walk(child, index)
+            elif exhausted:
+                break
+
+    @staticmethod
+    def _matches(step: _Step, child: Any, counters: List[int]) -> bool:
+        """Check `child` against `step`, counting it for positional predicates."""
+        if step.control_type and _read(child, "control_type") != step.control_type:
+            return False
+        for position, predicate in enumerate(step.predicates):
+            if isinstance(predicate, int):
+                counters[position] += 1
+                if counters[position] != predicate:
+                    return False
+            elif not predicate(child):
+                return False
+        return True
+
+    @staticmethod
+    def _exhausted(step: _Step, counters: List[int]) -> bool:
+        """Check whether no later sibling can match a positional predicate any more."""
+        return any(
+            isinstance(predicate, int) and counters[position] >= predicate
+            for position, predicate in enumerate(step.predicates)
+        )
+
+    def __repr__(self) -> str:
+        return f"XPath({self.expression!r})"
@@ -43,7 +43,18 @@ def is_truthy(value):
 
 
 from .librarylistener import LibraryListener
-from .dynamiccore import DynamicCore
+from .dynamiccore import (
+    DynamicCore,
+    KeywordInfo,
+    LazyLibrary,
+    keyword,
+    keyword_info,
+    keyword_registry,
+    normalize_keyword_name,
+    public_methods,
+)
+from .polling import PollScheduler, BackoffPollScheduler, create_poll_scheduler
+from .waitstatistics import WAIT_STATISTICS_FILE, WaitRecord, WaitStatistics
 
 
 def _convert_timeout(timeout: Union[str, int, float, timedelta]) -> float:
@@ -13,6 +13,272 @@
 # limitations under the License.
 
 
+import inspect
+from functools import lru_cache
+from types import MethodType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from pywinautoLibrary.errors import KeywordConflict
+
+
+# Keyword registries of classes, see `keyword_registry`
+_registries: Dict[type, Dict[str, Callable]] = {}
+# Keyword metadata of methods, see `keyword_info`
+_infos: Dict[Callable, "KeywordInfo"] = {}
+
+
+def keyword(name: Optional[str] = None, tags: Sequence[str] = (), types=()):
+    """Mark a method as a keyword.
+
+    Can be used without arguments, or with a custom keyword name, tags and
+    argument types::
+
+        @keyword
+        def click_element(self, locator): ...
+
+        @keyword("Click ${locator} Twice", tags=["mouse"])
+        def double_click(self, locator): ...
+
+    The attributes set are the same as with Robot Framework's own
+    `robot.api.deco.keyword`, so methods decorated with either one are
+    keywords.
+
+    :param name: Keyword name. Defaults to the method name.
+    :type name: str
+    :param tags: Keyword tags.
+    :type tags: list
+    :param types: Argument types as a dictionary or a list.
+    :type types: dict or list
+    :return: The decorated method.
+    :rtype: callable
+    """
+    if callable(name):
+        return keyword()(name)
+
+    def decorator(function):
+        function.robot_name = name
+        function.robot_tags = tuple(tags)
+        function.robot_types = types
+        return function
+
+    return decorator
+
+
+def keyword_registry(cls: type) -> Dict[str, Callable]:
+    """Get the keywords of a library class.
+
+    The class and its bases are scanned only on the first call, and the
+    result is cached for the class.
+
+    :param cls: Library class.
+    :type cls: type
+    :return: Dictionary mapping keyword names to their unbound methods.
+    :rtype: dict
+    """
+    registry = _registries.get(cls)
+    if registry is None:
+        registry = _registries[cls] = {}
+        seen = set()
+        for klass in cls.__mro__:
+            for attr in vars(klass):
+                if attr in seen:
+                    continue
+                seen.add(attr)
+                # Looked up on the class, so properties are not evaluated
+                function = getattr(cls, attr, None)
+                if callable(function) and hasattr(function, "robot_name"):
+                    registry[function.robot_name or attr] = function
+    return registry
+
+
+def public_methods(cls: type, exclude: type = object) -> Dict[str, Callable]:
+    """Get the public methods of a class not using the `keyword` decorator.
+
+    Used as the keywords of plugins written before the decorator existed.
+    Properties, and methods defined in `exclude` or its bases, are skipped.
+
+    :param cls: Library class.
+    :type cls: type
+    :param exclude: Base class whose methods are not keywords.
+    :type exclude: type
+    :return: Dictionary mapping method names to unbound methods.
+    :rtype: dict
+    """
+    methods = {}
+    seen = set()
+    for klass in cls.__mro__:
+        for attr, value in vars(klass).items():
+            if attr in seen:
+                continue
+            seen.add(attr)
+            if attr.startswith("_") or klass in exclude.__mro__ or isinstance(value, property):
+                continue
+            function = getattr(cls, attr, None)
+            if callable(function) and not isinstance(function, type):
+                methods[attr] = function
+    return methods
+
+
+class KeywordInfo(NamedTuple):
+    """Keyword metadata in the format of the Robot Framework dynamic API."""
+
+    arguments: List[Any]
+    types: Dict[str, Any]
+    documentation: str
+    tags: List[str]
+    source: Optional[str]
+
+
+def keyword_info(function: Callable) -> KeywordInfo:
+    """Get the metadata of a keyword method.
+
+    The signature, documentation and source of a method are inspected only
+    on the first call, and the result is cached for the method.
+
+    Arguments with defaults are returned as `(name, default)` tuples, so
+    Robot Framework gets the actual default values. Types are those given
+    to the `keyword` decorator or, by default, the argument annotations.
+
+    :param function: Unbound keyword method.
+    :type function: callable
+    :return: Keyword metadata.
+    :rtype: KeywordInfo
+    """
+    info = _infos.get(function)
+    if info is None:
+        info = _infos[function] = _inspect_keyword(function)
+    return info
+
+
+def _inspect_keyword(function: Callable) -> KeywordInfo:
+    # The first argument is the library instance
+    parameters = list(inspect.signature(function).parameters.values())[1:]
+    arguments: List[Any] = []
+    types = {}
+    positional = True
+    for parameter in parameters:
+        name = parameter.name
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            name = f"*{name}"
+            positional = False
+        elif parameter.kind is parameter.VAR_KEYWORD:
+            name = f"**{name}"
+        elif parameter.kind is parameter.KEYWORD_ONLY and positional:
+            # Keyword-only arguments without variable arguments before them
+            arguments.append("*")
+            positional = False
+        if parameter.default is not parameter.empty:
+            arguments.append((name, parameter.default))
+        else:
+            arguments.append(name)
+        if parameter.annotation is not parameter.empty:
+            types[parameter.name] = parameter.annotation
+    return KeywordInfo(
+        arguments,
+        getattr(function, "robot_types", None) or types,
+        inspect.getdoc(function) or "",
+        list(getattr(function, "robot_tags", ())),
+        _source(function),
+    )
+
+
+def _source(function: Callable) -> Optional[str]:
+    try:
+        path = inspect.getsourcefile(function)
+        lines, line = inspect.getsourcelines(function)
+    except (OSError, TypeError):
+        return None
+    # Point to the definition instead of the decorators, like Robot Framework
+    for offset, text in enumerate(lines):
+        if text.lstrip().startswith(("def ", "async def ")):
+            line += offset
+            break
+    return f"{path}:{line}" if path else None
+
+
+@lru_cache(maxsize=4096)
+def normalize_keyword_name(name):
+    """Normalize a keyword name the way Robot Framework matches keywords.
+
+    Case, spaces and underscores are ignored, so `Click Element`,
+    `click element` and `click_element` are the same keyword.
+
+    :param name: Keyword or method name.
+    :type name: str
+    :return: Normalized name.
+    :rtype: str
+    """
+    return name.lower().replace(" ", "").replace("_", "")
+
+
+class LazyLibrary:
+    """Library created when one of its keywords is first run.
+
+    The keywords of the library are known from the `keyword_registry` of
+    its class, or from `keywords` when set, so registering them does not
+    create the library.
+
+    :param cls: Library class.
+    :type cls: type
+    :param args: Arguments used to create the library.
+    :type args: Any
+    :param on_error: Callable converting an error raised when creating the
+        library to the error to raise instead. By default the original
+        error is raised.
+    :type on_error: callable
+    """
+
+    def __init__(self, cls: type, *args, on_error: Optional[Callable[[Exception], Exception]] = None):
+        self.cls = cls
+        self.args = args
+        self.on_error = on_error
+        self.keywords: Optional[Dict[str, Callable]] = None
+        self._instance = None
+
+    @property
+    def instance(self):
+        """The library, created on first access."""
+        if self._instance is None:
+            try:
+                self._instance = self.cls(*self.args)
+            except Exception as error:
+                if self.on_error is None:
+                    raise
+                raise self.on_error(error) from error
+        return self._instance
+
+    @property
+    def created(self) -> bool:
+        """Whether the library has been created."""
+        return self._instance is not None
+
+
+class _LazyKeyword:
+    """Keyword of a `LazyLibrary`, creating the library when first run."""
+
+    __slots__ = ("library", "function")
+
+    def __init__(self, library: LazyLibrary, function: Callable):
+        self.library = library
+        self.function = function
+
+    @property
+    def __func__(self) -> Callable:
+        return self.function
+
+    def __call__(self, *args, **kwargs):
+        return self.function(self.library.instance, *args, **kwargs)
+
+
+def _implementation(keyword):
+    return getattr(keyword, "__func__", keyword)
+
+
+def _describe(keyword):
+    implementation = _implementation(keyword)
+    return getattr(implementation, "__qualname__", repr(implementation))
+
+
 class DynamicCore:
     """Simplified implementation of DynamicCore for keyword composition.
     
@@ -22,42 +288,53 @@ class DynamicCore:
     def __init__(self, libraries):
         """Initialize DynamicCore with a list of libraries.
         
-        :param libraries: List of library instances containing keywords.
+        :param libraries: List of library instances containing keywords,
+            or `LazyLibrary` objects creating them when first needed.
         :type libraries: list
         """
         self._keywords = {}
+        # Keywords by normalized name, see `normalize_keyword_name`
+        self._dispatch = {}
         self._library_instances = libraries
         self._register_keywords()
     
     def _register_keywords(self):
         """Register keywords from all libraries.
+
+        Only methods marked with the `keyword` decorator are keywords. They
+        are looked up once per class, so registering the keywords of a
+        library only binds the methods of the cached registry.
+
+        :raises pywinautoLibrary.errors.KeywordConflict: If two libraries
+            implement keywords with the same normalized name.
         """
         for library in self._library_instances:
-            # Get all public attributes from the library instance
-            for name in dir(library):
-                if name.startswith('_'):
-                    continue
-                
-                # Skip properties to avoid triggering them during registration
-                try:
-                    # Check if it's a property by accessing __dict__ chain
-                    is_property = False
-                    for base in library.__class__.__mro__:
-                        if name in base.__dict__ and isinstance(base.__dict__[name], property):
-                            is_property = True
-                            break
-                    if is_property:
-                        continue
-                    
-                    # Get the attribute and check if it's callable
-                    attr = getattr(library, name)
-                    if callable(attr):
-                        # Register the keyword if not already registered
-                        if name not in self._keywords:
-                            self._keywords[name] = attr
-                except Exception:
-                    # Skip any attributes that cause errors when accessed
-                    continue
+            if isinstance(library, LazyLibrary):
+                keywords = library.keywords if library.keywords is not None else keyword_registry(library.cls)
+                for name, function in keywords.items():
+                    self._register_keyword(name, _LazyKeyword(library, function))
+            else:
+                for name, function in keyword_registry(type(library)).items():
+                    self._register_keyword(name, MethodType(function, library))
+
+    def _register_keyword(self, name, keyword):
+        """Register `keyword` under `name` and its normalized form.
+
+        Methods inherited by several libraries from a common base class are
+        registered once. Different implementations of the same keyword are
+        a conflict, as Robot Framework could not tell which one to run.
+        """
+        normalized = normalize_keyword_name(name)
+        existing = self._dispatch.get(normalized)
+        if existing is None:
+            self._keywords[name] = keyword
+            self._dispatch[normalized] = keyword
+            return
+        if _implementation(existing) is not _implementation(keyword):
+            raise KeywordConflict(
+                f"Keyword '{name}' is implemented by both {_describe(existing)} and "
+                f"{_describe(keyword)}."
+            )
     
     def __getattr__(self, name):
         """Get attribute by name, checking keywords if not found in instance.
@@ -89,16 +366,7 @@ class DynamicCore:
         :rtype: Any
         :raises AttributeError: If the keyword is not found.
         """
-        # Try exact match first
-        if name in self._keywords:
-            return self._keywords[name](*args, **kwargs)
-        
-        # Try case-insensitive match
-        for keyword_name, keyword in self._keywords.items():
-            if keyword_name.lower() == name.lower():
-                return keyword(*args, **kwargs)
-        
-        raise AttributeError(f"Keyword '{name}' not found.")
+        return self._get_keyword(name)(*args, **kwargs)
     
     def get_keyword_names(self):
         """Get the names of all available keywords.
@@ -107,3 +375,72 @@ class DynamicCore:
         :rtype: list
         """
         return list(self._keywords.keys())
+
+    def get_keyword_arguments(self, name):
+        """Get the arguments of a keyword.
+
+        :param name: Name of the keyword.
+        :type name: str
+        :return: Argument names, `(name, default)` tuples for arguments
+            with defaults, and `*name` and `**name` for variable arguments.
+        :rtype: list
+        """
+        return list(self._get_keyword_info(name).arguments)
+
+    def get_keyword_types(self, name):
+        """Get the argument types of a keyword.
+
+        :param name: Name of the keyword.
+        :type name: str
+        :return: Dictionary mapping argument names to types.
+        :rtype: dict
+        """
+        return dict(self._get_keyword_info(name).types)
+
+    def get_keyword_documentation(self, name):
+        """Get the documentation of a keyword.
+
+        `__intro__` returns the documentation of the library and `__init__`
+        the documentation of importing it.
+
+        :param name: Name of the keyword.
+        :type name: str
+        :return: Documentation.
+        :rtype: str
+        """
+        if name == "__intro__":
+            return inspect.getdoc(type(self)) or ""
+        if name == "__init__":
+            return inspect.getdoc(type(self).__init__) or ""
+        return self._get_keyword_info(name).documentation
+
+    def get_keyword_tags(self, name):
+        """Get the tags of a keyword.
+
+        :param name: Name of the keyword.
+        :type name: str
+        :return: Tags.
+        :rtype: list
+        """
+        return list(self._get_keyword_info(name).tags)
+
+    def get_keyword_source(self, name):
+        """Get the source of a keyword.
+
+        :param name: Name of the keyword.
+        :type name: str
+        :return: Path and line number as `path:line`, or None if unknown.
+        :rtype: str
+        """
+        return self._get_keyword_info(name).source
+
+    def _get_keyword(self, name):
+        keyword = self._keywords.get(name)
+        if keyword is None:
+            keyword = self._dispatch.get(normalize_keyword_name(name))
+            if keyword is None:
+                raise AttributeError(f"Keyword '{name}' not found.")
+        return keyword
+
+    def _get_keyword_info(self, name):
+        return keyword_info(_implementation(self._get_keyword(name)))
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from robot.api import logger
+
 
 class LibraryListener:
     """Library listener for Robot Framework events.
@@ -25,6 +27,28 @@ class LibraryListener:
     def __init__(self):
         """Initialize the library listener."""
         self.ROBOT_LIBRARY_LISTENER = self
+        self._close_listeners = []
+        self._scope_listeners = []
+
+    def add_close_listener(self, listener):
+        """Register a callable called when the library goes out of scope.
+
+        :param listener: Callable taking no arguments.
+        :type listener: callable
+        """
+        self._close_listeners.append(listener)
+
+    def add_scope_listener(self, listener):
+        """Register an object notified when suites and tests start and end.
+
+        The object must have `start_suite`, `end_suite`, `start_test` and
+        `end_test` methods, which are called with the long name of the
+        suite or test.
+
+        :param listener: Object to notify.
+        :type listener: Any
+        """
+        self._scope_listeners.append(listener)
 
     def start_keyword(self, name, attrs):
         """Called when a keyword starts.
@@ -54,7 +78,8 @@ class LibraryListener:
         :param attrs: Dictionary containing test attributes.
         :type attrs: dict
         """
-        pass
+        for listener in self._scope_listeners:
+            listener.start_test(attrs.get("longname", name))
 
     def end_test(self, name, attrs):
         """Called when a test ends.
@@ -64,7 +89,8 @@ class LibraryListener:
         :param attrs: Dictionary containing test attributes.
         :type attrs: dict
         """
-        pass
+        for listener in self._scope_listeners:
+            listener.end_test(attrs.get("longname", name))
 
     def start_suite(self, name, attrs):
         """Called when a suite starts.
@@ -74,7 +100,8 @@ class LibraryListener:
         :param attrs: Dictionary containing suite attributes.
         :type attrs: dict
         """
-        pass
+        for listener in self._scope_listeners:
+            listener.start_suite(attrs.get("longname", name))
 
     def end_suite(self, name, attrs):
         """Called when a suite ends.
@@ -84,7 +111,8 @@ class LibraryListener:
         :param attrs: Dictionary containing suite attributes.
         :type attrs: dict
         """
-        pass
+        for listener in self._scope_listeners:
+            listener.end_suite(attrs.get("longname", name))
 
     def output_file(self, path):
         """Called when an output file is created.
@@ -109,3 +137,15 @@ class LibraryListener:
         :type message: dict
         """
         pass
+
+    def close(self):
+        """Called when the library goes out of scope.
+
+        Calls the registered close listeners. A failing listener does not
+        prevent the others from running.
+        """
+        for listener in self._close_listeners:
+            try:
+                listener()
+            except Exception as err:
+                logger.warn(f"Closing the library failed: {err}")
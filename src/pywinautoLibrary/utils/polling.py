@@ -0,0 +1,164 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Iterator, Optional
+
+
+class PollScheduler:
+    """Schedule of retries used when waiting for a condition.
+
+    Subclasses only define the sequence of sleep intervals. `poll` turns it
+    into a loop bounded by a deadline on the monotonic clock.
+    """
+
+    name = "fixed"
+
+    def __init__(self, interval: float = 0.1):
+        """Initialize the scheduler.
+
+        :param interval: Seconds to sleep between attempts.
+        :type interval: float
+        """
+        if interval <= 0:
+            raise ValueError(f"Poll interval must be positive, got {interval}.")
+        self.interval = interval
+
+    def intervals(self) -> Iterator[float]:
+        """Generate the sleep intervals between consecutive attempts.
+
+        :return: Infinite iterator of intervals in seconds.
+        :rtype: iterator
+        """
+        while True:
+            yield self.interval
+
+    def poll(self, timeout: float, clock=time.monotonic, sleep=time.sleep) -> Iterator[int]:
+        """Iterate once per attempt until `timeout` expires.
+
+        The first attempt happens immediately and the last one at the
+        deadline at the latest, so looping over this never takes longer
+        than `timeout` plus the time spent in the attempts themselves.
+
+        :param timeout: Seconds to keep polling.
+        :type timeout: float
+        :param clock: Monotonic clock function.
+        :type clock: callable
+        :param sleep: Sleep function.
+        :type sleep: callable
+        :return: Iterator of attempt numbers starting from 1.
+        :rtype: iterator
+        """
+        deadline = clock() + max(timeout, 0)
+        attempt = 1
+        yield attempt
+        for interval in self.intervals():
+            remaining = deadline - clock()
+            if remaining <= 0:
+                return
+            sleep(min(interval, remaining))
+            attempt += 1
+            yield attempt
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.interval * 1000:g} ms)"
+
+
+class BackoffPollScheduler(PollScheduler):
+    """Poll quickly at first and back off exponentially up to a ceiling."""
+
+    name = "backoff"
+
+    def __init__(
+        self,
+        max_interval: float = 0.1,
+        initial_interval: float = 0.005,
+        factor: float = 2.0,
+    ):
+        """Initialize the scheduler.
+
+        :param max_interval: Longest interval between attempts in seconds.
+        :type max_interval: float
+        :param initial_interval: Interval after the first attempt in seconds.
+        :type initial_interval: float
+        :param factor: Multiplier applied to the interval after each attempt.
+        :type factor: float
+        """
+        super().__init__(max_interval)
+        if initial_interval <= 0:
+            raise ValueError(f"Initial poll interval must be positive, got {initial_interval}.")
+        if factor < 1:
+            raise ValueError(f"Backoff factor must be at least 1, got {factor}.")
+        self.initial_interval = min(initial_interval, max_interval)
+        self.factor = factor
+
+    def intervals(self) -> Iterator[float]:
+        interval = self.initial_interval
+        while True:
+            yield interval
+            interval = min(interval * self.factor, self.interval)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name} ({self.initial_interval * 1000:g} ms to "
+            f"{self.interval * 1000:g} ms, factor {self.factor:g})"
+        )
+
+
+POLL_STRATEGIES = {
+    "fixed": PollScheduler,
+    "backoff": BackoffPollScheduler,
+    "adaptive": BackoffPollScheduler,
+    "exponential": BackoffPollScheduler,
+}
+
+
+def create_poll_scheduler(
+    strategy: str = "backoff",
+    interval: Optional[float] = None,
+    initial_interval: Optional[float] = None,
+    factor: Optional[float] = None,
+) -> PollScheduler:
+    """Create a poll scheduler by name.
+
+    :param strategy: `fixed` or `backoff`. `adaptive` and `exponential`
+        are aliases for `backoff`.
+    :type strategy: str
+    :param interval: Fixed interval, or the ceiling of the backoff, in seconds.
+    :type interval: float
+    :param initial_interval: First backoff interval in seconds.
+    :type initial_interval: float
+    :param factor: Backoff multiplier.
+    :type factor: float
+    :return: Poll scheduler.
+    :rtype: PollScheduler
+    :raises ValueError: If the strategy is unknown or the values are invalid.
+    """
+    try:
+        scheduler_class = POLL_STRATEGIES[strategy.strip().lower()]
+    except KeyError:
+        raise ValueError(
+            f"Poll strategy must be one of {', '.join(POLL_STRATEGIES)}, got '{strategy}'."
+        )
+    kwargs = {}
+    if scheduler_class is BackoffPollScheduler:
+        if interval is not None:
+            kwargs["max_interval"] = interval
+        if initial_interval is not None:
+            kwargs["initial_interval"] = initial_interval
+        if factor is not None:
+            kwargs["factor"] = factor
+    elif interval is not None:
+        kwargs["interval"] = interval
+    return scheduler_class(**kwargs)
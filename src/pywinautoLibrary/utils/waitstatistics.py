@@ -0,0 +1,206 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+
+WAIT_STATISTICS_FILE = "pywinauto-wait-statistics.json"
+
+
+class WaitRecord:
+    """Statistics of the searches and waits of one locator or condition."""
+
+    __slots__ = (
+        "calls", "iterations", "matches", "timeouts",
+        "query_time", "sleep_time", "match_time", "max_match_time",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.iterations = 0
+        self.matches = 0
+        self.timeouts = 0
+        self.query_time = 0.0
+        self.sleep_time = 0.0
+        self.match_time = 0.0
+        self.max_match_time = 0.0
+
+    def add(self, iterations: int, query_time: float, elapsed: float, matched: bool):
+        """Add one search or wait. See `WaitStatistics.record`."""
+        self.calls += 1
+        self.iterations += iterations
+        self.query_time += query_time
+        self.sleep_time += max(0.0, elapsed - query_time)
+        if matched:
+            self.matches += 1
+            self.match_time += elapsed
+            self.max_match_time = max(self.max_match_time, elapsed)
+        else:
+            self.timeouts += 1
+
+    @property
+    def total_time(self) -> float:
+        """Seconds spent checking and sleeping."""
+        return self.query_time + self.sleep_time
+
+    def to_dict(self) -> dict:
+        """Get the statistics as a JSON serializable dictionary."""
+        return {
+            "calls": self.calls,
+            "iterations": self.iterations,
+            "matches": self.matches,
+            "timeouts": self.timeouts,
+            "total_time": round(self.total_time, 6),
+            "query_time": round(self.query_time, 6),
+            "sleep_time": round(self.sleep_time, 6),
+            "average_time_to_match": round(self.match_time / self.matches, 6) if self.matches else None,
+            "max_time_to_match": round(self.max_match_time, 6) if self.matches else None,
+        }
+
+
+class WaitStatistics:
+    """Time spent finding elements and waiting, per locator and condition.
+
+    Each search or wait is recorded with the number of times its locator
+    or condition was checked, the time spent checking and the time spent
+    sleeping between checks, and whether it matched before the timeout.
+    Records are aggregated for the whole run, for every suite the search
+    happened in, including the parent suites, and for the current test.
+
+    :param path: Path to the JSON file written by `save`, or a callable
+        returning it when saving. None disables saving.
+    :type path: str or callable
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Union[str, Callable[[], str], None] = None):
+        self._path = path
+        self.total: Dict[Tuple[str, str], WaitRecord] = {}
+        self.suites: Dict[str, Dict[Tuple[str, str], WaitRecord]] = {}
+        self.tests: Dict[str, Dict[Tuple[str, str], WaitRecord]] = {}
+        self._suite_stack: List[str] = []
+        self._test: Optional[str] = None
+
+    @property
+    def path(self) -> Optional[str]:
+        """Path to the JSON file or None."""
+        if callable(self._path):
+            self._path = self._path()
+        return self._path
+
+    def record(self, operation: str, target: str, iterations: int, query_time: float,
+               elapsed: float, matched: bool):
+        """Record one search or wait.
+
+        :param operation: Kind of the operation, e.g. `find` or `wait`.
+        :type operation: str
+        :param target: Locator or condition the operation was for.
+        :type target: str
+        :param iterations: Number of times the locator or condition was checked.
+        :type iterations: int
+        :param query_time: Seconds spent checking.
+        :type query_time: float
+        :param elapsed: Seconds the whole operation took.
+        :type elapsed: float
+        :param matched: Whether the operation succeeded before the timeout.
+        :type matched: bool
+        """
+        key = (operation, target)
+        scopes = [self.total]
+        scopes.extend(self.suites[suite] for suite in self._suite_stack)
+        if self._test is not None:
+            scopes.append(self.tests[self._test])
+        for scope in scopes:
+            record = scope.get(key)
+            if record is None:
+                record = scope[key] = WaitRecord()
+            record.add(iterations, query_time, elapsed, matched)
+
+    def start_suite(self, name: str):
+        """Start recording also for the suite with the long name `name`."""
+        self._suite_stack.append(name)
+        self.suites.setdefault(name, {})
+
+    def end_suite(self, name: str):
+        """Stop recording for the suite `name`."""
+        if name in self._suite_stack:
+            del self._suite_stack[self._suite_stack.index(name):]
+
+    def start_test(self, name: str):
+        """Start recording also for the test with the long name `name`."""
+        self._test = name
+        self.tests.setdefault(name, {})
+
+    def end_test(self, name: str):
+        """Stop recording for the current test."""
+        self._test = None
+
+    def get(self, scope: str = "total", limit: Optional[int] = None) -> List[dict]:
+        """Get the records of a scope, the slowest first.
+
+        :param scope: `total` for the whole run, `suite` for the current
+            suite or `test` for the current test.
+        :type scope: str
+        :param limit: Return at most this many records.
+        :type limit: int
+        :return: Records as dictionaries with `operation` and `target` keys
+            in addition to the statistics.
+        :rtype: list
+        """
+        scope = scope.strip().lower()
+        if scope == "total":
+            records = self.total
+        elif scope == "suite":
+            records = self.suites[self._suite_stack[-1]] if self._suite_stack else {}
+        elif scope == "test":
+            records = self.tests[self._test] if self._test is not None else {}
+        else:
+            raise ValueError(f"Scope must be total, suite or test, got '{scope}'.")
+        entries = _entries(records)
+        return entries[:limit] if limit is not None else entries
+
+    def to_dict(self) -> dict:
+        """Get all the statistics as a JSON serializable dictionary."""
+        return {
+            "version": self.VERSION,
+            "total": _entries(self.total),
+            "suites": {name: _entries(records) for name, records in self.suites.items() if records},
+            "tests": {name: _entries(records) for name, records in self.tests.items() if records},
+        }
+
+    def save(self):
+        """Write the statistics to the JSON file if anything was recorded."""
+        if not self.total or not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=1)
+        os.replace(temporary, self.path)
+
+    def __len__(self) -> int:
+        return len(self.total)
+
+
+def _entries(records: Dict[Tuple[str, str], WaitRecord]) -> List[dict]:
+    entries = [
+        dict(operation=operation, target=target, **record.to_dict())
+        for (operation, target), record in records.items()
+    ]
+    entries.sort(key=lambda entry: -entry["total_time"])
+    return entries
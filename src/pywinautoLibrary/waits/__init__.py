@@ -0,0 +1,65 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from .conditions import (
+    AllOf,
+    AnyOf,
+    Condition,
+    ElementCondition,
+    ElementCount,
+    ElementEnabled,
+    ElementExists,
+    ElementPropertyEquals,
+    ElementTextContains,
+    ElementVisible,
+    Not,
+    WindowStable,
+    parse_condition,
+)
+from .engine import WaitEngine
+from .idle import ApplicationIdle, CpuSampler
+from .events import (
+    EventSource,
+    UIAEventSource,
+    UIAWindowEventSource,
+    create_event_source,
+    create_window_event_source,
+)
+from .wait import Wait
+
+__all__ = [
+    "AllOf",
+    "AnyOf",
+    "ApplicationIdle",
+    "Condition",
+    "CpuSampler",
+    "ElementCondition",
+    "ElementCount",
+    "ElementEnabled",
+    "ElementExists",
+    "ElementPropertyEquals",
+    "ElementTextContains",
+    "ElementVisible",
+    "EventSource",
+    "Not",
+    "UIAEventSource",
+    "UIAWindowEventSource",
+    "Wait",
+    "WaitEngine",
+    "WindowStable",
+    "create_event_source",
+    "create_window_event_source",
+    "parse_condition",
+]
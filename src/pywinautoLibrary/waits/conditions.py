@@ -0,0 +1,490 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import time
+from typing import Any, List, Optional, Set, Type, Union
+
+from pywinautoLibrary.errors import (
+    ElementNotEnabled,
+    ElementNotFound,
+    ElementNotVisible,
+    WaitTimeout,
+)
+from pywinautoLibrary.locators.properties import element_property
+from pywinautoLibrary.locators.snapshot import take_snapshot
+
+
+#: Scope of conditions changed by the contents of the current window
+WINDOW = "window"
+#: Scope of conditions changed by top-level windows opening and closing
+DESKTOP = "desktop"
+
+
+class Condition:
+    """Condition that `Wait` checks until it holds.
+
+    Conditions are checked once per evaluation without waiting, so a wait
+    never takes longer than its own timeout. Conditions can be negated
+    with `~`, e.g. `~ElementVisible("auto_id:Spinner")`.
+    """
+
+    #: Error raised when the condition does not hold within the timeout.
+    error: Type[Exception] = WaitTimeout
+
+    def reset(self):
+        """Forget the state of an earlier wait. Called when a wait starts."""
+        pass
+
+    def evaluate(self, finder: Any) -> Any:
+        """Check the condition once.
+
+        :param finder: Element finder used to locate elements.
+        :type finder: pywinautoLibrary.locators.ElementFinder
+        :return: A true value if the condition holds.
+        :rtype: Any
+        """
+        raise NotImplementedError
+
+    def scopes(self, finder: Any) -> Set[str]:
+        """Get where changes can make the condition hold.
+
+        Waits use this to decide which changes to listen to.
+
+        :param finder: Element finder used to locate elements.
+        :type finder: pywinautoLibrary.locators.ElementFinder
+        :return: `WINDOW` for changes in the current window, `DESKTOP` for
+            top-level windows opening and closing, both, or neither if the
+            condition does not depend on the user interface.
+        :rtype: set
+        """
+        return {WINDOW}
+
+    def describe(self) -> str:
+        """Describe the condition for log and error messages."""
+        return type(self).__name__
+
+    def failure(self) -> Exception:
+        """Get the error to raise when the condition did not hold in time."""
+        return self.error(f"Condition '{self.describe()}' did not hold within timeout.")
+
+    def __invert__(self) -> "Condition":
+        return Not(self)
+
+    def __str__(self) -> str:
+        return self.describe()
+
+
+class Not(Condition):
+    """Condition holding when `condition` does not hold."""
+
+    def __init__(self, condition: Condition):
+        self.condition = condition
+
+    def reset(self):
+        self.condition.reset()
+
+    def evaluate(self, finder: Any) -> bool:
+        return not self.condition.evaluate(finder)
+
+    def scopes(self, finder: Any) -> Set[str]:
+        return self.condition.scopes(finder)
+
+    def describe(self) -> str:
+        return f"not {self.condition.describe()}"
+
+    def __invert__(self) -> Condition:
+        return self.condition
+
+
+class ElementCondition(Condition):
+    """Condition on the first element matching `locator`.
+
+    The condition does not hold while no element matches. If no element
+    was found during the whole wait, the wait fails with `ElementNotFound`
+    instead of the error of the condition.
+
+    :param locator: Locator of the element.
+    :type locator: str
+    :param control_type: Limit matching only to this control type.
+    :type control_type: str
+    """
+
+    #: What is expected of the element, used in error messages.
+    expectation = "exists"
+
+    def __init__(self, locator: str, control_type: Optional[str] = None):
+        self.locator = locator
+        self.control_type = control_type
+        self.found = False
+
+    def reset(self):
+        self.found = False
+
+    def evaluate(self, finder: Any) -> Any:
+        element = finder.probe(self.locator, self.control_type)
+        if element is None:
+            return None
+        self.found = True
+        return element if self.test(element) else None
+
+    def test(self, element: Any) -> bool:
+        """Check the condition on a found element."""
+        return True
+
+    def scopes(self, finder: Any) -> Set[str]:
+        return {DESKTOP if finder.is_window_locator(self.locator, self.control_type) else WINDOW}
+
+    def describe(self) -> str:
+        return f"element '{self.locator}' {self.expectation}"
+
+    def failure(self) -> Exception:
+        if not self.found:
+            return ElementNotFound(f"Element with locator '{self.locator}' not found within timeout.")
+        return self.error(f"Element with locator '{self.locator}' {self.expectation} did not hold within timeout.")
+
+
+class ElementExists(ElementCondition):
+    """Condition holding when an element matches `locator`."""
+
+    error = ElementNotFound
+
+
+class ElementVisible(ElementCondition):
+    """Condition holding when the element is visible, or hidden if `visible` is false."""
+
+    def __init__(self, locator: str, visible: bool = True, control_type: Optional[str] = None):
+        super().__init__(locator, control_type)
+        self.visible = visible
+        self.expectation = "is visible" if visible else "is hidden"
+        self.error = ElementNotVisible if visible else WaitTimeout
+
+    def test(self, element: Any) -> bool:
+        return bool(element.is_visible()) == self.visible
+
+
+class ElementEnabled(ElementCondition):
+    """Condition holding when the element is enabled, or disabled if `enabled` is false."""
+
+    def __init__(self, locator: str, enabled: bool = True, control_type: Optional[str] = None):
+        super().__init__(locator, control_type)
+        self.enabled = enabled
+        self.expectation = "is enabled" if enabled else "is disabled"
+        self.error = ElementNotEnabled if enabled else WaitTimeout
+
+    def test(self, element: Any) -> bool:
+        return bool(element.is_enabled()) == self.enabled
+
+
+class ElementTextContains(ElementCondition):
+    """Condition holding when the text of the element contains `text`."""
+
+    def __init__(self, locator: str, text: str, control_type: Optional[str] = None):
+        super().__init__(locator, control_type)
+        self.text = text
+        self.expectation = f"contains text '{text}'"
+
+    def test(self, element: Any) -> bool:
+        return self.text in element.window_text()
+
+
+class ElementPropertyEquals(ElementCondition):
+    """Condition holding when property `name` of the element equals `value`.
+
+    Values are compared as strings, so `5` given in test data matches a
+    control ID of 5.
+    """
+
+    def __init__(self, locator: str, name: str, value: Any, control_type: Optional[str] = None):
+        super().__init__(locator, control_type)
+        self.name = name
+        self.value = value
+        self.expectation = f"has {name} '{value}'"
+
+    def test(self, element: Any) -> bool:
+        return str(element_property(element, self.name, "")) == str(self.value)
+
+
+class ElementCount(Condition):
+    """Condition holding when exactly `count` elements match `locator`.
+
+    :param locator: Locator of the elements.
+    :type locator: str
+    :param count: Expected number of elements.
+    :type count: int
+    :param control_type: Limit matching only to this control type.
+    :type control_type: str
+    """
+
+    def __init__(self, locator: str, count: int, control_type: Optional[str] = None):
+        self.locator = locator
+        self.count = int(count)
+        self.control_type = control_type
+        self.last = None
+
+    def reset(self):
+        self.last = None
+
+    def evaluate(self, finder: Any) -> bool:
+        self.last = 0
+        for _ in finder.iter_elements(self.locator, self.control_type):
+            self.last += 1
+            if self.last > self.count:
+                return False
+        return self.last == self.count
+
+    def scopes(self, finder: Any) -> Set[str]:
+        return {DESKTOP if finder.is_window_locator(self.locator, self.control_type) else WINDOW}
+
+    def describe(self) -> str:
+        return f"{self.count} elements match '{self.locator}'"
+
+    def failure(self) -> Exception:
+        found = "unknown" if self.last is None else (f"more than {self.count}" if self.last > self.count else self.last)
+        return self.error(
+            f"Expected {self.count} elements with locator '{self.locator}' within timeout, found {found}."
+        )
+
+
+class WindowStable(Condition):
+    """Condition holding when the window has not changed for `quiet_period` seconds.
+
+    Each evaluation captures the names and control types of the whole
+    subtree and compares its fingerprint to the previous one. Any change
+    in the structure or the texts restarts the quiet period.
+
+    :param quiet_period: Seconds the window has to stay unchanged.
+    :type quiet_period: float
+    :param locator: Locator of the element to watch. Defaults to the
+        current window.
+    :type locator: str
+    :param properties: Properties whose changes count.
+    :type properties: tuple
+    :param clock: Monotonic clock function.
+    :type clock: callable
+    """
+
+    PROPERTIES = ("name", "control_type")
+
+    def __init__(
+        self,
+        quiet_period: float,
+        locator: Optional[str] = None,
+        properties: tuple = PROPERTIES,
+        clock=time.monotonic,
+    ):
+        if quiet_period < 0:
+            raise ValueError(f"Quiet period must be zero or positive, got {quiet_period}.")
+        self.quiet_period = quiet_period
+        self.locator = locator
+        self.properties = properties
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self.fingerprint = None
+        self.since = None
+        self.changes = 0
+        self.found = False
+
+    def evaluate(self, finder: Any) -> bool:
+        root = finder.probe(self.locator) if self.locator else finder.get_root_element()
+        if root is None:
+            self.since = None
+            return False
+        self.found = True
+        fingerprint = take_snapshot(root, self.properties).fingerprint()
+        now = self.clock()
+        if self.since is None or fingerprint != self.fingerprint:
+            if self.since is not None:
+                self.changes += 1
+            self.fingerprint, self.since = fingerprint, now
+        return now - self.since >= self.quiet_period
+
+    def describe(self) -> str:
+        target = f"element '{self.locator}'" if self.locator else "window"
+        return f"{target} unchanged for {self.quiet_period:g} s"
+
+    def failure(self) -> Exception:
+        if not self.found:
+            return ElementNotFound(f"Element with locator '{self.locator}' not found within timeout.")
+        return self.error(
+            f"Condition '{self.describe()}' did not hold within timeout, "
+            f"the window changed {self.changes} times."
+        )
+
+
+class _Combination(Condition):
+    """Base class of conditions combining several conditions.
+
+    All the conditions are checked in the same evaluation. When at least
+    two of them search the current window, the window is captured once
+    per evaluation and all the conditions are checked against the same
+    capture, so they see the window in the same state. A UI snapshot that
+    is already active, e.g. taken by the wait, is used as is. Conditions
+    only on top-level windows, such as `title:` locators, do not read the
+    capture, so none is taken for them.
+
+    :param conditions: Conditions to combine.
+    :type conditions: Condition
+    :param share_snapshot: Capture the window once per evaluation.
+    :type share_snapshot: bool
+    """
+
+    def __init__(self, *conditions: Condition, share_snapshot: bool = True):
+        if not conditions:
+            raise ValueError("At least one condition is required.")
+        self.conditions = conditions
+        self.share_snapshot = share_snapshot
+        self.results: List[Any] = [None] * len(conditions)
+        # Whether several conditions search the current window, see `scopes`
+        self._shares_window: Optional[bool] = None
+
+    def reset(self):
+        self.results = [None] * len(self.conditions)
+        for condition in self.conditions:
+            condition.reset()
+
+    def scopes(self, finder: Any) -> Set[str]:
+        return set().union(*(condition.scopes(finder) for condition in self.conditions))
+
+    def _evaluate_all(self, finder: Any, until_true: bool) -> List[Any]:
+        """Evaluate the conditions in order, stopping at the first true one if `until_true`."""
+        self.results = [None] * len(self.conditions)
+        snapshot = self._take_snapshot(finder)
+        try:
+            for index, condition in enumerate(self.conditions):
+                try:
+                    self.results[index] = condition.evaluate(finder)
+                except Exception:
+                    self.results[index] = None
+                if until_true and self.results[index]:
+                    break
+        finally:
+            if snapshot is not None:
+                finder.release_snapshot()
+        return self.results
+
+    def _take_snapshot(self, finder: Any) -> Any:
+        if not self.share_snapshot or len(self.conditions) < 2 or finder.snapshot is not None:
+            return None
+        if self._shares_window is None:
+            self._shares_window = sum(WINDOW in condition.scopes(finder) for condition in self.conditions) > 1
+        if not self._shares_window:
+            return None
+        try:
+            return finder.take_snapshot()
+        except Exception:
+            # Conditions are checked on the live window instead
+            return None
+
+
+class AnyOf(_Combination):
+    """Condition holding when at least one of `conditions` holds.
+
+    Evaluates to a `(index, result)` pair of the first condition, in the
+    given order, that holds.
+    """
+
+    def evaluate(self, finder: Any) -> Any:
+        for index, result in enumerate(self._evaluate_all(finder, until_true=True)):
+            if result:
+                return index, result
+        return None
+
+    def describe(self) -> str:
+        return " or ".join(f"({condition.describe()})" for condition in self.conditions)
+
+    def failure(self) -> Exception:
+        return self.error(f"None of the conditions {self.describe()} held within timeout.")
+
+
+class AllOf(_Combination):
+    """Condition holding when all of `conditions` hold at the same time.
+
+    Evaluates to the list of the results of the conditions.
+    """
+
+    def evaluate(self, finder: Any) -> Any:
+        results = self._evaluate_all(finder, until_true=False)
+        return results if all(results) else None
+
+    def describe(self) -> str:
+        return " and ".join(f"({condition.describe()})" for condition in self.conditions)
+
+    def failure(self) -> Exception:
+        failing = [condition.describe() for condition, result in zip(self.conditions, self.results)
+                   if not result]
+        return self.error(
+            f"Conditions did not all hold within timeout. Not holding: {', '.join(failing)}."
+        )
+
+
+_CONDITION = re.compile(r"^\s*(?P<state>[^:]+?)\s*:\s*(?P<locator>.+?)\s*$", re.DOTALL)
+_SIMPLE_STATES = {
+    "exists": lambda locator: ElementExists(locator),
+    "visible": lambda locator: ElementVisible(locator),
+    "hidden": lambda locator: ElementVisible(locator, visible=False),
+    "enabled": lambda locator: ElementEnabled(locator),
+    "disabled": lambda locator: ElementEnabled(locator, enabled=False),
+}
+
+
+def parse_condition(condition: Union[str, Condition]) -> Condition:
+    """Create a condition from its text form.
+
+    The text form is `state: locator`, where state is one of `exists`,
+    `visible`, `hidden`, `enabled`, `disabled`, `contains <text>`,
+    `count <number>` or `property <name>=<value>`, optionally preceded by
+    `not`. For example `visible: auto_id:OkButton`, `not exists: Spinner`
+    or `contains Saved: auto_id:Status`. A text without a known state is
+    a locator of an element that has to exist, e.g. `title:Error`. The
+    state ends at the first colon, so the text of `contains` cannot
+    contain colons.
+
+    :param condition: Condition text, or a condition which is returned as is.
+    :type condition: str or Condition
+    :return: The condition.
+    :rtype: Condition
+    :raises ValueError: If the condition is empty.
+    """
+    if isinstance(condition, Condition):
+        return condition
+    if not condition or not condition.strip():
+        raise ValueError("Condition cannot be empty.")
+    match = _CONDITION.match(condition)
+    parsed = _parse_state(match.group("state"), match.group("locator")) if match else None
+    return parsed or ElementExists(condition.strip())
+
+
+def _parse_state(state: str, locator: str) -> Optional[Condition]:
+    negate = False
+    words = state.split(None, 1)
+    if words[0].lower() == "not" and len(words) == 2:
+        negate, state = True, words[1]
+        words = state.split(None, 1)
+    keyword = words[0].lower()
+    argument = words[1] if len(words) == 2 else None
+    if keyword in _SIMPLE_STATES and argument is None:
+        condition = _SIMPLE_STATES[keyword](locator)
+    elif keyword == "contains" and argument is not None:
+        condition = ElementTextContains(locator, argument)
+    elif keyword == "count" and argument is not None and argument.strip().isdigit():
+        condition = ElementCount(locator, int(argument))
+    elif keyword == "property" and argument is not None and "=" in argument:
+        name, value = argument.split("=", 1)
+        condition = ElementPropertyEquals(locator, name.strip(), value.strip())
+    else:
+        return None
+    return ~condition if negate else condition
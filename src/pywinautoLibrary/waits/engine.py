@@ -0,0 +1,118 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import time
+from typing import Any, Callable, Optional
+
+from pywinautoLibrary.utils import PollScheduler
+from .events import EventSource
+
+
+class WaitEngine:
+    """Evaluate a condition until it holds or a deadline passes.
+
+    The condition is evaluated once before the event source is started, so
+    waits for conditions that already hold never subscribe to changes.
+    After that, when an event source is available the condition is
+    re-evaluated only after the source reports a change, with a re-check at
+    least every `fallback_interval` seconds in case a change was not
+    notified. Without an event source, or if subscribing fails, the
+    condition is polled using the poll scheduler.
+    """
+
+    def __init__(
+        self,
+        scheduler: PollScheduler,
+        event_source: Optional[EventSource] = None,
+        fallback_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the wait engine.
+
+        :param scheduler: Poll scheduler used when there are no events.
+        :type scheduler: pywinautoLibrary.utils.PollScheduler
+        :param event_source: Optional source of change notifications.
+        :type event_source: pywinautoLibrary.waits.EventSource
+        :param fallback_interval: Longest time between evaluations while
+            waiting for events, in seconds.
+        :type fallback_interval: float
+        :param clock: Monotonic clock function.
+        :type clock: callable
+        :param sleep: Sleep function used when polling.
+        :type sleep: callable
+        """
+        self.scheduler = scheduler
+        self.event_source = event_source
+        self.fallback_interval = fallback_interval
+        self.clock = clock
+        self.sleep = sleep
+        self.evaluations = 0
+        self.query_time = 0.0
+
+    def until(self, condition: Callable[[], Any], timeout: float, root: Any = None) -> Any:
+        """Wait until `condition` returns a true value.
+
+        :param condition: Callable evaluated without waiting. Exceptions
+            count as the condition not holding.
+        :type condition: callable
+        :param timeout: Seconds to wait.
+        :type timeout: float
+        :param root: Root element whose changes are relevant to the condition.
+        :type root: Any
+        :return: The true value returned by `condition`, or None on timeout.
+        :rtype: Any
+        """
+        deadline = self.clock() + max(timeout, 0)
+        # Conditions that already hold do not pay for subscribing to events
+        result = self._evaluate(condition)
+        if result:
+            return result
+        remaining = deadline - self.clock()
+        if remaining <= 0:
+            return None
+        events = self.event_source
+        if events is not None and (root is None or not events.start(root, remaining)):
+            events = None
+        try:
+            intervals = self.scheduler.intervals()
+            if events is not None:
+                # Changes made while subscribing were not notified
+                events.clear()
+                result = self._evaluate(condition)
+            while not result:
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    return None
+                if events is not None:
+                    events.wait(min(remaining, self.fallback_interval))
+                    events.clear()
+                else:
+                    self.sleep(min(next(intervals), remaining))
+                result = self._evaluate(condition)
+            return result
+        finally:
+            if events is not None:
+                events.stop()
+
+    def _evaluate(self, condition: Callable[[], Any]) -> Any:
+        self.evaluations += 1
+        start = time.perf_counter()
+        try:
+            return condition()
+        except Exception:
+            return None
+        finally:
+            self.query_time += time.perf_counter() - start
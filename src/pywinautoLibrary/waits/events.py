@@ -0,0 +1,247 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+from typing import Any, Optional
+
+
+class EventSource:
+    """Source of change notifications from the application under test.
+
+    An event source is started for a root element, after which `notify` is
+    called whenever something in that subtree changes. Waits clear the
+    source before checking their condition and then block in `wait` until
+    the next change, instead of polling the control tree.
+
+    This base class does not subscribe to anything by itself, so it can be
+    driven directly by calling `notify`.
+    """
+
+    def __init__(self):
+        self._changed = threading.Event()
+        self.events = 0
+
+    def start(self, root: Any, timeout: Optional[float] = None) -> bool:
+        """Start listening to changes under `root`.
+
+        :param root: Root element whose subtree to observe.
+        :type root: Any
+        :param timeout: Longest time to spend subscribing in seconds, or
+            None for the default of the source.
+        :type timeout: float
+        :return: True if notifications will be delivered, False if the
+            caller needs to fall back to polling.
+        :rtype: bool
+        """
+        return True
+
+    def stop(self):
+        """Stop listening to changes."""
+        pass
+
+    def notify(self, *args):
+        """Signal that something changed.
+
+        Accepts and ignores any arguments so it can be used directly as an
+        event handler callback. Safe to call from any thread.
+        """
+        self.events += 1
+        self._changed.set()
+
+    def clear(self):
+        """Forget changes notified so far."""
+        self._changed.clear()
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a change is notified or `timeout` expires.
+
+        Changes notified after the last `clear` return immediately.
+
+        :param timeout: Longest time to block in seconds.
+        :type timeout: float
+        :return: True if a change was notified, False on timeout.
+        :rtype: bool
+        """
+        return self._changed.wait(max(timeout, 0))
+
+
+class UIAEventSource(EventSource):
+    """Event source backed by UI Automation event handlers.
+
+    Structure changes and changes of the properties waits are interested in
+    are subscribed to for the whole subtree of the root element. UIA calls
+    event handlers on its own threads, and handlers registered from a
+    single-threaded apartment only run while that thread pumps messages,
+    so the handlers are registered from a dedicated multi-threaded
+    apartment thread that lives as long as the subscription.
+    """
+
+    PROPERTIES = (
+        "UIA_NamePropertyId",
+        "UIA_IsEnabledPropertyId",
+        "UIA_IsOffscreenPropertyId",
+        "UIA_ValueValuePropertyId",
+        "UIA_ToggleToggleStatePropertyId",
+        "UIA_BoundingRectanglePropertyId",
+    )
+
+    #: Longest time to wait for the subscription by default, in seconds
+    SUBSCRIBE_TIMEOUT = 5.0
+
+    def __init__(self):
+        super().__init__()
+        self._thread = None
+        self._stopped = threading.Event()
+        self._ready = threading.Event()
+        self._subscribed = False
+
+    def start(self, root: Any, timeout: Optional[float] = None) -> bool:
+        element = self._element(root)
+        if element is None:
+            return False
+        self._stopped.clear()
+        self._ready.clear()
+        self._subscribed = False
+        self._thread = threading.Thread(
+            target=self._run, args=(element,), name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+        if timeout is None:
+            timeout = self.SUBSCRIBE_TIMEOUT
+        if not self._ready.wait(max(min(timeout, self.SUBSCRIBE_TIMEOUT), 0)):
+            # A subscription made after giving up is removed by the thread right away
+            self._stopped.set()
+            self._thread = None
+            return False
+        return self._subscribed
+
+    def stop(self):
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join(5)
+            self._thread = None
+
+    def _element(self, root: Any) -> Any:
+        """Get the UIA element to register the handlers on."""
+        return getattr(getattr(root, "element_info", None), "element", None)
+
+    def _register(self, uia, element, handler):
+        scope = uia.tree_scope["subtree"]
+        dll = uia.UIA_dll
+        properties = [getattr(dll, name) for name in self.PROPERTIES if hasattr(dll, name)]
+        uia.iuia.AddStructureChangedEventHandler(element, scope, None, handler)
+        uia.iuia.AddPropertyChangedEventHandler(element, scope, None, handler, properties)
+
+    def _unregister(self, uia, element, handler):
+        uia.iuia.RemoveStructureChangedEventHandler(element, handler)
+        uia.iuia.RemovePropertyChangedEventHandler(element, handler)
+
+    def _run(self, element):
+        import comtypes
+        from comtypes import COMObject
+        from pywinauto.uia_defines import IUIA
+
+        comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+        try:
+            uia = IUIA()
+            dll = uia.UIA_dll
+            source = self
+
+            class Handler(COMObject):
+                _com_interfaces_ = [
+                    dll.IUIAutomationStructureChangedEventHandler,
+                    dll.IUIAutomationPropertyChangedEventHandler,
+                    dll.IUIAutomationEventHandler,
+                ]
+
+                def HandleStructureChangedEvent(self, sender, change_type, runtime_id):
+                    source.notify()
+
+                def HandlePropertyChangedEvent(self, sender, property_id, new_value):
+                    source.notify()
+
+                def HandleAutomationEvent(self, sender, event_id):
+                    source.notify()
+
+            handler = Handler()
+            try:
+                self._register(uia, element, handler)
+                self._subscribed = True
+            except Exception:
+                self._subscribed = False
+            self._ready.set()
+            if self._subscribed:
+                self._stopped.wait()
+                self._unregister(uia, element, handler)
+        except Exception:
+            self._subscribed = False
+        finally:
+            self._ready.set()
+            comtypes.CoUninitialize()
+
+
+class UIAWindowEventSource(UIAEventSource):
+    """Event source notified when top-level windows open or close.
+
+    Subscribes to the window events of the whole desktop, so the root given
+    to `start` is ignored.
+    """
+
+    EVENTS = ("UIA_Window_WindowOpenedEventId", "UIA_Window_WindowClosedEventId")
+
+    def _element(self, root: Any) -> Any:
+        try:
+            from pywinauto.uia_defines import IUIA
+            return IUIA().root
+        except Exception:
+            return None
+
+    def _register(self, uia, element, handler):
+        scope = uia.tree_scope["subtree"]
+        for name in self.EVENTS:
+            uia.iuia.AddAutomationEventHandler(getattr(uia.UIA_dll, name), element, scope, None, handler)
+
+    def _unregister(self, uia, element, handler):
+        for name in self.EVENTS:
+            uia.iuia.RemoveAutomationEventHandler(getattr(uia.UIA_dll, name), element, handler)
+
+
+def create_event_source(root: Any) -> Optional[EventSource]:
+    """Create an event source suitable for the backend of `root`.
+
+    :param root: Root element to observe.
+    :type root: Any
+    :return: Event source, or None if the backend does not provide change
+        notifications and waits have to poll.
+    :rtype: EventSource or None
+    """
+    info = getattr(root, "element_info", None)
+    if type(info).__name__ == "UIAElementInfo":
+        return UIAEventSource()
+    return None
+
+
+def create_window_event_source(app: Any) -> Optional[EventSource]:
+    """Create an event source for windows of `app` opening and closing.
+
+    :param app: pywinauto application.
+    :type app: pywinauto.application.Application
+    :return: Event source, or None if the backend of the application does
+        not provide window notifications.
+    :rtype: EventSource or None
+    """
+    if getattr(getattr(app, "backend", None), "name", None) == "uia":
+        return UIAWindowEventSource()
+    return None
@@ -0,0 +1,199 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Set
+
+from pywinautoLibrary.errors import MissingDependency
+from .conditions import Condition
+
+
+class CpuSampler:
+    """Sample the CPU usage of a process in a background thread.
+
+    Every `interval` seconds the thread reads the CPU times of the process,
+    and optionally of all its child processes, and records the usage since
+    the previous sample as a percentage of one CPU. Reading the samples is
+    cheap, so waits can check them on every poll.
+
+    Child processes are looked up on every sample, and a child contributes
+    from its second sample on, so processes starting and exiting between
+    samples do not distort the usage.
+
+    A process that does not exist when the sampler is created, or that
+    exits while sampling, is marked as `exited` and no longer sampled.
+
+    Requires the `psutil` module.
+
+    :param pid: Process ID of the process to sample.
+    :type pid: int
+    :param interval: Seconds between samples.
+    :type interval: float
+    :param include_children: Include the usage of all child processes.
+    :type include_children: bool
+    :param history: Number of most recent samples to keep.
+    :type history: int
+    """
+
+    def __init__(
+        self,
+        pid: int,
+        interval: float = 0.1,
+        include_children: bool = False,
+        history: int = 100,
+    ):
+        try:
+            import psutil
+        except ImportError:
+            raise MissingDependency(
+                "Sampling CPU usage requires the psutil module. Install it with 'pip install psutil'."
+            )
+        if interval <= 0:
+            raise ValueError(f"Sampling interval must be positive, got {interval}.")
+        self.pid = pid
+        self.interval = interval
+        self.include_children = include_children
+        self._psutil = psutil
+        try:
+            self.process = psutil.Process(pid)
+            self.exited = False
+        except psutil.NoSuchProcess:
+            self.process = None
+            self.exited = True
+        self.history = history
+        self.count = 0
+        self._samples: deque = deque(maxlen=history)
+        self._times: Dict[int, float] = {}
+        self._previous: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "CpuSampler":
+        """Take the first reading and start sampling in the background."""
+        self._read()
+        self._thread = threading.Thread(target=self._run, name=f"CpuSampler-{self.pid}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop sampling and wait for the background thread to end."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def samples(self) -> List[float]:
+        """Kept samples, oldest first, in percents of one CPU."""
+        with self._lock:
+            return list(self._samples)
+
+    def recent(self, count: int) -> List[float]:
+        """Get the `count` most recent samples, oldest first."""
+        with self._lock:
+            return list(self._samples)[-count:]
+
+    def _run(self):
+        while not self._stopped.wait(self.interval) and not self.exited:
+            self._read()
+
+    def _read(self):
+        if self.exited:
+            return
+        now = time.monotonic()
+        try:
+            times = {self.pid: self._cpu_time(self.process)}
+            children = self.process.children(recursive=True) if self.include_children else ()
+        except self._psutil.NoSuchProcess:
+            self.exited = True
+            return
+        for child in children:
+            try:
+                times[child.pid] = self._cpu_time(child)
+            except self._psutil.Error:
+                # Exited or inaccessible children do not count
+                pass
+        if self._previous is not None and now > self._previous:
+            used = sum(
+                max(0.0, spent - self._times[pid]) for pid, spent in times.items() if pid in self._times
+            )
+            with self._lock:
+                self._samples.append(100.0 * used / (now - self._previous))
+                self.count += 1
+        self._times, self._previous = times, now
+
+    @staticmethod
+    def _cpu_time(process: Any) -> float:
+        times = process.cpu_times()
+        return times.user + times.system
+
+    def __enter__(self) -> "CpuSampler":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class ApplicationIdle(Condition):
+    """Condition holding when the CPU usage of a process has stayed low.
+
+    The condition holds when the last `samples` samples of `sampler` are
+    all below `threshold` percent, or when the process has exited. Only
+    samples recorded after the wait started count.
+
+    :param sampler: Sampler of the process.
+    :type sampler: CpuSampler
+    :param threshold: Highest accepted usage in percents of one CPU.
+    :type threshold: float
+    :param samples: Number of consecutive samples that must be below
+        `threshold`.
+    :type samples: int
+    """
+
+    def __init__(self, sampler: CpuSampler, threshold: float = 5.0, samples: int = 5):
+        if not 1 <= samples <= sampler.history:
+            raise ValueError(f"Number of samples must be from 1 to {sampler.history}, got {samples}.")
+        self.sampler = sampler
+        self.threshold = threshold
+        self.samples = samples
+        self._start = 0
+
+    def reset(self):
+        self._start = self.sampler.count
+
+    def evaluate(self, finder: Any) -> bool:
+        if self.sampler.exited:
+            return True
+        if self.sampler.count - self._start < self.samples:
+            return False
+        return max(self.sampler.recent(self.samples)) < self.threshold
+
+    def scopes(self, finder: Any) -> Set[str]:
+        return set()
+
+    def describe(self) -> str:
+        return (
+            f"CPU usage of process {self.sampler.pid} below {self.threshold:g}% "
+            f"for {self.samples} samples"
+        )
+
+    def failure(self) -> Exception:
+        recent = ", ".join(f"{sample:.1f}%" for sample in self.sampler.recent(self.samples))
+        return self.error(
+            f"Condition '{self.describe()}' did not hold within timeout, "
+            f"last samples were {recent or 'not taken'}."
+        )
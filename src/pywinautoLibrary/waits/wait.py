@@ -0,0 +1,187 @@
+# Copyright 2023-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import time
+from typing import Any, Callable, Optional, Type
+
+from pywinautoLibrary.locators import SnapshotNode
+from pywinautoLibrary.utils import PollScheduler, WaitStatistics
+from .conditions import DESKTOP, WINDOW, Condition
+from .engine import WaitEngine
+
+
+class Wait:
+    """Wait for conditions on the application under test.
+
+    Each wait has a single monotonic deadline. Conditions are evaluated
+    without waiting, and between evaluations the wait blocks until the
+    window reports a change or, without change notifications, sleeps
+    according to the poll scheduler. A wait therefore never takes longer
+    than its timeout plus one evaluation.
+
+    When a UI snapshot is active, every evaluation after the first one
+    takes a new snapshot, while changes are observed on the live window.
+
+    Conditions on top-level windows, such as `title:` locators, cannot be
+    notified by changes in the current window. They wait for windows of
+    the application opening and closing instead. Conditions on both the
+    current window and top-level windows, or on neither, are polled.
+    """
+
+    def __init__(
+        self,
+        finder: Any,
+        scheduler: PollScheduler,
+        event_source_factory: Optional[Callable[[Any], Any]] = None,
+        window_event_source_factory: Optional[Callable[[Any], Any]] = None,
+        fallback_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        statistics: Optional[WaitStatistics] = None,
+    ):
+        """Initialize the wait.
+
+        :param finder: Element finder used by the conditions.
+        :type finder: pywinautoLibrary.locators.ElementFinder
+        :param scheduler: Poll scheduler used when there are no events.
+        :type scheduler: pywinautoLibrary.utils.PollScheduler
+        :param event_source_factory: Callable returning an event source for
+            a root element, or None to always poll.
+        :type event_source_factory: callable
+        :param window_event_source_factory: Callable returning an event
+            source notified when windows of the given application open or
+            close, or None to poll conditions on top-level windows.
+        :type window_event_source_factory: callable
+        :param fallback_interval: Longest time between evaluations while
+            waiting for events, in seconds.
+        :type fallback_interval: float
+        :param clock: Monotonic clock function.
+        :type clock: callable
+        :param sleep: Sleep function used when polling.
+        :type sleep: callable
+        :param statistics: Where to record the waits, or None.
+        :type statistics: pywinautoLibrary.utils.WaitStatistics
+        """
+        self.finder = finder
+        self.scheduler = scheduler
+        self.event_source_factory = event_source_factory
+        self.window_event_source_factory = window_event_source_factory
+        self.fallback_interval = fallback_interval
+        self.clock = clock
+        self.sleep = sleep
+        self.statistics = statistics
+        self.evaluations = 0
+
+    def until(
+        self, condition: Condition, timeout: float, error: Optional[Type[Exception]] = None
+    ) -> Any:
+        """Wait until `condition` holds.
+
+        :param condition: Condition to wait for.
+        :type condition: pywinautoLibrary.waits.Condition
+        :param timeout: Seconds to wait.
+        :type timeout: float
+        :param error: Error to raise on timeout instead of the error of the
+            condition.
+        :type error: type
+        :return: The true value returned by the condition, such as the
+            element it holds for.
+        :rtype: Any
+        :raises Exception: The error of the condition, or `error`, if the
+            condition does not hold within the timeout.
+        """
+        result = self.poll(condition, timeout)
+        if not result:
+            failure = condition.failure()
+            if error is not None:
+                failure = error(str(failure))
+            raise failure
+        return result
+
+    def poll(self, condition: Condition, timeout: float) -> Any:
+        """Wait until `condition` holds, returning None on timeout.
+
+        :param condition: Condition to wait for.
+        :type condition: pywinautoLibrary.waits.Condition
+        :param timeout: Seconds to wait.
+        :type timeout: float
+        :return: The true value returned by the condition, or None.
+        :rtype: Any
+        """
+        condition.reset()
+        finder = self.finder
+        try:
+            root = finder.get_root_element()
+        except Exception:
+            root = None
+
+        def check():
+            return condition.evaluate(finder)
+
+        if isinstance(root, SnapshotNode):
+            # Subscribe to the live window and check each change on a new snapshot
+            root = root.wrapper
+            evaluations = itertools.count()
+
+            def check():
+                if next(evaluations):
+                    finder.refresh_snapshot()
+                return condition.evaluate(finder)
+
+        scopes = condition.scopes(finder)
+        if scopes == {WINDOW}:
+            event_source = self._event_source(self.event_source_factory, root)
+        elif scopes == {DESKTOP}:
+            try:
+                root = finder.ctx.app
+            except Exception:
+                root = None
+            event_source = self._event_source(self.window_event_source_factory, root)
+            if event_source is not None:
+                check = self._refresh_windows(check, event_source)
+        else:
+            event_source = None
+        engine = WaitEngine(self.scheduler, event_source, self.fallback_interval, self.clock, self.sleep)
+        start = self.clock()
+        result = None
+        try:
+            result = engine.until(check, timeout, root)
+            return result
+        finally:
+            self.evaluations += engine.evaluations
+            if self.statistics is not None:
+                self.statistics.record(
+                    "wait", condition.describe(), engine.evaluations, engine.query_time,
+                    self.clock() - start, bool(result),
+                )
+
+    @staticmethod
+    def _event_source(factory: Optional[Callable[[Any], Any]], root: Any) -> Any:
+        return factory(root) if factory and root is not None else None
+
+    def _refresh_windows(self, check: Callable[[], Any], event_source: Any) -> Callable[[], Any]:
+        """Wrap `check` to list the windows again after each notification."""
+        finder = self.finder
+        notified = event_source.events
+
+        def refreshing_check():
+            nonlocal notified
+            if event_source.events != notified:
+                # The window cache may not have seen the notification yet
+                notified = event_source.events
+                finder.window_cache.expire()
+            return check()
+
+        return refreshing_check
@@ -0,0 +1,23 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--timing", action="store_true", default=False,
+        help="Run tests measuring wall-clock time, which depend on the speed of the machine.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--timing"):
+        return
+    skip = pytest.mark.skip(reason="Measures wall-clock time, run with --timing.")
+    for item in items:
+        if "timing" in item.keywords:
+            item.add_marker(skip)
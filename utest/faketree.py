@@ -0,0 +1,170 @@
+"""In-memory control tree exposing the pywinauto wrapper interface.
+
+Used by the unit and performance tests so that locator strategies can be
+exercised without a Windows desktop. Enumerating children costs one
+backend call plus one per returned child, like UIA creating an element for
+each child, and every element info property read costs one backend call.
+"""
+
+import itertools
+
+
+class BackendCounter:
+
+    def __init__(self):
+        self.calls = 0
+
+    def reset(self):
+        self.calls = 0
+
+
+class FakeElementInfo:
+
+    _ids = itertools.count(1)
+
+    def __init__(self, counter, name="", automation_id="", control_id=None,
+                 class_name="", control_type="Pane", enabled=True, visible=True,
+                 rectangle=(0, 0, 10, 10)):
+        self._counter = counter
+        self._props = {
+            "name": name,
+            "automation_id": automation_id,
+            "control_id": control_id,
+            "class_name": class_name,
+            "control_type": control_type,
+            "enabled": enabled,
+            "visible": visible,
+            "rectangle": rectangle,
+            "runtime_id": (42, next(self._ids)),
+            "handle": None,
+        }
+
+    def __getattr__(self, name):
+        props = self.__dict__.get("_props", {})
+        if name not in props:
+            raise AttributeError(name)
+        self._counter.calls += 1
+        return props[name]
+
+    def set(self, **props):
+        self._props.update(props)
+
+
+class FakeWrapper:
+
+    def __init__(self, counter, children=(), **props):
+        self._counter = counter
+        self.element_info = FakeElementInfo(counter, **props)
+        self._children = list(children)
+        self.parent = None
+        self.exists = True
+        self.actions = []
+        for child in self._children:
+            child.parent = self
+
+    def children(self, **criteria):
+        children = self._children
+        control_type = criteria.get("control_type")
+        if control_type:
+            children = [c for c in children if c.element_info._props["control_type"] == control_type]
+        class_name = criteria.get("class_name")
+        if class_name:
+            children = [c for c in children if c.element_info._props["class_name"] == class_name]
+        self._counter.calls += 1 + len(children)
+        return list(children)
+
+    def add(self, child):
+        child.parent = self
+        self._children.append(child)
+        return child
+
+    def remove(self, child):
+        self._children.remove(child)
+        child.parent = None
+        child.exists = False
+
+    def window_text(self):
+        return self.element_info.name
+
+    def class_name(self):
+        return self.element_info.class_name
+
+    def control_id(self):
+        return self.element_info.control_id
+
+    def is_enabled(self):
+        return self.element_info.enabled
+
+    def is_visible(self):
+        return self.element_info.visible
+
+    def rectangle(self):
+        return self.element_info.rectangle
+
+    def click(self):
+        self.actions.append("click")
+
+    def set_text(self, text):
+        self.actions.append(("set_text", text))
+        self.element_info.set(name=text)
+
+    def __repr__(self):
+        props = self.element_info._props
+        return f"<FakeWrapper {props['control_type']} {props['automation_id'] or props['name']!r}>"
+
+
+class FakeApp:
+
+    def __init__(self, *windows):
+        self._windows = list(windows)
+
+    def top_window(self):
+        return self._windows[0]
+
+    def windows(self, title_re=None, class_name=None):
+        import re
+        windows = self._windows
+        if title_re:
+            windows = [w for w in windows if re.match(title_re, w.element_info._props["name"])]
+        if class_name:
+            windows = [w for w in windows if w.element_info._props["class_name"] == class_name]
+        return list(windows)
+
+    def kill(self):
+        pass
+
+
+class FakeContext:
+
+    def __init__(self, app, timeout=0.0, poll_scheduler=None):
+        from pywinautoLibrary.utils import BackoffPollScheduler
+        self.app = app
+        self.timeout = timeout
+        self.poll_scheduler = poll_scheduler or BackoffPollScheduler()
+        self.probe_timeout = 0.0
+
+
+def build_wide_window(counter, width, name="Main"):
+    children = [
+        FakeWrapper(counter, name=f"Field {i}", automation_id=f"field{i}",
+                    control_id=1000 + i, control_type="Edit" if i % 2 else "Button")
+        for i in range(width)
+    ]
+    return FakeWrapper(counter, children, name=name, control_type="Window", class_name="MainWindow")
+
+
+def build_deep_window(counter, depth, fanout, name="Main"):
+    def build(level, path):
+        if level == depth:
+            return []
+        nodes = []
+        for i in range(fanout):
+            child_path = path + (i,)
+            label = "_".join(map(str, child_path))
+            nodes.append(FakeWrapper(
+                counter, build(level + 1, child_path), name=f"Item {label}",
+                automation_id=f"item_{label}", control_id=None,
+                control_type="Pane" if level + 1 < depth else "Button",
+                class_name=f"Class{level}"))
+        return nodes
+    return FakeWrapper(counter, build(0, ()), name=name, control_type="Window", class_name="MainWindow")
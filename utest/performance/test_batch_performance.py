@@ -0,0 +1,23 @@
+from faketree import BackendCounter, FakeApp, FakeContext, build_wide_window
+from pywinautoLibrary.locators import ElementFinder
+
+
+def test_form_resolved_in_one_traversal():
+    counter = BackendCounter()
+    window = build_wide_window(counter, 200)
+    finder = ElementFinder(FakeContext(FakeApp(window)), element_cache=False)
+    # 60 fields of a form, found by automation ID, control ID and text
+    locators = ([f"field{i}" for i in range(0, 120, 3)]
+                + [f"control_id:{1000 + i}" for i in range(1, 120, 12)]
+                + [f"text:Field {i}$" for i in range(2, 120, 12)])
+
+    counter.reset()
+    expected = {locator: finder.find(locator) for locator in locators}
+    single_calls = counter.calls
+
+    counter.reset()
+    assert finder.find_many(locators) == expected
+
+    assert counter.calls * 10 < single_calls, (
+        f"batched: {counter.calls} backend calls, one by one: {single_calls} backend calls"
+    )
@@ -0,0 +1,35 @@
+import pytest
+
+from faketree import BackendCounter, FakeApp, FakeContext, FakeWrapper
+from pywinautoLibrary.locators import ElementFinder
+
+
+def build_pane(counter, width):
+    """Window with `width` elements of which one in ten is a button."""
+    children = [
+        FakeWrapper(counter, name=f"Cell {i}", automation_id=f"cell{i}",
+                    control_type="Button" if i % 10 == 0 else "Text")
+        for i in range(width)
+    ]
+    return FakeWrapper(counter, children, name="Main", control_type="Window")
+
+
+@pytest.mark.parametrize("width", [500, 2000])
+def test_control_type_prunes_siblings(width):
+    counter = BackendCounter()
+    window = build_pane(counter, width)
+    finder = ElementFinder(FakeContext(FakeApp(window)), element_cache=False)
+    # Text only match of the last button, the worst case for the default strategy
+    locator = f"Cell {width - 10}$"
+
+    counter.reset()
+    unfiltered = [e for e in finder.find(locator, first_only=False)
+                  if e.element_info._props["control_type"] == "Button"]
+    unfiltered_calls = counter.calls
+
+    counter.reset()
+    assert finder.find(f"Button#{locator}", first_only=False) == unfiltered
+
+    assert counter.calls * 5 < unfiltered_calls, (
+        f"Button only: {counter.calls} backend calls, unfiltered: {unfiltered_calls} backend calls"
+    )
@@ -0,0 +1,48 @@
+import pytest
+
+from faketree import BackendCounter, FakeApp, FakeContext, build_wide_window
+from pywinautoLibrary.locators import ElementFinder
+
+
+def three_pass_default(finder, root, locator):
+    """Default strategy as auto_id, control_id and text searches in turn."""
+    return (list(finder._find_by_auto_id(root, locator))
+            or list(finder._find_by_control_id(root, locator))
+            or list(finder._find_by_text(root, locator)))
+
+
+@pytest.mark.parametrize("width", [200, 500])
+def test_single_pass_reduces_backend_calls(width):
+    counter = BackendCounter()
+    window = build_wide_window(counter, width)
+    finder = ElementFinder(FakeContext(FakeApp(window)), element_cache=False)
+    # Matches by text only, which is the worst case for the default strategy
+    locator = finder.compile(f"Field {width - 1}")
+
+    counter.reset()
+    expected = three_pass_default(finder, window, locator)
+    three_pass_calls = counter.calls
+
+    counter.reset()
+    assert list(finder._find_by_default(window, locator)) == expected
+
+    assert counter.calls == three_pass_calls - 2 * (width + 1), (
+        f"three passes: {three_pass_calls} backend calls, single pass: {counter.calls}"
+    )
+
+
+@pytest.mark.parametrize("width", [200, 500])
+def test_auto_id_match_skips_lower_priority_reads(width):
+    counter = BackendCounter()
+    window = build_wide_window(counter, width)
+    finder = ElementFinder(FakeContext(FakeApp(window)), element_cache=False)
+    locator = finder.compile("field0")
+
+    counter.reset()
+    three_pass_default(finder, window, locator)
+    three_pass_calls = counter.calls
+
+    counter.reset()
+    next(finder._find_by_default(window, locator))
+    assert counter.calls == width + 2
+    assert three_pass_calls == 2 * width + 1
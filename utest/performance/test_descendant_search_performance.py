@@ -0,0 +1,21 @@
+from faketree import BackendCounter, FakeApp, FakeContext, build_deep_window
+from pywinautoLibrary.locators import ElementFinder
+
+
+def test_first_match_does_not_walk_the_whole_form():
+    counter = BackendCounter()
+    window = build_deep_window(counter, depth=5, fanout=6)
+    finder = ElementFinder(FakeContext(FakeApp(window)), element_cache=False,
+                           search_depth=None, search_order="depth_first")
+
+    counter.reset()
+    all_buttons = finder.find("text:Item 0_", first_only=False)
+    full_calls = counter.calls
+
+    counter.reset()
+    first = finder.find("text:Item 0_")
+
+    assert first is all_buttons[0]
+    assert counter.calls * 100 < full_calls, (
+        f"first match: {counter.calls} backend calls, all matches: {full_calls} backend calls"
+    )
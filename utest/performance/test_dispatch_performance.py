@@ -0,0 +1,56 @@
+from pywinautoLibrary.utils import DynamicCore, keyword
+
+
+class CountingDict(dict):
+    """Keyword table counting the entries each operation touches."""
+
+    touched = 0
+
+    def get(self, key, default=None):
+        CountingDict.touched += 1
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        CountingDict.touched += 1
+        return super().__getitem__(key)
+
+    def __iter__(self):
+        CountingDict.touched += len(self)
+        return super().__iter__()
+
+    def items(self):
+        CountingDict.touched += len(self)
+        return super().items()
+
+    def values(self):
+        CountingDict.touched += len(self)
+        return super().values()
+
+
+def build_library(count):
+    """Library instance with `count` keywords named `Keyword Number <i>`."""
+    methods = {f"keyword_number_{i}": keyword(lambda self, i=i: i) for i in range(count)}
+    return type(f"Library{count}", (), methods)()
+
+
+def dispatch_cost(core, name):
+    """Run keyword `name` and return the number of table entries touched."""
+    core._keywords = CountingDict(core._keywords)
+    core._dispatch = CountingDict(core._dispatch)
+    CountingDict.touched = 0
+    core.run_keyword(name, (), {})
+    return CountingDict.touched
+
+
+def test_dispatch_cost_does_not_depend_on_keyword_count():
+    small = DynamicCore([build_library(10)])
+    large = DynamicCore([build_library(5000)])
+    assert large.run_keyword("Keyword Number 4999", (), {}) == 4999
+
+    # Robot Framework passes names as written in the test data
+    small_cost = dispatch_cost(small, "Keyword Number 9")
+    large_cost = dispatch_cost(large, "Keyword Number 4999")
+
+    assert large_cost == small_cost <= 2, (
+        f"{small_cost} entries touched with 10 keywords, {large_cost} with 5000 keywords"
+    )
@@ -0,0 +1,39 @@
+import random
+
+from pywinautoLibrary.locators.fuzzy import TrigramIndex
+
+
+WORDS = (
+    "open save close print export import settings options help about file edit view window "
+    "tools format insert table chart data review layout design page margin border color font "
+    "size style align left right center bullet number indent spacing search replace find next "
+    "previous zoom ruler grid guide theme macro record account profile network proxy server"
+).split()
+
+
+class CountingList(list):
+    """Trigram sets of the index counting how often they are read."""
+
+    reads = 0
+
+    def __getitem__(self, position):
+        CountingList.reads += 1
+        return super().__getitem__(position)
+
+
+def test_trigram_search_on_thousands_of_names():
+    rnd = random.Random(7)
+    names = [f"{rnd.choice(WORDS).title()} {rnd.choice(WORDS)} {rnd.randrange(100)}"
+             for _ in range(5000)]
+    queries = ["Prnt margn", "Setings", "zoom", names[1234].replace("e", "a", 1)]
+    index = TrigramIndex(enumerate(names))
+    index._trigrams = CountingList(index._trigrams)
+
+    for query in queries:
+        CountingList.reads = 0
+        ranked = index.search(query, 0.5)
+        # Comparing the query against every name would read all of them
+        assert CountingList.reads * 2 < len(names), (
+            f"'{query}': {CountingList.reads} trigram sets read for {len(names)} names"
+        )
+    assert ranked[0][0] == 1234
@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Robot Framework is already imported when Robot Framework, libdoc or an IDE
+# imports the library, so only the time of the library itself is measured
+ROBOT_MODULES = "robot.api, robot.errors, robot.libraries.BuiltIn, robot.utils.importer"
+HEAVY_MODULES = ("pywinauto", "comtypes", "PIL", "psutil")
+# Cold import takes about 15 ms on a developer machine
+IMPORT_BUDGET = 0.15
+
+
+def import_library():
+    """Import the library in a new process and return its import time and imported modules."""
+    code = (
+        f"import sys, {ROBOT_MODULES}; import pywinautoLibrary; "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "pywinautoLibrary":
+            return int(cumulative) / 1e6, result.stdout.split()
+    raise AssertionError(f"Import time of pywinautoLibrary not reported:\n{result.stderr}")
+
+
+def test_heavy_modules_are_not_imported():
+    _, imported = import_library()
+    assert imported == []
+
+
+@pytest.mark.timing
+def test_import_time_budget():
+    import_time = min(import_library()[0] for _ in range(3))
+    assert import_time < IMPORT_BUDGET, f"Importing took {import_time * 1000:.1f} ms"
@@ -0,0 +1,61 @@
+from faketree import FakeApp, FakeContext
+from pywinautoLibrary.locators import ElementFinder, SnapshotNode, UISnapshot
+from pywinautoLibrary.locators.snapshot import SNAPSHOT_PROPERTIES, SnapshotElementInfo
+
+
+class CountingValues(dict):
+    """Captured properties counting how often they are read."""
+
+    reads = 0
+
+    def __getitem__(self, name):
+        CountingValues.reads += 1
+        return super().__getitem__(name)
+
+
+def build_snapshot(groups, width):
+    """Snapshot with `groups` panes of `width` elements each, built directly."""
+
+    def node(parent, **values):
+        child = SnapshotNode(SnapshotElementInfo(CountingValues(values)))
+        if parent is not None:
+            child.parent = parent
+            parent._children.append(child)
+        return child
+
+    root = node(None, name="Main", automation_id="", control_type="Window", class_name="Main")
+    for group in range(groups):
+        pane = node(root, name=f"Group {group}", automation_id=f"group{group}",
+                    control_id=None, control_type="Pane", class_name="Group")
+        for item in range(width):
+            node(pane, name=f"Item {group}_{item}", automation_id=f"item{group}_{item}",
+                 control_id=group * width + item, control_type="Edit" if item % 2 else "Button",
+                 class_name=f"Class{item % 50}")
+    return UISnapshot(root, SNAPSHOT_PROPERTIES)
+
+
+def test_index_lookups_on_100k_elements():
+    # 100 + 100 * 999 = 100,000 elements below the root
+    snapshot = build_snapshot(100, 999)
+    assert len(snapshot) == 100001
+    finder = ElementFinder(FakeContext(FakeApp(snapshot.root)), search_depth=None)
+    finder.snapshot = snapshot
+    locators = [finder.compile(locator) for locator in (
+        "auto_id:item99_998", "control_id:99000", "text:Item 98_99", "item97_5",
+    )]
+
+    CountingValues.reads = 0
+    linear = [list(finder._strategies[locator.strategy](snapshot.root, locator)) for locator in locators]
+    linear_reads = CountingValues.reads
+
+    # Building the indexes reads each indexed property once per element
+    first = [finder._find_in_index(snapshot.index, locator) for locator in locators]
+
+    CountingValues.reads = 0
+    indexed = [finder._find_in_index(snapshot.index, locator) for locator in locators]
+
+    assert indexed == first == linear
+    assert [len(matches) for matches in indexed] == [1, 1, 10, 1]
+    assert CountingValues.reads * 1000 < linear_reads, (
+        f"indexed: {CountingValues.reads} property reads, linear: {linear_reads} property reads"
+    )
@@ -0,0 +1,30 @@
+from faketree import BackendCounter, FakeApp, FakeContext, build_deep_window
+from pywinautoLibrary.locators import ElementFinder
+
+
+LOCATORS = [f"auto_id:item_{i}_{j}_{k}" for i in (3, 9) for j in (2, 13) for k in (0, 13)]
+
+
+def test_snapshot_replaces_repeated_searches():
+    counter = BackendCounter()
+    # 14 + 196 + 2744 = 2954 elements
+    window = build_deep_window(counter, 3, 14)
+    finder = ElementFinder(FakeContext(FakeApp(window)), element_cache=False, search_depth=None)
+
+    counter.reset()
+    live = [finder.find(locator) for locator in LOCATORS]
+    live_calls = counter.calls
+
+    counter.reset()
+    snapshot = finder.take_snapshot(properties="automation_id")
+    capture_calls = counter.calls
+    found = [finder.find(locator) for locator in LOCATORS]
+
+    assert [node.wrapper for node in found] == live
+    assert len(snapshot) == 2955
+    # Searches only read the snapshot, and capturing reads the declared
+    # property once per element. With UIA capturing is a single request.
+    assert counter.calls == capture_calls
+    assert capture_calls < live_calls, (
+        f"snapshot: {capture_calls} backend calls, live searches: {live_calls} backend calls"
+    )
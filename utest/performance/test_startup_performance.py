@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from faketree import FakeApp, FakeContext, FakeWrapper, BackendCounter
+from pywinautoLibrary.keywords import (
+    ApplicationManagementKeywords,
+    ControlElementKeywords,
+    KeyboardKeywords,
+    MouseKeywords,
+    ScreenshotKeywords,
+    WaitingKeywords,
+    WindowManagementKeywords,
+)
+from pywinautoLibrary.utils import DynamicCore, dynamiccore
+
+COMPONENTS = (
+    ApplicationManagementKeywords,
+    WindowManagementKeywords,
+    ControlElementKeywords,
+    MouseKeywords,
+    KeyboardKeywords,
+    WaitingKeywords,
+    ScreenshotKeywords,
+)
+
+
+class CountingRegistries(dict):
+    """Keyword registries counting how many classes are scanned."""
+
+    scans = 0
+
+    def __setitem__(self, cls, registry):
+        CountingRegistries.scans += 1
+        super().__setitem__(cls, registry)
+
+
+def instantiate(ctx):
+    return DynamicCore([component(ctx) for component in COMPONENTS])
+
+
+def test_registering_keywords_is_cheap_after_first_library(monkeypatch):
+    ctx = FakeContext(FakeApp(FakeWrapper(BackendCounter())))
+    monkeypatch.setattr(dynamiccore, "_registries", CountingRegistries())
+
+    CountingRegistries.scans = 0
+    first = instantiate(ctx)
+    assert CountingRegistries.scans == len(COMPONENTS)
+
+    CountingRegistries.scans = 0
+    for _ in range(10):
+        core = instantiate(ctx)
+
+    assert core.get_keyword_names() == first.get_keyword_names()
+    assert "info" not in core.get_keyword_names()
+    assert CountingRegistries.scans == 0, f"{CountingRegistries.scans} classes scanned again"
+
+
+@pytest.mark.timing
+def test_import_and_instantiation_time():
+    # Measured in a new process, as pabot pays this cost in every process
+    code = (
+        "import time; start = time.perf_counter(); import pywinautoLibrary; "
+        "imported = time.perf_counter(); pywinautoLibrary.pywinautoLibrary(); "
+        "print(imported - start, time.perf_counter() - imported)"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    ).stdout
+    import_time, init_time = map(float, output.split())
+    assert init_time < 0.5, (
+        f"Importing the library took {import_time * 1000:.1f} ms, "
+        f"instantiating it {init_time * 1000:.2f} ms"
+    )
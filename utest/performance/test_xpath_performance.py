@@ -0,0 +1,19 @@
+from faketree import BackendCounter, build_deep_window
+from pywinautoLibrary.locators.xpath import XPath
+
+
+def test_first_match_exits_early_on_large_tree():
+    counter = BackendCounter()
+    root = build_deep_window(counter, depth=4, fanout=8)
+    xpath = XPath("//Button[starts-with(@Name, 'Item 0_')]")
+
+    matches = xpath.find_all(root)
+    full_calls = counter.calls
+
+    counter.reset()
+    first = xpath.find(root)
+
+    assert first is matches[0]
+    assert counter.calls * 50 < full_calls, (
+        f"find: {counter.calls} backend calls, find_all: {full_calls} backend calls"
+    )
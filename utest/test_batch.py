@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from faketree import BackendCounter, FakeApp, FakeContext, FakeWrapper, build_deep_window
+from pywinautoLibrary.errors import ElementNotFound
+from pywinautoLibrary.locators import ElementFinder
+
+
+class TestFindMany:
+    """Test resolving several locators in one traversal."""
+
+    LOCATORS = ["auto_id:item_2_1", "control_id:7", "text:Item 1_", "item_3_3_3",
+                "Item 0_2", "3", "class:MainWindow", "title:Main", "xpath://Button"]
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_deep_window(self.counter, 3, 4)
+        self.window.children()[1].children()[2].element_info.set(control_id=7)
+        self.window.children()[2].children()[3].element_info.set(control_id=3)
+        self.finder = ElementFinder(FakeContext(FakeApp(self.window)), search_depth=None,
+                                    element_cache=False)
+
+    @pytest.mark.parametrize("order", ["breadth_first", "depth_first"])
+    def test_same_elements_as_single_searches(self, order):
+        self.finder.search_order = order
+        expected = {locator: self.finder.find(locator) for locator in self.LOCATORS}
+        assert self.finder.find_many(self.LOCATORS) == expected
+
+    def test_one_traversal(self):
+        locators = ["auto_id:item_3_3_3", "auto_id:item_3_3_2", "auto_id:item_0"]
+        self.counter.reset()
+        for locator in locators:
+            self.finder.find(locator)
+        single_calls = self.counter.calls
+        self.counter.reset()
+        self.finder.find_many(locators)
+        assert self.counter.calls * 2 < single_calls
+
+    def test_names_and_missing(self):
+        found = self.finder.find_many({"first": "auto_id:item_0", "missing": "auto_id:nope"}, timeout=0)
+        assert found["first"].window_text() == "Item 0"
+        assert found["missing"] is None
+        with pytest.raises(ElementNotFound, match="auto_id:nope"):
+            self.finder.find_many(["auto_id:item_0", "auto_id:nope"], required=True, timeout=0)
+
+    def test_retries_search_only_missing(self):
+        self.finder.ctx.timeout = 5
+        late = FakeWrapper(self.counter, name="Late", automation_id="late")
+        original = self.finder._match_batch
+        searched = []
+
+        def match_batch(root, locators, control_type):
+            searched.append(sorted(locators))
+            if len(searched) == 2:
+                self.window.add(late)
+            return original(root, locators, control_type)
+
+        self.finder._match_batch = match_batch
+        start = time.monotonic()
+        found = self.finder.find_many(["auto_id:item_1", "auto_id:late"])
+        assert time.monotonic() - start < 1
+        assert found["auto_id:late"] is late
+        assert searched == [["auto_id:item_1", "auto_id:late"], ["auto_id:late"]]
+
+    def test_parent(self):
+        parent = self.window.children()[0]
+        locators = ["class:Class2", "text:Item 0_1"]
+        expected = {locator: self.finder.find(locator, parent=parent) for locator in locators}
+        assert self.finder.find_many(locators, parent=parent) == expected
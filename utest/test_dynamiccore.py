@@ -0,0 +1,266 @@
+from datetime import timedelta
+from typing import Optional
+
+import pytest
+
+import pywinautoLibrary
+from pywinautoLibrary.errors import KeywordConflict, PluginError
+from pywinautoLibrary.utils import (
+    DynamicCore, LazyLibrary, keyword, keyword_info, keyword_registry, normalize_keyword_name,
+)
+
+
+class Base:
+
+    @keyword
+    def log_message(self, message):
+        return f"logged {message}"
+
+    def helper(self):
+        return "not a keyword"
+
+
+class Clicks(Base):
+
+    @keyword
+    def click_element(self, locator):
+        return f"clicked {locator}"
+
+    @property
+    def broken(self):
+        raise RuntimeError("Properties are not keywords.")
+
+
+class Types(Base):
+
+    @keyword
+    def input_text(self, locator, text=""):
+        return f"typed {text} to {locator}"
+
+    @keyword("Press Enter", tags=["keyboard"])
+    def _enter(self):
+        return "enter"
+
+
+class CountingPlugin:
+    created = 0
+
+    def __init__(self, ctx, greeting="hello"):
+        CountingPlugin.created += 1
+        self.ctx = ctx
+        self.greeting = greeting
+
+    @keyword
+    def greet(self):
+        return self.greeting
+
+
+class Signatures:
+    """Library with various signatures."""
+
+    @keyword
+    def wait_for(self, locator: str, timeout: Optional[timedelta] = None, *states, strict: bool = False):
+        """Wait for an element.
+
+        :param locator: Locator of the element.
+        """
+        return locator, timeout, states, strict
+
+    @keyword(tags=["config"], types={"count": int})
+    def configure(self, count, *, verbose=False, **options):
+        return count, verbose, options
+
+
+class LegacyPlugin(pywinautoLibrary.LibraryComponent):
+
+    def shout(self, text):
+        return text.upper()
+
+    def _private(self):
+        return "not a keyword"
+
+
+class BrokenPlugin:
+
+    def __init__(self, ctx):
+        raise RuntimeError("no device")
+
+    @keyword
+    def use_device(self):
+        return "used"
+
+
+class ClickPlugin:
+
+    @keyword
+    def ClickElement(self, locator):
+        return "plugin"
+
+
+class TestDynamicCore:
+    """Test registering and running keywords."""
+
+    def test_normalize(self):
+        assert normalize_keyword_name("Click Element") == "clickelement"
+        assert normalize_keyword_name("click_element") == "clickelement"
+        assert normalize_keyword_name("CLICK_ ELEMENT") == "clickelement"
+
+    def test_matches_like_robot(self):
+        core = DynamicCore([Clicks(), Types()])
+        for name in ("click_element", "Click Element", "click element", "CLICKELEMENT", "Click_Element"):
+            assert core.run_keyword(name, ("id",), {}) == "clicked id"
+        assert core.run_keyword("Input Text", ("id",), {"text": "x"}) == "typed x to id"
+        with pytest.raises(AttributeError):
+            core.run_keyword("Click Elements", (), {})
+
+    def test_keyword_names(self):
+        core = DynamicCore([Clicks(), Types()])
+        assert sorted(core.get_keyword_names()) == ["Press Enter", "click_element", "input_text", "log_message"]
+        assert core.run_keyword("press enter", (), {}) == "enter"
+        with pytest.raises(AttributeError):
+            core.run_keyword("helper", (), {})
+
+    def test_registry_is_cached_per_class(self):
+        registry = keyword_registry(Types)
+        assert keyword_registry(Types) is registry
+        assert set(registry) == {"input_text", "log_message", "Press Enter"}
+        assert registry["Press Enter"].robot_tags == ("keyboard",)
+        assert set(keyword_registry(Clicks)) == {"click_element", "log_message"}
+
+    def test_shared_base_methods_do_not_conflict(self):
+        core = DynamicCore([Clicks(), Types()])
+        assert core.run_keyword("Log Message", ("hi",), {}) == "logged hi"
+
+    def test_conflict_is_detected(self):
+        with pytest.raises(KeywordConflict, match="Clicks.click_element and ClickPlugin.ClickElement"):
+            DynamicCore([Clicks(), ClickPlugin()])
+
+
+class TestLazyLibraries:
+    """Test creating libraries when their keywords are first run."""
+
+    def setup_method(self):
+        CountingPlugin.created = 0
+
+    def test_created_on_first_keyword(self):
+        lazy = LazyLibrary(CountingPlugin, None, "hi")
+        core = DynamicCore([Clicks(), lazy])
+        assert sorted(core.get_keyword_names()) == ["click_element", "greet", "log_message"]
+        assert not lazy.created
+        assert core.run_keyword("Greet", (), {}) == "hi"
+        assert core.greet() == "hi"
+        assert CountingPlugin.created == 1
+        assert lazy.instance.greeting == "hi"
+
+    def test_conflicts_are_detected_without_creating(self):
+        with pytest.raises(KeywordConflict):
+            DynamicCore([Clicks(), LazyLibrary(ClickPlugin)])
+
+    def test_library_creates_components_lazily(self):
+        library = pywinautoLibrary.pywinautoLibrary(plugins="test_dynamiccore.CountingPlugin;hey")
+        created = {type(lazy.instance).__name__ for lazy in library._library_instances if lazy.created}
+        assert created == set()
+        assert library.run_keyword("Get Wait Statistics", (), {}) == []
+        assert library.run_keyword("greet", (), {}) == "hey"
+        created = [type(lazy.instance).__name__ for lazy in library._library_instances if lazy.created]
+        assert created == ["WaitingKeywords", "CountingPlugin"]
+        assert CountingPlugin.created == 1
+
+    def test_library_keywords(self):
+        names = pywinautoLibrary.pywinautoLibrary().get_keyword_names()
+        assert {"assert_window_contains", "assert_window_not_contains", "click_element"} <= set(names)
+        assert not {"info", "log", "find_element", "get_timeout"} & set(names)
+
+    def test_undecorated_plugin_uses_public_methods(self, monkeypatch):
+        warnings = []
+        monkeypatch.setattr(pywinautoLibrary.logger, "warn", warnings.append)
+        library = pywinautoLibrary.pywinautoLibrary(plugins="test_dynamiccore.LegacyPlugin")
+        assert "has no methods marked with the @keyword decorator" in warnings[0]
+        assert library.run_keyword("Shout", ("hi",), {}) == "HI"
+        names = set(library.get_keyword_names())
+        assert "shout" in names
+        assert not {"_private", "info", "log_dir"} & names
+
+    def test_plugin_creation_error(self):
+        library = pywinautoLibrary.pywinautoLibrary(plugins="test_dynamiccore.BrokenPlugin", run_on_failure=None)
+        with pytest.raises(PluginError, match="Failed to create plugin 'test_dynamiccore.BrokenPlugin': no device"):
+            library.run_keyword("Use Device", (), {})
+
+    def test_plugin_must_be_a_class(self):
+        with pytest.raises(PluginError, match="not a class"):
+            pywinautoLibrary.pywinautoLibrary(plugins="test_dynamiccore")
+
+
+class TestDynamicApi:
+    """Test the keyword metadata of the dynamic library API."""
+
+    def setup_method(self):
+        self.core = DynamicCore([LazyLibrary(Signatures)])
+
+    def test_arguments(self):
+        assert self.core.get_keyword_arguments("wait_for") == [
+            "locator", ("timeout", None), "*states", ("strict", False)
+        ]
+        assert self.core.get_keyword_arguments("Configure") == [
+            "count", "*", ("verbose", False), "**options"
+        ]
+
+    def test_types(self):
+        assert self.core.get_keyword_types("wait_for") == {
+            "locator": str, "timeout": Optional[timedelta], "strict": bool
+        }
+        assert self.core.get_keyword_types("configure") == {"count": int}
+
+    def test_documentation_tags_and_source(self):
+        assert self.core.get_keyword_documentation("wait_for").startswith("Wait for an element.\n\n:param")
+        assert self.core.get_keyword_documentation("configure") == ""
+        assert self.core.get_keyword_tags("configure") == ["config"]
+        assert self.core.get_keyword_tags("wait_for") == []
+        path, line = self.core.get_keyword_source("wait_for").rsplit(":", 1)
+        assert path == __file__
+        assert int(line) == Signatures.wait_for.__code__.co_firstlineno + 1
+
+    def test_metadata_is_cached_per_method(self):
+        info = keyword_info(Signatures.wait_for)
+        assert keyword_info(Signatures.wait_for) is info
+        assert DynamicCore([Signatures()]).get_keyword_arguments("wait_for") == list(info.arguments)
+        # Returned lists are copies
+        self.core.get_keyword_arguments("wait_for").clear()
+        assert info.arguments
+
+    def test_library_documentation(self):
+        library = pywinautoLibrary.pywinautoLibrary()
+        assert library.get_keyword_documentation("__intro__").startswith("PywinautoLibrary is")
+        assert "element_cache" in library.get_keyword_documentation("__init__")
+        for name in library.get_keyword_names():
+            assert library.get_keyword_source(name)
+            library.get_keyword_arguments(name)
+        assert library.get_keyword_types("wait_for_element")["timeout"] == Optional[timedelta]
+
+    def test_libdoc(self):
+        from robot.libdoc import LibraryDocumentation
+        doc = LibraryDocumentation("pywinautoLibrary")
+        keywords = {kw.name: kw for kw in doc.keywords}
+        assert len(keywords) == len(pywinautoLibrary.pywinautoLibrary().get_keyword_names())
+        wait = keywords["Wait Until Window Is Opened"]
+        assert [arg.name for arg in wait.args] == ["locator", "timeout"]
+        assert wait.source.endswith("waiting.py")
+
+    def test_robot_converts_arguments(self, tmp_path):
+        from robot import run
+        suite = tmp_path / "conversion.robot"
+        suite.write_text(
+            "*** Settings ***\n"
+            "Library    pywinautoLibrary    wait_statistics=False    locator_hints=False\n"
+            "*** Test Cases ***\n"
+            "Conversion\n"
+            "    ${previous} =    Set Poll Strategy    fixed    interval=50ms\n"
+            "    ${current} =    Set Poll Strategy    backoff    interval=0.2    initial_interval=10 ms\n"
+            "    Should Be Equal    ${current}    fixed (50 ms)\n"
+            "    ${statistics} =    Get Wait Statistics    limit=2\n"
+            "    Should Be Empty    ${statistics}\n",
+            encoding="utf-8",
+        )
+        result = run(str(suite), outputdir=str(tmp_path), output=None, log=None, report=None,
+                     stdout=open(tmp_path / "stdout.txt", "w"))
+        assert result == 0, (tmp_path / "stdout.txt").read_text()
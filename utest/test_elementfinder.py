@@ -0,0 +1,176 @@
+import pytest
+
+from faketree import BackendCounter, FakeApp, FakeContext, build_wide_window
+from pywinautoLibrary.errors import ElementNotFound, InvalidLocator
+from pywinautoLibrary.keywords import ApplicationCache
+from pywinautoLibrary.locators import ElementFinder
+from pywinautoLibrary.locators.elementcache import element_exists, element_key
+
+
+class TestElementFinder:
+    """Test ElementFinder against an in-memory control tree."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_wide_window(self.counter, 10)
+        self.finder = ElementFinder(FakeContext(FakeApp(self.window)))
+
+    def test_find_by_strategies(self):
+        assert self.finder.find("auto_id:field3").window_text() == "Field 3"
+        assert self.finder.find("control_id:1004").window_text() == "Field 4"
+        assert self.finder.find("text:Field 5").window_text() == "Field 5"
+        assert self.finder.find("field6").window_text() == "Field 6"
+        assert len(self.finder.find("text:Field", first_only=False)) == 10
+
+    def test_not_found(self):
+        with pytest.raises(ElementNotFound):
+            self.finder.find("auto_id:missing", timeout=0)
+        assert self.finder.find("auto_id:missing", required=False, timeout=0) is None
+        assert self.finder.find("auto_id:missing", first_only=False, required=False, timeout=0) == []
+
+    def test_locator_is_compiled_once(self):
+        for _ in range(3):
+            self.finder.find("auto_id:field1")
+        assert self.finder.locator_cache.statistics["misses"] == 1
+        assert self.finder.locator_cache.statistics["hits"] == 2
+
+
+class TestElementCache:
+    """Test reuse of resolved elements."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_wide_window(self.counter, 50)
+        self.app = FakeApp(self.window)
+        self.finder = ElementFinder(FakeContext(self.app))
+
+    def test_cached_element_is_reused(self):
+        element = self.finder.find("auto_id:field40")
+        self.counter.reset()
+        assert self.finder.find("auto_id:field40") is element
+        assert self.counter.calls < 10
+        assert self.finder.element_cache.statistics["hits"] == 1
+
+    def test_removed_element_is_resolved_again(self):
+        element = self.finder.find("auto_id:field40")
+        self.window.remove(element)
+        assert self.finder.find("auto_id:field40", required=False, timeout=0) is None
+        assert self.finder.element_cache.statistics["stale"] == 1
+
+    def test_element_no_longer_matching_is_resolved_again(self):
+        element = self.finder.find("text:Field 7")
+        element.element_info.set(name="Renamed")
+        assert self.finder.find("text:Field 7", required=False, timeout=0) is None
+
+    def test_window_change_invalidates(self):
+        self.finder.find("auto_id:field1")
+        self.app._windows.insert(0, build_wide_window(self.counter, 5, name="Other"))
+        self.finder.find("auto_id:field1")
+        assert self.finder.element_cache.statistics["invalidations"] == 1
+
+    def test_application_switch_invalidates(self):
+        apps = ApplicationCache()
+        apps.add_listener(self.finder.invalidate)
+        apps.register(self.app, "first")
+        apps.register(FakeApp(self.window), "second")
+        self.finder.find("auto_id:field1")
+        apps.switch("second")
+        assert self.finder.element_cache.statistics["size"] == 0
+        self.finder.find("auto_id:field1")
+        apps.close("second")
+        assert self.finder.element_cache.statistics["size"] == 0
+
+    def test_default_locator_matched_by_automation_id_is_cached(self):
+        element = self.finder.find("field40")
+        assert self.finder.find("field40") is element
+        assert self.finder.element_cache.statistics["hits"] == 1
+        element.element_info.set(automation_id="renamed")
+        assert self.finder.find("field40", required=False, timeout=0) is None
+
+    def test_default_locator_matched_by_text_is_not_cached(self):
+        element = self.finder.find("Field 40")
+        assert self.finder.element_cache.statistics["size"] == 0
+        self.window.children()[45].element_info.set(automation_id="Field 40")
+        assert self.finder.find("Field 40") is not element
+
+    def test_removed_uia_element_does_not_exist(self):
+        element = self.finder.find("auto_id:field40")
+        del element.exists
+        assert element_exists(element)
+        element.element_info.set(runtime_id=None)
+        assert not element_exists(element)
+
+    def test_destroyed_window_handle_is_not_the_same_element(self):
+        element = self.finder.find("auto_id:field40")
+        element.element_info.set(runtime_id=None, handle=0x1234, process_id=10)
+        key = element_key(element)
+        assert key == (0x1234, 10, "")
+        element.element_info.set(class_name="Edit")
+        assert element_key(element) != key
+
+    def test_cache_can_be_disabled(self):
+        finder = ElementFinder(FakeContext(self.app), element_cache=False)
+        finder.find("auto_id:field1")
+        finder.find("auto_id:field1")
+        assert finder.element_cache.statistics["hits"] == 0
+        assert finder.element_cache.statistics["size"] == 0
+
+
+class TestXPathStrategy:
+    """Test xpath locators through ElementFinder."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.finder = ElementFinder(FakeContext(FakeApp(build_wide_window(self.counter, 10))))
+
+    def test_xpath_locator(self):
+        assert self.finder.find("xpath://Edit[@AutomationId='field3']").window_text() == "Field 3"
+        assert len(self.finder.find("xpath://Button", first_only=False)) == 5
+
+    def test_xpath_results_are_not_cached(self):
+        locator = "xpath://Edit[@AutomationId='field3']"
+        element = self.finder.find(locator)
+        element.element_info.set(automation_id="moved")
+        assert self.finder.find(locator, required=False, timeout=0) is None
+        assert self.finder.element_cache.statistics["size"] == 0
+
+    def test_invalid_xpath_fails_immediately(self):
+        with pytest.raises(InvalidLocator):
+            self.finder.find("xpath://Button[", timeout=10)
+
+
+class TestControlType:
+    """Test limiting locators to a control type."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        # Odd fields are edits, even fields buttons
+        self.window = build_wide_window(self.counter, 10)
+        self.finder = ElementFinder(FakeContext(FakeApp(self.window)))
+
+    @pytest.mark.parametrize("locator, button, edit", [
+        ("text:Field", "Field 0", "Field 1"),
+        ("Field", "Field 0", "Field 1"),
+        ("control_id:1002", "Field 2", None),
+        ("fuzzy:Feld 3", None, "Field 3"),
+    ])
+    def test_matches_only_control_type(self, locator, button, edit):
+        for control_type, expected in (("Button", button), ("Edit", edit)):
+            found = self.finder.find(locator, control_type, required=False, timeout=0)
+            assert (found and found.window_text()) == expected
+            assert self.finder.find(f"{control_type}#{locator}", required=False, timeout=0) is found
+
+    def test_all_matches_are_filtered(self):
+        edits = self.finder.find("text:Field", "Edit", first_only=False)
+        assert [edit.window_text() for edit in edits] == [f"Field {i}" for i in range(1, 10, 2)]
+        assert self.finder.find("Button#auto_id:field3", required=False) is None
+
+    def test_cached_element_of_other_type_is_not_reused(self):
+        assert self.finder.find("auto_id:field3").window_text() == "Field 3"
+        assert self.finder.find("Button#auto_id:field3", required=False) is None
+
+    def test_find_many(self):
+        found = self.finder.find_many(["Edit#Field", "Button#Field", "text:Field 4"], timeout=0)
+        assert [element.window_text() for element in found.values()] == ["Field 1", "Field 0", "Field 4"]
+        assert self.finder.find_many(["Field", "text:Field"], "Edit") == {
+            "Field": self.window.children()[1], "text:Field": self.window.children()[1]}
@@ -0,0 +1,72 @@
+import pytest
+
+from faketree import BackendCounter, FakeApp, FakeContext, FakeWrapper
+from pywinautoLibrary.locators import ElementFinder
+from pywinautoLibrary.locators.fuzzy import TrigramIndex, similarity, trigrams
+
+
+NAMES = ["Save", "Save As...", "Save All", "Open", "Page Setup", "Print Preview", "Print"]
+
+
+class TestTrigramIndex:
+    """Test approximate matching of element names."""
+
+    def setup_method(self):
+        self.index = TrigramIndex(enumerate(NAMES))
+
+    def test_trigrams_are_normalized(self):
+        assert trigrams("Save  As") == trigrams(" save as")
+        assert trigrams("") == frozenset()
+        assert similarity(trigrams("Print"), trigrams("print")) == 1.0
+
+    def test_ranked_by_similarity(self):
+        assert [NAMES[i] for i, _ in self.index.search("save as")][:1] == ["Save As..."]
+        assert [NAMES[i] for i, _ in self.index.search("Prnt Preview")] == ["Print Preview"]
+
+    def test_ties_keep_document_order(self):
+        index = TrigramIndex(enumerate(["Item", "Other", "Item", "Item"]))
+        assert [i for i, _ in index.search("Item")] == [0, 2, 3]
+
+    def test_threshold(self):
+        scores = [score for _, score in self.index.search("Save", 0.0)]
+        assert scores == sorted(scores, reverse=True)
+        assert all(score >= 0.8 for _, score in self.index.search("Save", 0.8))
+        assert self.index.search("Spreadsheet", 0.5) == []
+
+    def test_matches_pairwise_comparison(self):
+        for query in ("sav", "Print Previw", "setup page", "x"):
+            for threshold in (0.2, 0.5, 0.7):
+                expected = sorted(
+                    (-similarity(trigrams(query), trigrams(name)), i)
+                    for i, name in enumerate(NAMES)
+                    if 0 < similarity(trigrams(query), trigrams(name)) >= threshold
+                )
+                assert [i for i, _ in self.index.search(query, threshold)] == [i for _, i in expected]
+
+
+class TestFuzzyStrategy:
+    """Test the fuzzy locator strategy."""
+
+    def setup_method(self):
+        counter = BackendCounter()
+        self.window = FakeWrapper(
+            counter, [FakeWrapper(counter, name=name, control_type="Button") for name in NAMES],
+            name="Main", control_type="Window",
+        )
+        self.finder = ElementFinder(FakeContext(FakeApp(self.window)))
+
+    def test_find_best_match(self):
+        assert self.finder.find("fuzzy:print preveiw").window_text() == "Print Preview"
+        matches = self.finder.find("fuzzy:Save", first_only=False)
+        assert [element.window_text() for element in matches][0] == "Save"
+
+    def test_snapshot_uses_trigram_index(self):
+        self.finder.take_snapshot()
+        assert self.finder.find("fuzzy:Page Stup").window_text() == "Page Setup"
+        assert "trigrams" in self.finder.snapshot.index.built
+
+    def test_threshold_is_configurable(self):
+        strict = ElementFinder(FakeContext(FakeApp(self.window)), fuzzy_threshold=0.95)
+        assert strict.find("fuzzy:Prnt", required=False, timeout=0) is None
+        with pytest.raises(ValueError):
+            ElementFinder(FakeContext(FakeApp(self.window)), fuzzy_threshold=2)
@@ -0,0 +1,98 @@
+import json
+
+from faketree import BackendCounter, FakeApp, FakeContext, FakeWrapper, build_deep_window
+from pywinautoLibrary.locators import ElementFinder, LocatorHint, LocatorHints
+
+MAIN = "MainWindow|Main"
+
+
+class TestLocatorHints:
+    """Test resolving locators from the paths where they were found earlier."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_deep_window(self.counter, 3, 4)
+
+    def finder(self, hints, **kwargs):
+        return ElementFinder(FakeContext(FakeApp(self.window)), search_depth=None,
+                             element_cache=False, hints=hints, **kwargs)
+
+    def test_warm_run_follows_hinted_path(self, tmp_path):
+        path = str(tmp_path / "hints.json")
+        cold = self.finder(LocatorHints(path))
+        self.counter.reset()
+        assert cold.find("item_3_2_1").window_text() == "Item 3_2_1"
+        cold_calls = self.counter.calls
+        cold.hints.save()
+
+        warm = self.finder(LocatorHints(path))
+        self.counter.reset()
+        element = warm.find("item_3_2_1")
+        assert element.element_info._props["name"] == "Item 3_2_1"
+        # Window class and title, three levels of children and one property read
+        assert self.counter.calls == 2 + 3 + 12 + 1
+        assert self.counter.calls * 4 < cold_calls
+        assert warm.hints.statistics["hits"] == 1
+
+    def test_hint_per_strategy(self):
+        finder = self.finder(LocatorHints())
+        for locator in ("auto_id:item_1_1", "text:Item 2_3", "fuzzy:Itme 3_0_0"):
+            expected = finder.find(locator)
+            assert finder.find(locator) is expected, locator
+        assert finder.hints.statistics["hits"] == 3
+        assert finder.hints.get(MAIN, "text:Item 2_3") == [LocatorHint("text", (2, 3), "name", "Item 2_3")]
+
+    def test_mismatch_falls_back_to_search(self):
+        finder = self.finder(LocatorHints())
+        finder.find("auto_id:item_2")
+        self.window._children.insert(0, FakeWrapper(self.counter, name="New", automation_id="new"))
+        assert finder.find("auto_id:item_2").window_text() == "Item 2"
+        assert finder.hints.statistics["mismatches"] == 1
+        assert [hint.path for hint in finder.hints.get(MAIN, "auto_id:item_2")] == [(3,), (2,)]
+
+    def test_hints_are_kept_per_window(self):
+        dialog = build_deep_window(self.counter, 2, 3, name="Dialog")
+        app = FakeApp(self.window, dialog)
+        finder = ElementFinder(FakeContext(app), search_depth=None, element_cache=False, hints=LocatorHints())
+        for _ in range(2):
+            for window in (self.window, dialog):
+                app._windows.sort(key=lambda top: top is not window)
+                assert finder.find("auto_id:item_1_2").parent.parent is window
+        assert finder.hints.statistics["hits"] == 2
+        assert finder.hints.statistics["mismatches"] == 0
+
+    def test_hint_is_dropped_after_repeated_misses(self):
+        hints = LocatorHints(max_misses=2)
+        finder = self.finder(hints)
+        element = finder.find("auto_id:item_2_1")
+        element.parent.remove(element)
+        assert finder.find("auto_id:item_2_1", required=False) is None
+        assert hints.get(MAIN, "auto_id:item_2_1")
+        element.parent = self.window._children[2]
+        self.window._children[2]._children.insert(1, element)
+        assert finder.find("auto_id:item_2_1") is element
+        assert hints.statistics["hits"] == 1
+        element.parent.remove(element)
+        for _ in range(2):
+            finder.find("auto_id:item_2_1", required=False)
+        assert hints.get(MAIN, "auto_id:item_2_1") == []
+
+    def test_hints_respect_search_depth(self):
+        hints = LocatorHints()
+        self.finder(hints).find("auto_id:item_0_0_0")
+        shallow = self.finder(hints)
+        shallow.search_depth = 1
+        assert shallow.find("auto_id:item_0_0_0", required=False) is None
+
+    def test_store(self, tmp_path):
+        path = tmp_path / "out" / "hints.json"
+        hints = LocatorHints(lambda: str(path), per_locator=2)
+        for index in range(3):
+            hints.put(MAIN, "Save", LocatorHint("default", (index,), "name", "Save"))
+        hints.save()
+        assert json.loads(path.read_text())["version"] == LocatorHints.VERSION
+        loaded = LocatorHints(str(path))
+        assert [hint.path for hint in loaded.get(MAIN, "Save")] == [(2,), (1,)]
+        assert loaded.get("Other|Window", "Save") == []
+        path.write_text("{not json")
+        assert len(LocatorHints(str(path))) == 0
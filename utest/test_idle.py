@@ -0,0 +1,109 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+from faketree import BackendCounter, FakeApp, FakeContext, build_wide_window
+from pywinautoLibrary.errors import WaitTimeout
+from pywinautoLibrary.keywords import WaitingKeywords
+from pywinautoLibrary.locators import ElementFinder
+from pywinautoLibrary.waits import ApplicationIdle, CpuSampler
+
+psutil = pytest.importorskip("psutil")
+
+BUSY = "while True: pass"
+IDLE = "import time; time.sleep(30)"
+BUSY_THEN_IDLE = "import time\nend = time.monotonic() + {seconds}\nwhile time.monotonic() < end: pass\ntime.sleep(30)"
+BUSY_CHILD = f"import subprocess, sys, time; subprocess.Popen([sys.executable, '-c', {BUSY!r}]); time.sleep(30)"
+
+
+class TestApplicationIdle:
+    """Test waiting until the application process stops using the CPU."""
+
+    def setup_method(self):
+        self.processes = []
+        self.ctx = FakeContext(FakeApp(build_wide_window(BackendCounter(), 3)), timeout=5.0)
+        self.ctx._element_finder = ElementFinder(self.ctx)
+        self.ctx.event_source_factory = None
+        self.waits = WaitingKeywords(self.ctx)
+
+    def teardown_method(self):
+        for process in self.processes:
+            if process.poll() is None:
+                for child in psutil.Process(process.pid).children(recursive=True):
+                    child.kill()
+                process.kill()
+            process.wait()
+
+    def start(self, code):
+        process = subprocess.Popen([sys.executable, "-c", code])
+        self.processes.append(process)
+        self.ctx.app.process = process.pid
+        return process
+
+    def test_samples_busy_process(self):
+        process = self.start(BUSY)
+        with CpuSampler(process.pid, 0.05) as sampler:
+            time.sleep(0.5)
+        assert sampler.count >= 5
+        assert max(sampler.samples) > 50
+
+    def test_idle_process(self):
+        self.start(IDLE)
+        start = time.monotonic()
+        self.waits.wait_until_application_is_idle(interval=0.05, samples=3)
+        assert time.monotonic() - start < 2
+
+    def test_returns_when_process_calms_down(self):
+        self.start(BUSY_THEN_IDLE.format(seconds=0.6))
+        time.sleep(0.1)
+        start = time.monotonic()
+        self.waits.wait_until_application_is_idle(interval=0.05, samples=4)
+        assert 0.4 < time.monotonic() - start < 3
+
+    def test_fails_when_process_stays_busy(self):
+        self.start(BUSY)
+        with pytest.raises(WaitTimeout, match="last samples were"):
+            self.waits.wait_until_application_is_idle(interval=0.05, samples=3, timeout=0.5)
+
+    def test_include_children(self):
+        self.start(BUSY_CHILD)
+        time.sleep(0.2)
+        self.waits.wait_until_application_is_idle(interval=0.05, samples=3, timeout=2)
+        with pytest.raises(WaitTimeout):
+            self.waits.wait_until_application_is_idle(
+                interval=0.05, samples=3, include_children=True, timeout=0.5
+            )
+
+    def test_exited_process_is_idle(self):
+        process = self.start(BUSY)
+        sampler = CpuSampler(process.pid, 0.05)
+        condition = ApplicationIdle(sampler, samples=3)
+        with sampler:
+            condition.reset()
+            assert not condition.evaluate(None)
+            process.kill()
+            process.wait()
+            time.sleep(0.2)
+            assert condition.evaluate(None)
+        assert sampler.exited
+
+    def test_process_exited_before_sampling(self):
+        process = self.start(IDLE)
+        process.kill()
+        process.wait()
+        with CpuSampler(process.pid, 0.05) as sampler:
+            assert sampler.exited
+            assert ApplicationIdle(sampler).evaluate(None)
+        self.waits.wait_until_application_is_idle(interval=0.05, timeout=0.5)
+
+    def test_only_samples_after_start_count(self):
+        process = self.start(IDLE)
+        with CpuSampler(process.pid, 0.02) as sampler:
+            condition = ApplicationIdle(sampler, samples=2)
+            time.sleep(0.2)
+            condition.reset()
+            assert not condition.evaluate(None)
+            time.sleep(0.2)
+            assert condition.evaluate(None)
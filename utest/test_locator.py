@@ -0,0 +1,73 @@
+import pytest
+
+from pywinautoLibrary.locators import Locator, LocatorCache
+
+
+class TestLocator:
+    """Test locator parsing."""
+
+    @pytest.mark.parametrize("raw, strategy, value", [
+        ("auto_id:OkButton", "auto_id", "OkButton"),
+        ("Title = Untitled - Notepad", "title", "Untitled - Notepad"),
+        ("xpath://Button[@Name='a:b']", "xpath", "//Button[@Name='a:b']"),
+        ("Edit", "default", "Edit"),
+        ("Save as: file", "default", "Save as: file"),
+        ("unknown:value", "default", "unknown:value"),
+    ])
+    def test_parse(self, raw, strategy, value):
+        locator = Locator.parse(raw)
+        assert (locator.strategy, locator.value) == (strategy, value)
+        assert str(locator) == raw
+
+    @pytest.mark.parametrize("raw, control_type, strategy, value", [
+        ("Button#auto_id:OkButton", "Button", "auto_id", "OkButton"),
+        ("edit#Name", "Edit", "default", "Name"),
+        ("ListItem#text:Item 1", "ListItem", "text", "Item 1"),
+        ("Item #1", None, "default", "Item #1"),
+        ("Ok#Cancel", None, "default", "Ok#Cancel"),
+        ("text:Button#1", None, "text", "Button#1"),
+    ])
+    def test_control_type_prefix(self, raw, control_type, strategy, value):
+        locator = Locator.parse(raw)
+        assert (locator.control_type, locator.strategy, locator.value) == (control_type, strategy, value)
+        assert Locator.parse(raw, "Pane").control_type == "Pane"
+
+    def test_regex_is_precompiled(self):
+        assert Locator.parse("text:Fi.e").regex.match("File")
+        assert Locator.parse("text:Save (").regex.match("Save (as)")
+        assert Locator.parse("xpath://Button").regex is None
+
+    def test_restrict_returns_new_locator(self):
+        locator = Locator.parse("auto_id:Ok")
+        restricted = locator.restrict("Button")
+        assert restricted.control_type == "Button"
+        assert locator.control_type is None
+        assert locator.restrict(None) is locator
+
+    def test_locator_is_immutable_and_hashable(self):
+        locator = Locator.parse("auto_id:Ok")
+        with pytest.raises(AttributeError):
+            locator.value = "Cancel"
+        assert {locator: 1}[Locator.parse("auto_id:Ok")] == 1
+
+
+class TestLocatorCache:
+    """Test the compiled locator LRU cache."""
+
+    def test_hits_and_misses(self):
+        cache = LocatorCache()
+        first = cache.get("auto_id:Ok")
+        assert cache.get("auto_id:Ok") is first
+        assert cache.statistics == {"hits": 1, "misses": 1, "size": 1, "maxsize": 1024}
+
+    def test_least_recently_used_is_evicted(self):
+        cache = LocatorCache(maxsize=2)
+        cache.get("a")
+        cache.get("b")
+        cache.get("a")
+        cache.get("c")
+        assert len(cache) == 2
+        cache.get("a")
+        assert cache.statistics["hits"] == 2
+        cache.get("b")
+        assert cache.statistics["misses"] == 4
@@ -0,0 +1,52 @@
+import itertools
+
+import pytest
+
+from pywinautoLibrary.utils import BackoffPollScheduler, PollScheduler, create_poll_scheduler
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+class TestPollScheduler:
+    """Test poll schedules and deadlines."""
+
+    def test_backoff_intervals(self):
+        scheduler = BackoffPollScheduler(max_interval=0.05)
+        intervals = list(itertools.islice(scheduler.intervals(), 6))
+        assert intervals == [0.005, 0.01, 0.02, 0.04, 0.05, 0.05]
+
+    def test_fixed_intervals(self):
+        assert list(itertools.islice(PollScheduler(0.1).intervals(), 3)) == [0.1, 0.1, 0.1]
+
+    def test_poll_never_sleeps_past_deadline(self):
+        clock = FakeClock()
+        attempts = list(BackoffPollScheduler().poll(0.1, clock, clock.sleep))
+        assert clock.sleeps == [0.005, 0.01, 0.02, 0.04, 0.025]
+        assert attempts == [1, 2, 3, 4, 5, 6]
+        assert clock.now == pytest.approx(0.1)
+
+    def test_zero_timeout_polls_once(self):
+        clock = FakeClock()
+        assert list(PollScheduler().poll(0, clock, clock.sleep)) == [1]
+        assert clock.sleeps == []
+
+    def test_create_by_name(self):
+        assert isinstance(create_poll_scheduler("Fixed", 0.2), PollScheduler)
+        scheduler = create_poll_scheduler("adaptive", 0.2, 0.001, 3)
+        assert (scheduler.interval, scheduler.initial_interval, scheduler.factor) == (0.2, 0.001, 3)
+        with pytest.raises(ValueError):
+            create_poll_scheduler("sometimes")
+        with pytest.raises(ValueError):
+            create_poll_scheduler("fixed", 0)
@@ -0,0 +1,37 @@
+import time
+
+from faketree import BackendCounter, FakeApp, FakeContext, build_wide_window
+from pywinautoLibrary.keywords import WaitingKeywords, WindowManagementKeywords
+from pywinautoLibrary.locators import ElementFinder
+
+
+class TestProbe:
+    """Test negative checks without waiting for the timeout."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_wide_window(self.counter, 10)
+        self.ctx = FakeContext(FakeApp(self.window), timeout=5.0)
+        self.ctx._element_finder = ElementFinder(self.ctx)
+        self.ctx.event_source_factory = None
+
+    def test_probe_searches_once(self):
+        start = time.monotonic()
+        assert self.ctx._element_finder.probe("auto_id:missing") is None
+        assert time.monotonic() - start < 1
+        assert self.ctx._element_finder.probe("auto_id:field2").window_text() == "Field 2"
+
+    def test_negative_checks_do_not_wait(self):
+        windows = WindowManagementKeywords(self.ctx)
+        start = time.monotonic()
+        assert windows.is_window_open("title:Main")
+        assert not windows.is_window_open("title:Missing")
+        windows.assert_window_not_contains("auto_id:missing")
+        WaitingKeywords(self.ctx).wait_until_window_is_closed("title:Missing")
+        assert time.monotonic() - start < 1
+
+    def test_probe_timeout(self):
+        self.ctx.probe_timeout = 0.2
+        start = time.monotonic()
+        assert not WindowManagementKeywords(self.ctx).is_window_open("title:Missing")
+        assert 0.2 <= time.monotonic() - start < 1
@@ -0,0 +1,139 @@
+import pytest
+
+from faketree import BackendCounter, FakeApp, FakeContext, FakeWrapper, build_deep_window
+from pywinautoLibrary.locators import ElementFinder, SnapshotNode, take_snapshot
+from pywinautoLibrary.locators.snapshot import parse_snapshot_properties
+from pywinautoLibrary.locators.snapshotindex import literal_prefix
+
+
+class TestSnapshot:
+    """Test searching captured snapshots of the control tree."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_deep_window(self.counter, 3, 4)
+        self.finder = ElementFinder(FakeContext(FakeApp(self.window)), search_depth=None)
+
+    def test_captures_whole_subtree(self):
+        snapshot = take_snapshot(self.window)
+        assert len(snapshot) == 1 + 4 + 16 + 64
+        assert snapshot.root.window_text() == "Main"
+        assert [node.window_text() for node in snapshot.root.children()] == [
+            "Item 0", "Item 1", "Item 2", "Item 3"
+        ]
+        assert snapshot.root.children()[0].parent is snapshot.root
+
+    def test_locators_do_not_call_backend(self):
+        self.finder.take_snapshot()
+        self.counter.reset()
+        assert self.finder.find("auto_id:item_3_3_3").window_text() == "Item 3_3_3"
+        assert self.finder.find("text:Item 2_1").element_info.automation_id == "item_2_1"
+        assert len(self.finder.find("xpath://Button", first_only=False)) == 64
+        assert self.finder.find("item_1_2_3").is_enabled()
+        assert self.counter.calls == 0
+
+    def test_actions_use_live_element(self):
+        self.finder.take_snapshot()
+        node = self.finder.find("auto_id:item_0_1")
+        assert isinstance(node, SnapshotNode)
+        node.click()
+        assert node.wrapper.actions == ["click"]
+
+    def test_snapshot_is_immutable_until_refreshed(self):
+        self.finder.take_snapshot()
+        self.window.add(FakeWrapper(self.counter, name="Late", automation_id="late"))
+        assert self.finder.find("auto_id:late", required=False, timeout=0) is None
+        self.finder.refresh_snapshot()
+        assert self.finder.find("auto_id:late", timeout=0).window_text() == "Late"
+
+    def test_retries_take_new_snapshot(self):
+        self.finder.take_snapshot()
+        self.window.add(FakeWrapper(self.counter, name="Late", automation_id="late"))
+        assert self.finder.find("auto_id:late", timeout=1).window_text() == "Late"
+
+    def test_release_and_invalidate(self):
+        self.finder.take_snapshot()
+        assert self.finder.release_snapshot() is not None
+        assert self.finder.snapshot is None
+        self.finder.take_snapshot()
+        self.finder.invalidate("other")
+        assert self.finder.snapshot is None
+
+    def test_declared_properties(self):
+        assert parse_snapshot_properties("name, control_id") == ("name", "control_id", "handle")
+        with pytest.raises(ValueError):
+            parse_snapshot_properties("name, colour")
+        snapshot = take_snapshot(self.window, "name")
+        self.counter.reset()
+        assert snapshot.root.window_text() == "Main"
+        assert self.counter.calls == 0
+        # Properties outside the declared set are read from the live element
+        assert snapshot.root.element_info.control_type == "Window"
+        assert self.counter.calls == 1
+
+    def test_fingerprint(self):
+        first = take_snapshot(self.window, "name, control_type").fingerprint()
+        assert take_snapshot(self.window, "name, control_type").fingerprint() == first
+        self.window.children()[1].children()[0].element_info.set(name="Changed")
+        assert take_snapshot(self.window, "name, control_type").fingerprint() != first
+
+
+    def test_class_locator_matches_top_level_windows(self):
+        dialog = FakeWrapper(self.counter, name="Confirm", class_name="#32770", control_type="Window")
+        self.window.children()[1].add(FakeWrapper(self.counter, name="Inner", class_name="#32770"))
+        finder = ElementFinder(FakeContext(FakeApp(self.window, dialog)), search_depth=None)
+        assert finder.find("class:#32770") is dialog
+        finder.take_snapshot()
+        assert finder.find("class:#32770") is dialog
+        finder.release_snapshot()
+        finder.take_snapshot(self.window.children()[1])
+        assert finder.find("class:#32770").window_text() == "Inner"
+
+
+class TestSnapshotIndex:
+    """Test indexed lookups against element by element searches."""
+
+    LOCATORS = ["auto_id:item_2_1_3", "control_id:7", "class:Class1", "text:Item 1_",
+                "text:Item [23]_0", "item_3", "Item 0_2", "auto_id:missing"]
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_deep_window(self.counter, 3, 4)
+        self.window.children()[1].children()[2].element_info.set(control_id=7)
+        self.window.children()[3].element_info.set(control_id=7)
+
+    @pytest.mark.parametrize("depth", [None, 2])
+    @pytest.mark.parametrize("order", ["breadth_first", "depth_first"])
+    def test_matches_linear_search(self, depth, order):
+        finder = ElementFinder(FakeContext(FakeApp(self.window)), search_depth=depth, search_order=order)
+        finder.take_snapshot()
+        root = finder.snapshot.root
+        for locator in self.LOCATORS:
+            compiled = finder.compile(locator)
+            strategy = finder._strategies[compiled.strategy]
+            expected = [node.order for node in strategy(root, compiled)]
+            assert [node.order for node in finder._iter_matches(root, compiled)] == expected, locator
+
+    def test_tables_are_built_on_first_use(self):
+        finder = ElementFinder(FakeContext(FakeApp(self.window)), search_depth=None)
+        index = finder.take_snapshot().index
+        assert index.built == []
+        finder.find("auto_id:item_1")
+        assert index.built == ["automation_id"]
+        finder.find("Item 3_3")
+        assert sorted(index.built) == ["automation_id", "control_id", "name"]
+
+    def test_control_type_restriction(self):
+        finder = ElementFinder(FakeContext(FakeApp(self.window)), search_depth=None)
+        finder.take_snapshot()
+        assert len(finder.find("text:Item 1", first_only=False)) == 21
+        buttons = finder.find("text:Item 1", "Button", first_only=False)
+        assert len(buttons) == 16
+        assert {node.element_info.control_type for node in buttons} == {"Button"}
+
+    def test_literal_prefix(self):
+        assert literal_prefix("Save As") == "Save As"
+        assert literal_prefix("Item [23]_0") == "Item "
+        assert literal_prefix("Files?") == "File"
+        assert literal_prefix("a*") == ""
+        assert literal_prefix("Open|Save") == ""
@@ -0,0 +1,109 @@
+import pytest
+
+from faketree import BackendCounter, FakeApp, FakeContext, build_deep_window
+from pywinautoLibrary.locators import (
+    ElementFinder, follow_path, iter_descendant_paths, iter_descendants, parse_search_depth, parse_search_order
+)
+
+
+def names(elements):
+    return [element.element_info.name for element in elements]
+
+
+class TestIterDescendants:
+    """Test the depth-limited descendant search."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.root = build_deep_window(self.counter, depth=3, fanout=2)
+
+    def test_breadth_first(self):
+        assert names(iter_descendants(self.root, max_depth=2)) == [
+            "Item 0", "Item 1", "Item 0_0", "Item 0_1", "Item 1_0", "Item 1_1"]
+
+    def test_depth_first(self):
+        assert names(iter_descendants(self.root, max_depth=2, order="depth_first")) == [
+            "Item 0", "Item 0_0", "Item 0_1", "Item 1", "Item 1_0", "Item 1_1"]
+
+    def test_depth_limit(self):
+        assert len(list(iter_descendants(self.root, max_depth=1))) == 2
+        assert len(list(iter_descendants(self.root, max_depth=None))) == 14
+
+    @pytest.mark.parametrize("order", ["breadth_first", "depth_first"])
+    def test_paths(self, order):
+        pairs = list(iter_descendant_paths(self.root, max_depth=None, order=order))
+        assert [element for _, element in pairs] == list(iter_descendants(self.root, None, order))
+        for path, element in pairs:
+            assert element.element_info.name == "Item " + "_".join(map(str, path))
+
+    @pytest.mark.parametrize("order", ["breadth_first", "depth_first"])
+    @pytest.mark.parametrize("depth", [1, 2, 3, None])
+    def test_control_type(self, order, depth):
+        self.root.children()[1].element_info.set(control_type="Button")
+        everything = iter_descendants(self.root, depth, order)
+        expected = [e for e in everything if e.element_info._props["control_type"] == "Button"]
+        assert list(iter_descendants(self.root, depth, order, "Button")) == expected
+        pairs = list(iter_descendant_paths(self.root, depth, order, "Button"))
+        assert [element for _, element in pairs] == expected
+        for path, element in pairs:
+            assert follow_path(self.root, path, "Button") is element
+
+    def test_control_type_is_pushed_to_backend_at_max_depth(self):
+        self.counter.reset()
+        assert list(iter_descendants(self.root, 2, control_type="Button")) == []
+        # Children of the two panes are fetched with the criteria and none match
+        assert self.counter.calls == 3 + 2 + 2
+
+    def test_stopping_early_stops_traversal(self):
+        next(iter_descendants(self.root, max_depth=None))
+        assert self.counter.calls == 3
+
+
+class TestSearchSettings:
+    """Test search depth and order import argument conversion."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (1, 1), ("3", 3), (0, None), ("0", None), (None, None), ("None", None), ("unlimited", None),
+    ])
+    def test_search_depth(self, value, expected):
+        assert parse_search_depth(value) == expected
+
+    def test_invalid_search_depth(self):
+        with pytest.raises(ValueError):
+            parse_search_depth(-1)
+
+    @pytest.mark.parametrize("value, expected", [
+        ("breadth_first", "breadth_first"), ("Depth First", "depth_first"), ("DFS", "depth_first"),
+    ])
+    def test_search_order(self, value, expected):
+        assert parse_search_order(value) == expected
+
+    def test_invalid_search_order(self):
+        with pytest.raises(ValueError):
+            parse_search_order("random")
+
+
+class TestDescendantStrategies:
+    """Test locator strategies searching below direct children."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.app = FakeApp(build_deep_window(self.counter, depth=3, fanout=3))
+
+    def test_direct_children_only_by_default(self):
+        finder = ElementFinder(FakeContext(self.app))
+        assert finder.find("auto_id:item_0_1_2", required=False, timeout=0) is None
+
+    @pytest.mark.parametrize("order", ["breadth_first", "depth_first"])
+    def test_descendants_within_depth(self, order):
+        finder = ElementFinder(FakeContext(self.app), search_depth=None, search_order=order)
+        assert finder.find("auto_id:item_0_1_2").window_text() == "Item 0_1_2"
+        assert finder.find("text:Item 2_2", first_only=False) != []
+        assert len(finder.find("text:Item 2_", first_only=False)) == 12
+
+    def test_iter_elements_streams(self):
+        finder = ElementFinder(FakeContext(self.app), search_depth=None, search_order="depth_first")
+        self.counter.reset()
+        first = next(finder.iter_elements("text:Item"))
+        assert self.counter.calls == 5
+        assert first.window_text() == "Item 0"
@@ -0,0 +1,389 @@
+import threading
+import time
+
+import pytest
+
+from faketree import BackendCounter, FakeApp, FakeContext, FakeWrapper, build_wide_window
+from pywinautoLibrary.errors import ElementNotFound, ElementNotVisible, WaitTimeout, WindowNotFound
+from pywinautoLibrary.keywords import ControlElementKeywords, WaitingKeywords
+from pywinautoLibrary.locators import ElementFinder
+from pywinautoLibrary.utils import BackoffPollScheduler, PollScheduler
+from pywinautoLibrary.waits import (
+    AllOf, AnyOf, ElementCount, ElementEnabled, ElementExists, ElementPropertyEquals,
+    ElementTextContains, ElementVisible, EventSource, Not, UIAEventSource, Wait, WaitEngine, WindowStable,
+    parse_condition,
+)
+
+from test_polling import FakeClock
+
+
+class FailingEventSource(EventSource):
+
+    def start(self, root, timeout=None):
+        return False
+
+
+class RecordingEventSource(EventSource):
+
+    def __init__(self):
+        super().__init__()
+        self.roots = []
+        self.timeouts = []
+
+    def start(self, root, timeout=None):
+        self.roots.append(root)
+        self.timeouts.append(timeout)
+        return True
+
+
+class SlowEventSource(UIAEventSource):
+    """Event source whose subscription completes only after `release`."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.unregistered = threading.Event()
+
+    def _element(self, root):
+        return root
+
+    def _run(self, element):
+        self.release.wait(5)
+        self._subscribed = True
+        self._ready.set()
+        self._stopped.wait()
+        self.unregistered.set()
+
+
+class TestWaitEngine:
+    """Test event-driven and polling waits."""
+
+    def test_polls_without_event_source(self):
+        clock = FakeClock()
+        engine = WaitEngine(BackoffPollScheduler(), clock=clock, sleep=clock.sleep)
+        assert engine.until(lambda: clock.now >= 0.03, 1.0) is True
+        assert clock.sleeps == [0.005, 0.01, 0.02]
+        assert engine.evaluations == 4
+
+    def test_respects_deadline(self):
+        clock = FakeClock()
+        engine = WaitEngine(PollScheduler(0.3), clock=clock, sleep=clock.sleep)
+        assert engine.until(lambda: False, 0.5) is None
+        assert clock.sleeps == [0.3, 0.2]
+
+    def test_exceptions_count_as_false(self):
+        clock = FakeClock()
+        engine = WaitEngine(PollScheduler(), clock=clock, sleep=clock.sleep)
+        assert engine.until(lambda: 1 / 0, 0.2) is None
+
+    def test_wakes_up_on_event(self):
+        source = EventSource()
+        state = {"ready": False}
+
+        def change():
+            time.sleep(0.05)
+            state["ready"] = True
+            source.notify()
+
+        engine = WaitEngine(PollScheduler(10), source, fallback_interval=10)
+        threading.Thread(target=change).start()
+        start = time.monotonic()
+        assert engine.until(lambda: state["ready"], 5, root=object())
+        assert time.monotonic() - start < 2
+        assert engine.evaluations == 3
+        assert source.events == 1
+
+    def test_event_wait_respects_deadline(self):
+        engine = WaitEngine(PollScheduler(10), EventSource(), fallback_interval=10)
+        start = time.monotonic()
+        assert engine.until(lambda: False, 0.1, root=object()) is None
+        assert time.monotonic() - start == pytest.approx(0.1, abs=0.5)
+        assert engine.evaluations == 3
+
+    def test_holding_condition_does_not_subscribe(self):
+        source = RecordingEventSource()
+        engine = WaitEngine(PollScheduler(10), source, fallback_interval=10)
+        assert engine.until(lambda: "ready", 5, root=object()) == "ready"
+        assert source.roots == []
+        assert engine.evaluations == 1
+
+    def test_subscribing_is_bounded_by_deadline(self):
+        clock = FakeClock()
+        source = RecordingEventSource()
+        engine = WaitEngine(PollScheduler(0.1), source, clock=clock, sleep=clock.sleep)
+
+        def slow_condition():
+            clock.now += 0.2
+            return False
+
+        engine.until(slow_condition, 0.5, root=object())
+        assert source.timeouts == [pytest.approx(0.3)]
+
+    def test_late_subscription_is_removed(self):
+        source = SlowEventSource()
+        start = time.monotonic()
+        assert source.start(object(), 0.05) is False
+        assert time.monotonic() - start < 2
+        source.release.set()
+        assert source.unregistered.wait(2)
+
+    def test_falls_back_to_polling_when_subscribing_fails(self):
+        clock = FakeClock()
+        engine = WaitEngine(
+            PollScheduler(0.1), FailingEventSource(), clock=clock, sleep=clock.sleep
+        )
+        assert engine.until(lambda: False, 0.3, root=object()) is None
+        assert clock.sleeps == [0.1, 0.1, 0.1]
+
+
+class TestConditions:
+    """Test the conditions of the wait engine."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_wide_window(self.counter, 10)
+        self.finder = ElementFinder(FakeContext(FakeApp(self.window)))
+        self.window.children()[2].element_info.set(visible=False, enabled=False)
+
+    @pytest.mark.parametrize("condition, holds", [
+        (ElementExists("field1"), True),
+        (ElementExists("missing"), False),
+        (ElementVisible("field1"), True),
+        (ElementVisible("field2"), False),
+        (~ElementVisible("field2"), True),
+        (~ElementVisible("missing"), True),
+        (ElementVisible("field2", visible=False), True),
+        (ElementVisible("missing", visible=False), False),
+        (ElementEnabled("field2", enabled=False), True),
+        (ElementTextContains("field3", "ld 3"), True),
+        (~ElementTextContains("field3", "ld 3"), False),
+        (ElementCount("text:Field", 10), True),
+        (ElementCount("text:Field", 10, "Edit"), False),
+        (ElementCount("text:Field", 5, "Edit"), True),
+        (ElementPropertyEquals("field4", "control_id", "1004"), True),
+        (ElementPropertyEquals("field4", "control_type", "Edit"), False),
+    ])
+    def test_evaluate(self, condition, holds):
+        assert bool(condition.evaluate(self.finder)) is holds
+        assert bool((~condition).evaluate(self.finder)) is not holds
+
+    def test_failures(self):
+        missing, hidden = ElementVisible("missing"), ElementVisible("field2")
+        for condition in (missing, hidden):
+            condition.evaluate(self.finder)
+        assert isinstance(missing.failure(), ElementNotFound)
+        assert isinstance(hidden.failure(), ElementNotVisible)
+        assert isinstance((~ElementExists("field1")).failure(), WaitTimeout)
+        count = ElementCount("text:Field", 3)
+        count.evaluate(self.finder)
+        assert "found more than 3" in str(count.failure())
+
+    def test_single_deadline(self):
+        clock = FakeClock()
+        wait = Wait(self.finder, PollScheduler(0.3), clock=clock, sleep=clock.sleep)
+        with pytest.raises(ElementNotVisible):
+            wait.until(ElementVisible("field2"), 1.0)
+        assert sum(clock.sleeps) == pytest.approx(1.0)
+        assert wait.evaluations == 5
+
+
+class TestWaitKeywords:
+    """Test that wait keywords fail consistently within their timeout."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_wide_window(self.counter, 10)
+        self.ctx = FakeContext(FakeApp(self.window), timeout=5.0)
+        self.ctx._element_finder = ElementFinder(self.ctx)
+        self.ctx.event_source_factory = None
+        self.waits = WaitingKeywords(self.ctx)
+        self.window.children()[2].element_info.set(visible=False)
+
+    @pytest.mark.parametrize("keyword, args, error", [
+        ("wait_until_element_is_visible", ("field2",), ElementNotVisible),
+        ("wait_until_element_is_visible", ("missing",), ElementNotFound),
+        ("wait_until_element_is_not_visible", ("field1",), WaitTimeout),
+        ("wait_until_element_is_disabled", ("field1",), WaitTimeout),
+        ("wait_until_element_contains_text", ("field1", "nope"), WaitTimeout),
+        ("wait_until_element_does_not_contain_text", ("field1", "Field"), WaitTimeout),
+        ("wait_until_element_count_is", ("text:Field", 3), WaitTimeout),
+        ("wait_until_element_property_is", ("field1", "name", "Other"), WaitTimeout),
+        ("wait_until_window_is_opened", ("title:Missing",), WindowNotFound),
+        ("wait_until_window_is_closed", ("title:Main",), WaitTimeout),
+    ])
+    def test_fails_within_timeout(self, keyword, args, error):
+        start = time.monotonic()
+        with pytest.raises(error):
+            getattr(self.waits, keyword)(*args, timeout=0.2)
+        assert time.monotonic() - start < 1
+
+    def test_holding_conditions_return_immediately(self):
+        start = time.monotonic()
+        self.waits.wait_until_element_is_visible("field1")
+        self.waits.wait_until_element_is_not_visible("field2")
+        self.waits.wait_until_element_count_is("text:Field", 10)
+        self.waits.wait_until_element_property_is("field4", "control_id", 1004)
+        self.waits.wait_until_window_is_closed("title:Missing")
+        ControlElementKeywords(self.ctx).wait_for_element_enabled("field3")
+        assert time.monotonic() - start < 1
+
+    def test_window_waits_listen_to_windows_opening(self):
+        window_sources, sources = [], []
+        self.ctx.event_source_factory = lambda root: sources.append(RecordingEventSource()) or sources[-1]
+        self.ctx._element_finder = ElementFinder(
+            self.ctx, window_events=lambda app: window_sources.append(RecordingEventSource()) or window_sources[-1]
+        )
+
+        def open_dialog():
+            time.sleep(0.1)
+            self.ctx.app._windows.append(FakeWrapper(self.counter, name="Dialog", control_type="Window"))
+            for source in window_sources:
+                source.notify()
+
+        threading.Thread(target=open_dialog).start()
+        start = time.monotonic()
+        self.waits.wait_until_window_is_opened("title:Dialog", timeout=2)
+        assert time.monotonic() - start < 0.5
+        assert sources == []
+        assert [source.roots for source in window_sources] == [[self.ctx.app], [None]]
+
+
+class TestCombinedConditions:
+    """Test waiting for several conditions at once."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_wide_window(self.counter, 10)
+        self.ctx = FakeContext(FakeApp(self.window), timeout=5.0)
+        self.ctx._element_finder = ElementFinder(self.ctx)
+        self.ctx.event_source_factory = None
+        self.waits = WaitingKeywords(self.ctx)
+
+    @pytest.mark.parametrize("text, kind, describe", [
+        ("title:Error", ElementExists, "element 'title:Error' exists"),
+        ("visible: auto_id:Ok", ElementVisible, "element 'auto_id:Ok' is visible"),
+        ("hidden : Spinner", ElementVisible, "element 'Spinner' is hidden"),
+        ("not exists: Spinner", Not, "not element 'Spinner' exists"),
+        ("disabled: Save", ElementEnabled, "element 'Save' is disabled"),
+        ("contains Saved: auto_id:Status", ElementTextContains, "element 'auto_id:Status' contains text 'Saved'"),
+        ("count 3: text:Row", ElementCount, "3 elements match 'text:Row'"),
+        ("property name = A b: field1", ElementPropertyEquals, "element 'field1' has name 'A b'"),
+        ("Save as: file", ElementExists, "element 'Save as: file' exists"),
+    ])
+    def test_parse_condition(self, text, kind, describe):
+        condition = parse_condition(text)
+        assert isinstance(condition, kind)
+        assert condition.describe() == describe
+
+    def test_conditions_share_one_snapshot(self):
+        finder = self.ctx._element_finder
+        self.counter.reset()
+        finder.take_snapshot()
+        finder.release_snapshot()
+        capture = self.counter.calls
+        condition = AnyOf(ElementExists("missing"), ElementVisible("field5"), ElementExists("field6"))
+        self.counter.reset()
+        index, element = condition.evaluate(finder)
+        assert index == 1 and element.window_text() == "Field 5"
+        assert self.counter.calls == capture
+        assert finder.snapshot is None
+
+    def test_snapshot_only_for_conditions_searching_the_window(self):
+        finder = self.ctx._element_finder
+        snapshots = []
+        take_snapshot = finder.take_snapshot
+        finder.take_snapshot = lambda: snapshots.append(1) or take_snapshot()
+        assert AnyOf(ElementExists("title:Missing"), ElementExists("class:MainWindow")).evaluate(finder)
+        assert AllOf(ElementExists("title:Main"), ElementExists("field1")).evaluate(finder)
+        assert snapshots == []
+        assert AllOf(ElementExists("title:Main"), ElementExists("field1"), ElementExists("field2")).evaluate(finder)
+        assert snapshots == [1]
+
+    def test_any_returns_condition_that_fired(self):
+        def open_dialog():
+            time.sleep(0.1)
+            self.window.add(FakeWrapper(self.counter, name="Error", automation_id="error"))
+
+        threading.Thread(target=open_dialog).start()
+        start = time.monotonic()
+        fired = self.waits.wait_until_any_condition("auto_id:success", "visible: auto_id:error", timeout=2)
+        assert fired == "visible: auto_id:error"
+        assert time.monotonic() - start < 1
+
+    def test_all_conditions(self):
+        self.waits.wait_until_all_conditions("field1", "enabled: field2", "not exists: missing")
+        start = time.monotonic()
+        with pytest.raises(WaitTimeout, match="Not holding: element 'missing' exists"):
+            self.waits.wait_until_all_conditions("field1", "missing", timeout=0.2)
+        with pytest.raises(WaitTimeout, match="None of the conditions"):
+            self.waits.wait_until_any_condition("missing", "not exists: field1", timeout=0.2)
+        assert time.monotonic() - start < 1
+
+    def test_existing_snapshot_is_kept(self):
+        finder = self.ctx._element_finder
+        snapshot = finder.take_snapshot()
+        assert AllOf(ElementExists("field1"), ElementExists("field2")).evaluate(finder)
+        assert finder.snapshot is snapshot
+
+
+class TestWindowStable:
+    """Test waiting until the window stops changing."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.window = build_wide_window(self.counter, 10)
+        self.ctx = FakeContext(FakeApp(self.window), timeout=5.0)
+        self.ctx._element_finder = ElementFinder(self.ctx)
+        self.ctx.event_source_factory = None
+        self.waits = WaitingKeywords(self.ctx)
+
+    def change(self, times, interval):
+        field = self.window.children()[3]
+        for index in range(times):
+            time.sleep(interval)
+            field.element_info.set(name=f"Loading {index}")
+
+    def test_quiet_period_restarts_on_change(self):
+        clock = FakeClock()
+        finder = self.ctx._element_finder
+        condition = WindowStable(0.5, clock=clock)
+        assert not condition.evaluate(finder)
+        clock.sleep(0.4)
+        self.window.children()[2].element_info.set(name="Changed")
+        assert not condition.evaluate(finder)
+        clock.sleep(0.4)
+        assert not condition.evaluate(finder)
+        clock.sleep(0.1)
+        assert condition.evaluate(finder)
+        assert condition.changes == 1
+
+    def test_structure_changes_count(self):
+        finder = self.ctx._element_finder
+        condition = WindowStable(10)
+        condition.evaluate(finder)
+        self.window.add(FakeWrapper(self.counter, name="Field 3"))
+        condition.evaluate(finder)
+        assert condition.changes == 1
+
+    def test_returns_after_quiet_period(self):
+        thread = threading.Thread(target=self.change, args=(5, 0.03))
+        thread.start()
+        start = time.monotonic()
+        self.waits.wait_until_window_is_stable("100ms")
+        elapsed = time.monotonic() - start
+        thread.join()
+        assert 0.2 < elapsed < 1.5
+        assert self.window.children()[3].element_info._props["name"] == "Loading 4"
+
+    def test_fails_when_window_keeps_changing(self):
+        thread = threading.Thread(target=self.change, args=(30, 0.02))
+        thread.start()
+        with pytest.raises(WaitTimeout, match="changed"):
+            self.waits.wait_until_window_is_stable("200ms", timeout=0.3)
+        thread.join()
+
+    def test_watched_element(self):
+        self.window.children()[3].add(FakeWrapper(self.counter, name="Child"))
+        self.waits.wait_until_window_is_stable(0, locator="field3")
+        with pytest.raises(ElementNotFound):
+            self.waits.wait_until_window_is_stable(0, locator="missing", timeout=0.1)
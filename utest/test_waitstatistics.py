@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from faketree import BackendCounter, FakeApp, FakeContext, build_wide_window
+from pywinautoLibrary.errors import WaitTimeout
+from pywinautoLibrary.keywords import WaitingKeywords
+from pywinautoLibrary.locators import ElementFinder
+from pywinautoLibrary.utils import LibraryListener, PollScheduler, WaitStatistics
+
+
+class TestWaitStatistics:
+    """Test aggregating search and wait statistics."""
+
+    def test_aggregates_per_scope(self):
+        statistics = WaitStatistics()
+        statistics.record("find", "auto_id:a", 1, 0.01, 0.01, True)
+        statistics.start_suite("Top")
+        statistics.start_suite("Top.Child")
+        statistics.start_test("Top.Child.Test")
+        statistics.record("find", "auto_id:a", 3, 0.03, 0.2, True)
+        statistics.record("wait", "element 'b' is visible", 5, 0.05, 1.0, False)
+        statistics.end_test("Top.Child.Test")
+        statistics.end_suite("Top.Child")
+        statistics.record("find", "auto_id:a", 1, 0.01, 0.01, True)
+
+        total = statistics.get()
+        assert [entry["target"] for entry in total] == ["element 'b' is visible", "auto_id:a"]
+        find = total[1]
+        assert find["calls"] == 3
+        assert find["iterations"] == 5
+        assert find["matches"] == 3
+        assert find["max_time_to_match"] == 0.2
+        assert total[0]["timeouts"] == 1
+        assert total[0]["sleep_time"] == 0.95
+        assert total[0]["average_time_to_match"] is None
+        assert statistics.get("suite")[1]["calls"] == 2
+        assert statistics.get("test") == []
+        assert statistics.get(limit=1) == total[:1]
+        data = statistics.to_dict()
+        assert set(data["suites"]) == {"Top", "Top.Child"}
+        assert data["suites"]["Top.Child"][1]["calls"] == 1
+        assert data["tests"]["Top.Child.Test"][0]["iterations"] == 5
+
+    def test_invalid_scope(self):
+        with pytest.raises(ValueError):
+            WaitStatistics().get("keyword")
+
+    def test_save(self, tmp_path):
+        path = tmp_path / "output" / "statistics.json"
+        statistics = WaitStatistics(lambda: str(path))
+        statistics.save()
+        assert not path.exists()
+        statistics.record("find", "auto_id:a", 2, 0.01, 0.02, True)
+        statistics.save()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["version"] == WaitStatistics.VERSION
+        assert data["total"][0]["target"] == "auto_id:a"
+
+    def test_listener_notifies_scopes(self):
+        statistics = WaitStatistics()
+        listener = LibraryListener()
+        listener.add_scope_listener(statistics)
+        listener.start_suite("Suite", {"longname": "Root.Suite"})
+        listener.start_test("Test", {"longname": "Root.Suite.Test"})
+        statistics.record("find", "x", 1, 0.0, 0.0, True)
+        listener.end_test("Test", {"longname": "Root.Suite.Test"})
+        listener.end_suite("Suite", {"longname": "Root.Suite"})
+        assert list(statistics.tests) == ["Root.Suite.Test"]
+        assert list(statistics.suites) == ["Root.Suite"]
+        assert statistics.get("suite") == []
+
+
+class TestInstrumentation:
+    """Test recording searches and waits."""
+
+    def setup_method(self):
+        self.window = build_wide_window(BackendCounter(), 5)
+        self.statistics = WaitStatistics()
+        self.ctx = FakeContext(FakeApp(self.window), timeout=0.1, poll_scheduler=PollScheduler(0.02))
+        self.ctx._element_finder = ElementFinder(self.ctx, statistics=self.statistics)
+        self.ctx.event_source_factory = None
+
+    def test_find(self):
+        finder = self.ctx._element_finder
+        assert finder.find("auto_id:field2") is not None
+        assert finder.find("auto_id:missing", required=False) is None
+        missing, found = self.statistics.get()
+        assert missing["target"] == "auto_id:missing"
+        assert missing["timeouts"] == 1
+        assert missing["iterations"] > 2
+        assert missing["sleep_time"] > missing["query_time"]
+        assert found["target"] == "auto_id:field2"
+        assert (found["iterations"], found["matches"]) == (1, 1)
+
+    def test_find_many(self):
+        self.ctx._element_finder.find_many(["field1", "field3"])
+        entry, = self.statistics.get()
+        assert entry["operation"] == "find_many"
+        assert entry["target"] == "field1, field3"
+        assert entry["matches"] == 1
+
+    def test_wait_keywords(self):
+        waits = WaitingKeywords(self.ctx)
+        waits.wait_until_element_is_enabled("field1")
+        with pytest.raises(WaitTimeout):
+            waits.wait_until_window_is_closed("title:Main")
+        entries = waits.get_wait_statistics()
+        assert [entry["operation"] for entry in entries] == ["wait", "wait"]
+        assert entries[0]["target"] == "not element 'title:Main' exists"
+        assert entries[0]["timeouts"] == 1
+        assert entries[1]["matches"] == 1
+        assert len(waits.get_wait_statistics(limit=1)) == 1
+
+    def test_disabled(self):
+        self.ctx._element_finder = ElementFinder(self.ctx)
+        assert WaitingKeywords(self.ctx).get_wait_statistics() == []
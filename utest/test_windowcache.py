@@ -0,0 +1,101 @@
+from faketree import BackendCounter, FakeApp, FakeContext, FakeWrapper
+from pywinautoLibrary.locators import ElementFinder, WindowCache
+from pywinautoLibrary.waits import EventSource
+
+from test_polling import FakeClock
+
+
+class CountingApp(FakeApp):
+
+    def __init__(self, *windows):
+        super().__init__(*windows)
+        self.enumerations = 0
+        self.top_windows = 0
+
+    def top_window(self):
+        self.top_windows += 1
+        return super().top_window()
+
+    def windows(self, title_re=None, class_name=None):
+        self.enumerations += 1
+        return super().windows(title_re, class_name)
+
+
+def make_window(counter, name, class_name="Dialog"):
+    return FakeWrapper(counter, name=name, control_type="Window", class_name=class_name)
+
+
+class TestWindowCache:
+    """Test caching of top-level windows."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.app = CountingApp(make_window(self.counter, "Main", "MainWindow"),
+                               make_window(self.counter, "Save As"))
+        self.clock = FakeClock()
+
+    def test_windows_are_reused_until_ttl_expires(self):
+        cache = WindowCache(0.5, clock=self.clock)
+        assert [entry.title for entry in cache.windows(self.app)] == ["Main", "Save As"]
+        self.clock.now = 0.4
+        cache.windows(self.app)
+        assert self.app.enumerations == 1
+        self.clock.now = 0.5
+        cache.windows(self.app)
+        assert self.app.enumerations == 2
+        assert cache.statistics["hits"] == 1
+
+    def test_zero_ttl_disables_cache(self):
+        cache = WindowCache(0, clock=self.clock)
+        cache.windows(self.app)
+        cache.windows(self.app)
+        assert self.app.enumerations == 2
+
+    def test_notification_refreshes_windows(self):
+        events = EventSource()
+        cache = WindowCache(60, lambda app: events, clock=self.clock)
+        cache.windows(self.app)
+        self.app._windows.append(make_window(self.counter, "Print"))
+        assert len(cache.windows(self.app)) == 2
+        events.notify()
+        assert len(cache.windows(self.app)) == 3
+        assert cache.statistics["notifications"] == 1
+
+    def test_other_application_is_enumerated(self):
+        cache = WindowCache(60, clock=self.clock)
+        cache.windows(self.app)
+        other = CountingApp(make_window(self.counter, "Other"))
+        assert [entry.title for entry in cache.windows(other)] == ["Other"]
+
+
+class TestWindowLocators:
+    """Test title and class locators using the window cache."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.app = CountingApp(make_window(self.counter, "Main", "MainWindow"),
+                               make_window(self.counter, "Save As"),
+                               make_window(self.counter, "Save Changes"))
+        self.finder = ElementFinder(FakeContext(self.app), element_cache=False, window_cache_ttl=60)
+
+    def test_title_locators_enumerate_once(self):
+        assert self.finder.find("title:Save C").window_text() == "Save Changes"
+        assert len(self.finder.find("title:Save", first_only=False)) == 2
+        assert self.finder.find("title:Changes").window_text() == "Save Changes"
+        assert self.finder.find("title:Missing", required=False, timeout=0) is None
+        assert self.app.enumerations == 1
+
+    def test_class_locator_resolves_top_window_once_per_attempt(self):
+        windows = self.finder.find("class:Dialog", first_only=False)
+        assert [window.window_text() for window in windows] == ["Save As", "Save Changes"]
+        assert self.app.top_windows == 1
+        self.finder.find("class:Missing", required=False, timeout=0.05)
+        attempts = self.app.top_windows - 1
+        assert attempts > 1
+        assert self.app.enumerations == 1
+
+    def test_invalidate_drops_windows(self):
+        self.finder.find("title:Main")
+        self.finder.invalidate()
+        self.finder.find("title:Main")
+        assert self.app.enumerations == 2
@@ -0,0 +1,88 @@
+import pytest
+
+from faketree import BackendCounter, FakeWrapper
+from pywinautoLibrary.errors import InvalidLocator
+from pywinautoLibrary.locators.xpath import XPath
+
+
+def build_tree(counter):
+    def node(control_type, name="", auto_id="", class_name="", children=()):
+        return FakeWrapper(counter, children, name=name, automation_id=auto_id,
+                           class_name=class_name, control_type=control_type)
+    return node("Window", "Editor", "main", "MainWindow", [
+        node("Pane", "Toolbar", "toolbar", children=[
+            node("Button", "Open", "open"),
+            node("Button", "Save", "save"),
+            node("Button", "Save As", "saveas"),
+        ]),
+        node("Pane", "Form", "form", children=[
+            node("Edit", "First name", "first"),
+            node("Edit", "Last name", "last", "TextBox"),
+            node("Pane", "Nested", children=[
+                node("Button", "OK", "ok"),
+                node("Button", "Cancel", "cancel"),
+            ]),
+        ]),
+    ])
+
+
+def ids(elements):
+    return [element.element_info.automation_id for element in elements]
+
+
+class TestXPath:
+    """Test XPath evaluation over an in-memory control tree."""
+
+    def setup_method(self):
+        self.counter = BackendCounter()
+        self.root = build_tree(self.counter)
+
+    @pytest.mark.parametrize("expression, expected", [
+        ("/Window", ["main"]),
+        ("/Window/Pane/Button", ["open", "save", "saveas"]),
+        ("Pane/Edit", ["first", "last"]),
+        ("//Button", ["open", "save", "saveas", "ok", "cancel"]),
+        ("//Pane[@AutomationId='form']//Button", ["ok", "cancel"]),
+        ("//Button[2]", ["save", "cancel"]),
+        ("//Button[starts-with(@Name, 'Save')]", ["save", "saveas"]),
+        ("//Button[starts-with(@Name, 'Save')][2]", ["saveas"]),
+        ("//*[contains(@Name, 'name')]", ["first", "last"]),
+        ("//*[@ClassName='TextBox' or @Name='OK']", ["last", "ok"]),
+        ("//Edit[not(@ClassName)]", ["first"]),
+        ("//*[@ControlType='Edit' and @Name!='First name']", ["last"]),
+        ("//Pane/*[3]", ["saveas", ""]),
+        ("//Button[@Name='Missing']", []),
+    ])
+    def test_find_all(self, expression, expected):
+        assert ids(XPath(expression).find_all(self.root)) == expected
+
+    def test_nested_match_comes_before_later_sibling(self):
+        root = FakeWrapper(self.counter, [
+            FakeWrapper(self.counter, [
+                FakeWrapper(self.counter, automation_id="b1", control_type="Button"),
+            ], control_type="Pane"),
+            FakeWrapper(self.counter, automation_id="b2", control_type="Button"),
+        ], control_type="Window")
+        assert ids(XPath("//Button").iter(root)) == ["b1", "b2"]
+        assert ids(XPath("//Button[1]").find_all(root)) == ["b1", "b2"]
+        assert XPath("//Button").find(root).element_info.automation_id == "b1"
+
+    def test_nested_descendant_steps_do_not_duplicate(self):
+        assert ids(XPath("//Pane//Button").find_all(self.root)) == [
+            "open", "save", "saveas", "ok", "cancel"]
+
+    def test_find_stops_at_first_match(self):
+        xpath = XPath("//Button")
+        xpath.find_all(self.root)
+        full = self.counter.calls
+        self.counter.reset()
+        assert xpath.find(self.root).element_info.automation_id == "open"
+        assert self.counter.calls < full / 2
+
+    @pytest.mark.parametrize("expression", [
+        "", "//", "//Button[", "//Button[@Foo='x']", "//Button[last()]",
+        "//Button[0]", "//Button[@Name=]", "//Button]",
+    ])
+    def test_invalid_expression(self, expression):
+        with pytest.raises(InvalidLocator):
+            XPath(expression)